@@ -6,24 +6,40 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.const import Platform
+from homeassistant.helpers import config_validation as cv
 
+from .const import CONF_TSO, DEFAULT_TSO, DOMAIN
 from .coordinator import NettleieCoordinator
+from .services import async_setup_services
+from .tso import get_tso
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 type StromkalkulatorConfigEntry = ConfigEntry[NettleieCoordinator]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Strømkalkulator services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: StromkalkulatorConfigEntry) -> bool:
     """Set up Nettleie from a config entry."""
-    coordinator: NettleieCoordinator = NettleieCoordinator(hass, entry)
+    # Bare dette nettselskapet leses fra katalogen (ukjent id: standard nettselskap)
+    tso = await hass.async_add_executor_job(get_tso, entry.data.get(CONF_TSO, DEFAULT_TSO), DEFAULT_TSO)
+    coordinator: NettleieCoordinator = NettleieCoordinator(hass, entry, tso)
     await coordinator.async_config_entry_first_refresh()
+    coordinator.async_start_event_ingestion()
 
     entry.runtime_data = coordinator
 
@@ -34,6 +50,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: StromkalkulatorConfigEnt
 
 async def async_unload_entry(hass: HomeAssistant, entry: StromkalkulatorConfigEntry) -> bool:
     """Unload a config entry."""
+    # Write any debounced changes before the coordinator goes away
+    await entry.runtime_data.async_flush_stored_data()
+
     unload_ok: bool = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.async_close_archive()
 
     return unload_ok
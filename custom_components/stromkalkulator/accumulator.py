@@ -0,0 +1,505 @@
+"""Energy and peak accumulation for Strømkalkulator."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+MAX_DAYS_IN_MONTH: int = 31
+SETTLEMENT_RESOLUTIONS: tuple[int, ...] = (60, 15)
+# How the energy between two power samples is estimated:
+# left = previous reading held, right = new reading, trapezoid = average of both
+INTEGRATION_METHODS: tuple[str, ...] = ("left", "right", "trapezoid")
+
+
+def _utc(dt: datetime) -> datetime:
+    """The instant a timestamp refers to.
+
+    Naive timestamps are local wall clock time. In the hour repeated when
+    daylight saving time ends, ``fold`` tells the two apart (datetime.now()
+    sets it), so ordering and elapsed time stay right across the change.
+    """
+    return dt.astimezone(UTC)
+
+
+def _local(instant: datetime) -> datetime:
+    """Naive local wall clock time for an instant, with fold set in the repeated hour."""
+    local = instant.astimezone().replace(tzinfo=None)
+    if local.astimezone(UTC) != instant:
+        local = local.replace(fold=1)
+    return local
+
+
+class TopDaysTracker:
+    """Keep the N days with the highest peak, updated incrementally.
+
+    Each update is a short scan over at most N entries (N is 3 for almost all
+    grid companies), so there is no per-tick sorting. The ``top`` dict is only
+    rebuilt when the ranking actually changes.
+    """
+
+    n: int
+
+    def __init__(self, n: int = 3) -> None:
+        """Initialize the tracker."""
+        if n < 1:
+            raise ValueError(f"Number of top days must be at least 1, got {n}")
+        self.n = n
+        self._days: list[str] = []
+        self._values: list[float] = []
+        self._top: dict[str, float] = {}
+
+    @property
+    def top(self) -> dict[str, float]:
+        """Top days as {date_str: peak_kw}, highest first. Do not mutate."""
+        return self._top
+
+    @property
+    def average(self) -> float:
+        """Average peak of the tracked days (0.0 if none)."""
+        if not self._values:
+            return 0.0
+        return sum(self._values) / len(self._values)
+
+    def update(self, day: str, value: float) -> bool:
+        """Register a (possibly improved) peak for a day. Returns True if the top changed."""
+        if day in self._days:
+            # Same day improves: only ever moves up in the ranking
+            i = self._days.index(day)
+            if value <= self._values[i]:
+                return False
+            del self._days[i]
+            del self._values[i]
+        elif len(self._values) >= self.n and value <= self._values[-1]:
+            return False
+
+        i = 0
+        while i < len(self._values) and self._values[i] >= value:
+            i += 1
+        self._days.insert(i, day)
+        self._values.insert(i, value)
+        if len(self._values) > self.n:
+            self._days.pop()
+            self._values.pop()
+        self._top = dict(zip(self._days, self._values, strict=True))
+        return True
+
+    def max_allowed(self, day: str, threshold: float) -> float:
+        """Highest peak ``day`` can reach while the average stays at or below ``threshold``.
+
+        The day's new peak replaces its own entry (or the lowest one once N days
+        are tracked), so the limit is ``threshold * count - sum(kept days)``.
+        """
+        others = [value for tracked, value in zip(self._days, self._values, strict=True) if tracked != day]
+        # Values are kept highest first, so the days that stay are the first N - 1
+        kept = others[: self.n - 1]
+        return threshold * (len(kept) + 1) - sum(kept)
+
+    def rebuild(self, daily_max: Mapping[str, float]) -> None:
+        """Rebuild from a full {date_str: peak_kw} mapping (e.g. after loading from disk)."""
+        self.reset()
+        for day, value in daily_max.items():
+            self.update(day, value)
+
+    def reset(self) -> None:
+        """Clear all tracked days."""
+        self._days = []
+        self._values = []
+        self._top = {}
+
+
+class MeterRegister:
+    """Turn readings from a cumulative kWh register into energy deltas.
+
+    A total_increasing sensor can go backwards in three ways: small dips
+    (rounding, jitter) are ignored, a wrap of the register (e.g. 99999.9 ->
+    0.2) is counted across the wrap, and anything else is a counter reset
+    (meter replaced, source integration restarted) where the new reading is
+    the energy used since zero.
+    """
+
+    # Dips smaller than this fraction are jitter (same threshold as total_increasing in HA)
+    RESET_FRACTION: float = 0.1
+    # A register within this fraction of the next power of ten is assumed to wrap
+    ROLLOVER_MARGIN: float = 0.01
+
+    last_reading: float | None
+
+    def __init__(self, last_reading: float | None = None) -> None:
+        """Initialize with the last known reading, if any."""
+        self.last_reading = last_reading
+
+    def delta(self, reading_kwh: float) -> float:
+        """Energy since the previous reading (0.0 for the first reading)."""
+        if reading_kwh < 0:
+            return 0.0
+        previous = self.last_reading
+        if previous is None or reading_kwh >= previous:
+            self.last_reading = reading_kwh
+            return 0.0 if previous is None else reading_kwh - previous
+        if previous - reading_kwh < previous * self.RESET_FRACTION:
+            # Jitter: keep the higher reading so the dip is not counted twice
+            return 0.0
+        self.last_reading = reading_kwh
+        if previous < 1:
+            return reading_kwh
+        wrap = float(10 ** math.ceil(math.log10(previous)))
+        if previous >= wrap * (1 - self.ROLLOVER_MARGIN):
+            return wrap - previous + reading_kwh
+        return reading_kwh
+
+
+class ConsumptionAccumulator:
+    """Fold power samples into settlement interval energy and daily peaks.
+
+    Energy is booked into a fixed array of interval buckets for the month
+    (31 days x 24 or 96 intervals), so the per-sample cost is O(1) and memory
+    is bounded however long the month runs. When an interval closes, its
+    average power (kWh / interval length) feeds the daily max, which is what
+    grid companies bill the capacity charge on. Dag/natt follows the tariff
+    of the interval the energy was used in. The open interval is exposed as a
+    running projection.
+
+    Every bit of energy booked is also passed to ``on_energy`` with the start
+    of its interval, so costs can be booked at that interval's prices.
+
+    Samples come either from the coordinator's poll or from state change
+    events on the power sensor. Times are naive local time, but ordering and
+    elapsed time are worked out on the instants they refer to, so the hour
+    repeated when daylight saving time ends is booked rather than dropped. The accumulator itself is free of Home
+    Assistant dependencies so the bookkeeping can be tested directly.
+    """
+
+    resolution_minutes: int
+    slots_per_day: int
+    interval_kwh: array[float]
+    daily_max_power: dict[str, float]
+    top_days: TopDaysTracker
+    monthly_consumption: dict[str, float]
+    current_interval: datetime | None
+    last_sample: datetime | None
+    last_power_kw: float
+    integration_method: str
+    max_gap: timedelta | None
+    uncovered_seconds: array[float]
+
+    def __init__(
+        self,
+        is_day_rate: Callable[[datetime], bool],
+        resolution_minutes: int = 60,
+        top_days: int = 3,
+        integration_method: str = "right",
+        max_gap_seconds: float | None = None,
+        on_energy: Callable[[datetime, float], None] | None = None,
+    ) -> None:
+        """Initialize the accumulator."""
+        if resolution_minutes not in SETTLEMENT_RESOLUTIONS:
+            raise ValueError(f"Unsupported settlement resolution: {resolution_minutes} min")
+        if integration_method not in INTEGRATION_METHODS:
+            raise ValueError(f"Unsupported integration method: {integration_method}")
+        self._is_day_rate = is_day_rate
+        self.resolution_minutes = resolution_minutes
+        self.slots_per_day = 1440 // resolution_minutes
+        self._interval = timedelta(minutes=resolution_minutes)
+        self._interval_hours = resolution_minutes / 60
+        # Energy per settlement interval: index = (day - 1) * slots_per_day + slot
+        self.interval_kwh = array("d", bytes(8 * MAX_DAYS_IN_MONTH * self.slots_per_day))
+        # Format: {date_str: max_interval_kw} (highest interval average per day)
+        self.daily_max_power = {}
+        self.top_days = TopDaysTracker(top_days)
+        # Format: {"dag": kwh, "natt": kwh}
+        self.monthly_consumption = {"dag": 0.0, "natt": 0.0}
+        # Open interval start, its energy lives in interval_kwh
+        self.current_interval = None
+        # Energy already in the open interval's bucket when it opened. Only
+        # non-zero in the repeated hour, which shares its bucket with the first.
+        self._bucket_base = 0.0
+        self.last_sample = None
+        self.last_power_kw = 0.0
+        self.integration_method = integration_method
+        # Gaps between samples longer than this are only booked next to the
+        # known readings, the rest is counted as uncovered instead of guessed
+        self.max_gap = timedelta(seconds=max_gap_seconds) if max_gap_seconds else None
+        # Uncovered seconds per hour: index = (day - 1) * 24 + hour
+        self.uncovered_seconds = array("d", bytes(8 * MAX_DAYS_IN_MONTH * 24))
+        self._on_energy = on_energy
+
+    @property
+    def current_interval_kwh(self) -> float:
+        """Energy booked so far in the open interval."""
+        if self.current_interval is None:
+            return 0.0
+        return self.interval_kwh[self._index(self.current_interval)] - self._bucket_base
+
+    def hour_kwh(self, hour_start: datetime) -> float:
+        """Energy booked in a whole hour of the current month (sums 15-minute intervals)."""
+        first = self._index(hour_start.replace(minute=0, second=0, microsecond=0))
+        return sum(self.interval_kwh[first : first + 60 // self.resolution_minutes])
+
+    def uncovered_seconds_in_hour(self, hour_start: datetime) -> float:
+        """Seconds of an hour in the current month that no sample covered."""
+        return self.uncovered_seconds[(hour_start.day - 1) * 24 + hour_start.hour]
+
+    def add_sample(self, now: datetime, power_kw: float, *, method: str | None = None) -> bool:
+        """Add a power sample and return True if energy or peak changed.
+
+        ``method`` overrides the configured integration method. "left" charges
+        the time since the last sample at the previous reading, i.e. the value
+        the sensor held until it changed. That is exact for sensors that report
+        on change (event ingestion). "right" charges it at the new reading,
+        which is how the 1-minute poll has always worked. "trapezoid" uses the
+        average of both.
+        """
+        if self.last_sample is not None and _utc(now) < _utc(self.last_sample):
+            # Out-of-order sample (e.g. poll and event racing) - ignore
+            return False
+        changed = self.advance_to(now, power_kw, method=method)
+        self.last_power_kw = power_kw
+        return changed
+
+    def advance_to(self, until: datetime, power_kw: float, *, method: str | None = None) -> bool:
+        """Book energy up to ``until`` and close any interval that ended before it.
+
+        Used directly at month rollover to book the last minutes of the old
+        month before its data is moved away.
+        """
+        changed = False
+        later = self.last_sample is None or _utc(until) > _utc(self.last_sample)
+        if self.last_sample is not None and later:
+            changed = self._integrate(
+                self.last_sample, until, self.last_power_kw, power_kw, method or self.integration_method
+            )
+        if self._close_interval_before(until):
+            changed = True
+        if later:
+            self.last_sample = until
+        return changed
+
+    def add_energy(self, now: datetime, energy_kwh: float) -> bool:
+        """Book a metered energy delta, spread evenly since the last reading.
+
+        Used with a cumulative kWh register instead of integrating power.
+        Returns True if energy or peak changed.
+        """
+        if self.last_sample is not None and _utc(now) < _utc(self.last_sample):
+            return False
+        changed = False
+        later = self.last_sample is None or _utc(now) > _utc(self.last_sample)
+        if self.last_sample is not None and later and energy_kwh > 0:
+            # A register delta is exact however long the gap, so it is never capped
+            hours = (_utc(now) - _utc(self.last_sample)).total_seconds() / 3600
+            self._book(self.last_sample, now, energy_kwh / hours)
+            changed = True
+        if self._close_interval_before(now):
+            changed = True
+        if later:
+            self.last_sample = now
+        return changed
+
+    def backfill(self, segments: Iterable[tuple[datetime, datetime, float]], until: datetime) -> float:
+        """Book known average power for past segments, then move on to ``until``.
+
+        Used after downtime with hourly means from the recorder. Segments are
+        (start, end, kW) in order. Time already booked (before last_sample) is
+        clipped away. Time not covered by any segment is skipped rather than
+        guessed. Returns the kWh booked.
+        """
+        booked_kwh = 0.0
+        for segment_start, segment_end, power_kw in segments:
+            start = _utc(segment_start)
+            if self.last_sample is not None:
+                start = max(start, _utc(self.last_sample))
+            end = min(_utc(segment_end), _utc(until))
+            if end <= start:
+                continue
+            if power_kw > 0:
+                self._book(start, end, power_kw)
+                booked_kwh += power_kw * (end - start).total_seconds() / 3600
+            self.last_sample = _local(end)
+        self._close_interval_before(until)
+        if self.last_sample is None or _utc(until) > _utc(self.last_sample):
+            self.last_sample = until
+        return booked_kwh
+
+    def current_interval_projection_kw(self, now: datetime) -> float:
+        """Project the open interval's average kW if the current power is held."""
+        if self.current_interval is None:
+            return self.last_power_kw
+        remaining_hours = max((_utc(self.current_interval) + self._interval - _utc(now)).total_seconds(), 0) / 3600
+        return (self.current_interval_kwh + self.last_power_kw * remaining_hours) / self._interval_hours
+
+    def interval_headroom(self, now: datetime, threshold: float) -> tuple[float, float]:
+        """How much the open interval may use before the top-day average passes ``threshold``.
+
+        Returns (max interval average kW, kW that may be drawn for the rest of
+        the interval). Energy since the last sample is counted at the held
+        reading, since it has not been booked yet.
+        """
+        max_interval_kw = self.top_days.max_allowed(now.strftime("%Y-%m-%d"), threshold)
+        start = self.interval_start(now)
+        used_kwh = self.current_interval_kwh if self.current_interval == start else 0.0
+        if self.last_sample is not None and start <= self.last_sample < now:
+            used_kwh += self.last_power_kw * (now - self.last_sample).total_seconds() / 3600
+        remaining_hours = (start + self._interval - now).total_seconds() / 3600
+        if remaining_hours <= 0:
+            return max_interval_kw, 0.0
+        headroom_kw = (max_interval_kw * self._interval_hours - used_kwh) / remaining_hours
+        return max_interval_kw, max(headroom_kw, 0.0)
+
+    def load_intervals(self, values: Sequence[float], resolution_minutes: int) -> None:
+        """Load stored interval energy, converting from another resolution if needed."""
+        if resolution_minutes == self.resolution_minutes:
+            converted = list(values)
+        elif resolution_minutes < self.resolution_minutes:
+            # Finer -> coarser: sum groups (exact)
+            group = self.resolution_minutes // resolution_minutes
+            converted = [sum(values[i : i + group]) for i in range(0, len(values), group)]
+        else:
+            # Coarser -> finer: spread evenly (best effort)
+            split = resolution_minutes // self.resolution_minutes
+            converted = [value / split for value in values for _ in range(split)]
+        size = len(self.interval_kwh)
+        converted = converted[:size]
+        converted.extend([0.0] * (size - len(converted)))
+        self.interval_kwh = array("d", converted)
+
+    def load_uncovered(self, values: Sequence[float]) -> None:
+        """Load stored uncovered seconds per hour."""
+        size = len(self.uncovered_seconds)
+        loaded = list(values[:size])
+        loaded.extend([0.0] * (size - len(loaded)))
+        self.uncovered_seconds = array("d", loaded)
+
+    def reset_month(self) -> None:
+        """Clear energy and peaks for a new month."""
+        self.interval_kwh = array("d", bytes(8 * len(self.interval_kwh)))
+        self.uncovered_seconds = array("d", bytes(8 * len(self.uncovered_seconds)))
+        self.daily_max_power = {}
+        self.top_days.reset()
+        self.monthly_consumption = {"dag": 0.0, "natt": 0.0}
+        self.current_interval = None
+        self._bucket_base = 0.0
+
+    def interval_start(self, dt: datetime) -> datetime:
+        """Truncate a datetime to the start of its settlement interval."""
+        minute = dt.minute - dt.minute % self.resolution_minutes
+        return dt.replace(minute=minute, second=0, microsecond=0)
+
+    def _index(self, interval_start: datetime) -> int:
+        """Bucket index for an interval start."""
+        slot = (interval_start.hour * 60 + interval_start.minute) // self.resolution_minutes
+        return (interval_start.day - 1) * self.slots_per_day + slot
+
+    def _integrate(self, start: datetime, end: datetime, start_kw: float, end_kw: float, method: str) -> bool:
+        """Book the time between two readings. Returns True if any energy was booked.
+
+        A gap longer than max_gap (restart, slow poll, blocked event loop) is
+        only booked for max_gap next to the reading(s) the method relies on.
+        The rest is recorded as uncovered rather than credited to one reading.
+        """
+        start, end = _utc(start), _utc(end)
+        if self.max_gap is None or end - start <= self.max_gap:
+            if method == "left":
+                power_kw = start_kw
+            elif method == "right":
+                power_kw = end_kw
+            else:
+                power_kw = (start_kw + end_kw) / 2
+            if power_kw <= 0:
+                return False
+            self._book(start, end, power_kw)
+            return True
+
+        if method == "left":
+            booked = [(start, start + self.max_gap, start_kw)]
+            uncovered = (start + self.max_gap, end)
+        elif method == "right":
+            booked = [(end - self.max_gap, end, end_kw)]
+            uncovered = (start, end - self.max_gap)
+        else:
+            half = self.max_gap / 2
+            booked = [(start, start + half, start_kw), (end - half, end, end_kw)]
+            uncovered = (start + half, end - half)
+        self._add_uncovered(*uncovered)
+        changed = False
+        for segment_start, segment_end, power_kw in booked:
+            if power_kw > 0:
+                self._book(segment_start, segment_end, power_kw)
+                changed = True
+        return changed
+
+    def _add_uncovered(self, start: datetime, end: datetime) -> None:
+        """Record [start, end) as uncovered, split per local hour."""
+        segment_start, end = _utc(start), _utc(end)
+        while segment_start < end:
+            hour_start = segment_start.replace(minute=0, second=0, microsecond=0)
+            segment_end = min(hour_start + timedelta(hours=1), end)
+            local_hour = _local(hour_start)
+            self.uncovered_seconds[(local_hour.day - 1) * 24 + local_hour.hour] += (
+                segment_end - segment_start
+            ).total_seconds()
+            segment_start = segment_end
+
+    def _book(self, start: datetime, end: datetime, power_kw: float) -> None:
+        """Book constant power over [start, end), split on interval boundaries.
+
+        Works on instants (UTC), so the repeated hour at the end of daylight
+        saving time is its own interval. Norwegian time is a whole number of
+        hours from UTC, so interval boundaries are the same in both.
+        """
+        segment_start, end = _utc(start), _utc(end)
+        while segment_start < end:
+            interval_utc = self.interval_start(segment_start)
+            segment_end = min(interval_utc + self._interval, end)
+            energy_kwh = power_kw * (segment_end - segment_start).total_seconds() / 3600
+            self._close_interval_before(segment_start)
+            interval_start = _local(interval_utc)
+            index = self._index(interval_start)
+            if self.current_interval is None:
+                self.current_interval = interval_start
+                self._bucket_base = self.interval_kwh[index]
+            self.interval_kwh[index] += energy_kwh
+            # Tariff follows the interval the energy was used in, not the sample time
+            tariff = "dag" if self._is_day_rate(interval_start) else "natt"
+            self.monthly_consumption[tariff] += energy_kwh
+            if self._on_energy is not None:
+                self._on_energy(interval_start, energy_kwh)
+            segment_start = segment_end
+
+    def _close_interval_before(self, now: datetime) -> bool:
+        """Close the open interval if ``now`` is past its end. Returns True if the peak changed."""
+        if self.current_interval is None or _utc(now) < _utc(self.current_interval) + self._interval:
+            return False
+        closed = self.current_interval
+        closed_kw = self.current_interval_kwh / self._interval_hours
+        self.current_interval = None
+        self._bucket_base = 0.0
+        day_str = closed.strftime("%Y-%m-%d")
+        if closed_kw > self.daily_max_power.get(day_str, 0):
+            self.daily_max_power[day_str] = closed_kw
+            self.top_days.update(day_str, closed_kw)
+            return True
+        return False
+
+
+def energy_sum_segments(sums: Iterable[tuple[datetime, float]]) -> list[tuple[datetime, datetime, float]]:
+    """Turn cumulative energy sums into (start, end, average kW) segments for backfill.
+
+    ``sums`` are (end of hour, cumulative kWh) from the recorder in order. The
+    energy used between two sums is spread over the time between them, so a
+    missing hour does not lose energy. The first sum only sets the starting
+    point, and a sum that goes down (statistics reset) is skipped.
+    """
+    segments: list[tuple[datetime, datetime, float]] = []
+    previous: tuple[datetime, float] | None = None
+    for end, total_kwh in sums:
+        if previous is not None and end > previous[0] and total_kwh >= previous[1]:
+            hours = (end - previous[0]).total_seconds() / 3600
+            segments.append((previous[0], end, (total_kwh - previous[1]) / hours))
+        previous = (end, total_kwh)
+    return segments
@@ -0,0 +1,214 @@
+"""Hourly consumption archive for Strømkalkulator."""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+from datetime import datetime
+from typing import TYPE_CHECKING, NamedTuple
+
+from .accumulator import MAX_DAYS_IN_MONTH, TopDaysTracker
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+ARCHIVE_MAGIC: bytes = b"SKAR"
+ARCHIVE_VERSION: int = 1
+
+# 13 months of the longest kind (31 days), so the same month last year is always there
+DEFAULT_CAPACITY: int = 24 * 31 * 13
+
+# Header: magic, version, record size, capacity
+_HEADER = struct.Struct("<4sHHI")
+# Record: hour index (hours since 1970-01-01 UTC), kWh, spot price, cost, flags
+_RECORD = struct.Struct("<IfffB3x")
+
+_FLAGS_OFFSET = _RECORD.size - 4
+_FLAG_VALID = 0x01
+_FLAG_DAY = 0x02
+_FLAG_UNPRICED = 0x04
+
+
+class HourRecord(NamedTuple):
+    """One archived hour."""
+
+    hour: datetime
+    kwh: float
+    spot_price: float
+    cost: float
+    is_day: bool
+    priced: bool  # False if some of the energy had no known spot price
+
+
+class MonthSummary(NamedTuple):
+    """Totals for one month from the archive."""
+
+    dag_kwh: float
+    natt_kwh: float
+    cost: float
+    hours: int
+    top_days: dict[str, float]
+    avg_top_kw: float
+
+
+class HourlyArchive:
+    """Fixed-size ring buffer of hourly records.
+
+    Each hour has a fixed slot (hour index modulo capacity), so writing is a
+    single struct pack into a preallocated buffer and old hours are simply
+    overwritten a little over a year later. The buffer is either a bytearray
+    (in memory) or a memory-mapped file, so loading does not parse anything.
+    A slot is only returned for the hour it was written for.
+
+    Hours are indexed by UTC, so the repeated hour when summer time ends has
+    its own slot. Naive datetimes are local time (``fold`` picks the hour).
+    """
+
+    capacity: int
+
+    def __init__(self, buffer: bytearray | mmap.mmap | None = None, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize the archive on a buffer, or an empty in-memory one."""
+        self._buffer = buffer if buffer is not None else bytearray(_size(capacity))
+        self.capacity = capacity
+        if buffer is None:
+            _HEADER.pack_into(self._buffer, 0, ARCHIVE_MAGIC, ARCHIVE_VERSION, _RECORD.size, capacity)
+            self._count = 0
+        else:
+            # Counted once here (in the executor for files), then kept up to date on write
+            self._count = sum(
+                1
+                for offset in range(_HEADER.size, len(self._buffer), _RECORD.size)
+                if self._buffer[offset + _FLAGS_OFFSET] & _FLAG_VALID
+            )
+
+    @classmethod
+    def open(cls, path: str, capacity: int = DEFAULT_CAPACITY) -> HourlyArchive:
+        """Open (or create) a file-backed archive. Blocking, run in the executor."""
+        size = _size(capacity)
+        if not _valid_file(path, size, capacity):
+            if os.path.exists(path):
+                _LOGGER.warning("Hourly archive %s has unexpected format, starting a new one", path)
+            with open(path, "wb") as f:
+                f.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, _RECORD.size, capacity))
+                f.truncate(size)
+        with open(path, "r+b") as f:
+            buffer = mmap.mmap(f.fileno(), size)
+        return cls(buffer, capacity)
+
+    def write(
+        self, hour: datetime, kwh: float, spot_price: float, cost: float, is_day: bool, priced: bool = True
+    ) -> None:
+        """Write an hour to its slot, replacing whatever was there.
+
+        ``priced`` is False if some of the hour's energy had no known spot
+        price. The spot price is then the average over the energy that had one.
+        """
+        index = _hour_index(hour)
+        offset = self._offset(index)
+        if not self._buffer[offset + _FLAGS_OFFSET] & _FLAG_VALID:
+            self._count += 1
+        flags = _FLAG_VALID | (_FLAG_DAY if is_day else 0) | (0 if priced else _FLAG_UNPRICED)
+        _RECORD.pack_into(self._buffer, offset, index, kwh, spot_price, cost, flags)
+
+    def get(self, hour: datetime) -> HourRecord | None:
+        """Get an archived hour, or None if it was never written or has been overwritten."""
+        index = _hour_index(hour)
+        stored_index, kwh, spot_price, cost, flags = _RECORD.unpack_from(self._buffer, self._offset(index))
+        if stored_index != index or not flags & _FLAG_VALID:
+            return None
+        return HourRecord(
+            _hour_start(index), kwh, spot_price, cost, bool(flags & _FLAG_DAY), not flags & _FLAG_UNPRICED
+        )
+
+    def records(self, start: datetime, end: datetime) -> Iterator[HourRecord]:
+        """Archived hours in [start, end), skipping missing ones."""
+        for index in range(_hour_index(start), _hour_index(end)):
+            record = self.get(_hour_start(index))
+            if record is not None:
+                yield record
+
+    def month_hours(self, year: int, month: int) -> list[float]:
+        """kWh per hour of a month, one slot per hour from the first (the accumulator's layout at 60 minutes).
+
+        Both hours at 02 when summer time ends share a slot.
+        """
+        hours = [0.0] * (MAX_DAYS_IN_MONTH * 24)
+        for record in self.records(*_month_range(year, month)):
+            hours[(record.hour.day - 1) * 24 + record.hour.hour] += record.kwh
+        return hours
+
+    def month_summary(self, year: int, month: int, top_n: int = 3) -> MonthSummary:
+        """Consumption, cost and top days for a month (hour kWh = hour average kW)."""
+        start, end = _month_range(year, month)
+        dag_kwh = natt_kwh = cost = 0.0
+        hours = 0
+        top_days = TopDaysTracker(top_n)
+        daily_max: dict[str, float] = {}
+        for record in self.records(start, end):
+            hours += 1
+            cost += record.cost
+            if record.is_day:
+                dag_kwh += record.kwh
+            else:
+                natt_kwh += record.kwh
+            day_str = record.hour.strftime("%Y-%m-%d")
+            if record.kwh > daily_max.get(day_str, 0):
+                daily_max[day_str] = record.kwh
+                top_days.update(day_str, record.kwh)
+        return MonthSummary(dag_kwh, natt_kwh, cost, hours, top_days.top, top_days.average)
+
+    def count(self) -> int:
+        """Number of valid hours stored."""
+        return self._count
+
+    def flush(self) -> None:
+        """Write changes to disk (file-backed only). Blocking, run in the executor."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.flush()
+
+    def close(self) -> None:
+        """Flush and release the file mapping. Blocking, run in the executor."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.flush()
+            self._buffer.close()
+
+    def _offset(self, index: int) -> int:
+        """Byte offset of the slot for an hour index."""
+        return _HEADER.size + (index % self.capacity) * _RECORD.size
+
+
+def _hour_index(hour: datetime) -> int:
+    """Hours since 1970-01-01 UTC (naive datetimes are local time, as in the coordinator)."""
+    return int(hour.timestamp() // 3600)
+
+
+def _hour_start(index: int) -> datetime:
+    """Start of an hour index as naive local time (fold set for the repeated hour)."""
+    return datetime.fromtimestamp(index * 3600)
+
+
+def _month_range(year: int, month: int) -> tuple[datetime, datetime]:
+    """First hour of a month and of the next (naive local time)."""
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return datetime(year, month, 1), end
+
+
+def _size(capacity: int) -> int:
+    """Total size in bytes for a capacity."""
+    return _HEADER.size + capacity * _RECORD.size
+
+
+def _valid_file(path: str, size: int, capacity: int) -> bool:
+    """Check that an existing archive file has the expected header and size."""
+    try:
+        if os.path.getsize(path) != size:
+            return False
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+    except OSError:
+        return False
+    return _HEADER.unpack(header) == (ARCHIVE_MAGIC, ARCHIVE_VERSION, _RECORD.size, capacity)
@@ -0,0 +1,82 @@
+"""Capacity tier (kapasitetstrinn) lookup for Strømkalkulator."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .tso import KapasitetstrinnDict, KapasitetstrinnTuple
+
+
+class CapacityHeadroom(NamedTuple):
+    """Room left before the capacity tier goes up (None in the top tier)."""
+
+    headroom_kw: float | None  # Effekt som kan brukes resten av intervallet
+    max_interval_kw: float | None  # Høyeste snitt-kW intervallet kan ha
+    next_threshold_kw: float | None  # Grensen som ikke skal passeres
+    next_tier_cost: int | None  # Økning i kr/mnd ved neste trinn
+    risk_percent: float | None  # Prognose for intervallet i prosent av maks
+
+
+class CapacityTiers:
+    """Kapasitetstrinn compiled to sorted threshold and price arrays.
+
+    Both TSO formats (tuples of (kW-grense, kr/mnd) and dicts with min/max/pris)
+    are normalised once, the last tier is open-ended, and the range labels are
+    rendered up front. A lookup is a bisect on the upper thresholds.
+    """
+
+    thresholds: tuple[float, ...]
+    prices: tuple[int, ...]
+    labels: tuple[str, ...]
+
+    def __init__(self, kapasitetstrinn: Sequence[KapasitetstrinnTuple | KapasitetstrinnDict]) -> None:
+        """Compile a TSO's kapasitetstrinn."""
+        tiers = sorted(_normalise(tier) for tier in kapasitetstrinn)
+        if not tiers:
+            raise ValueError("No kapasitetstrinn")
+        # Siste trinn gjelder alt over forrige grense, uansett oppgitt maks
+        tiers[-1] = (float("inf"), tiers[-1][1])
+        self.thresholds = tuple(threshold for threshold, _ in tiers)
+        self.prices = tuple(price for _, price in tiers)
+
+        labels = []
+        previous = 0.0
+        for threshold in self.thresholds:
+            if threshold == float("inf"):
+                labels.append(f">{previous:.0f} kW")
+            else:
+                labels.append(f"{previous:.0f}-{threshold:.0f} kW")
+            previous = threshold
+        self.labels = tuple(labels)
+
+    def __len__(self) -> int:
+        """Number of tiers."""
+        return len(self.thresholds)
+
+    def lookup(self, avg_power: float) -> tuple[int, int, str]:
+        """Tier for an average power: (kr/mnd, tier number from 1, range label)."""
+        index = bisect_left(self.thresholds, avg_power)
+        return self.prices[index], index + 1, self.labels[index]
+
+    def ceiling(self, avg_power: float) -> tuple[float, int] | None:
+        """Upper threshold of the current tier and the extra kr/mnd for the next (None in the top tier)."""
+        index = bisect_left(self.thresholds, avg_power)
+        if index + 1 >= len(self.thresholds):
+            return None
+        return self.thresholds[index], self.prices[index + 1] - self.prices[index]
+
+    def price(self, avg_power: float) -> int:
+        """Kapasitetsledd (kr/mnd) for an average power."""
+        return self.prices[bisect_left(self.thresholds, avg_power)]
+
+
+def _normalise(tier: KapasitetstrinnTuple | KapasitetstrinnDict) -> tuple[float, int]:
+    """(upper kW threshold, kr/mnd) from either format."""
+    if isinstance(tier, dict):
+        return float(tier["max"]), int(tier["pris"])
+    threshold, price = tier
+    return float(threshold), int(price)
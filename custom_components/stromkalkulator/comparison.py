@@ -0,0 +1,190 @@
+"""Grid tariff comparison across every TSO for Strømkalkulator."""
+
+from __future__ import annotations
+
+import calendar
+from datetime import date, timedelta
+from functools import cache
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .capacity import CapacityTiers
+from .const import DEFAULT_KAPASITET_ANTALL_DAGER, DEFAULT_TIDSPLAN, MVA_SATS
+from .tariff_calendar import TariffCalendar
+from .tso import load_tso_list
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from .tso import TSOEntry
+
+
+class MonthProfile(NamedTuple):
+    """A month's energy per settlement interval, in the accumulator's layout."""
+
+    month_start: date
+    interval_kwh: Sequence[float]
+    resolution_minutes: int
+
+
+class TsoCost(NamedTuple):
+    """Nettleie for a consumption profile with one TSO's tariff.
+
+    Totals are summed over the months priced. Snitt topp and kapasitetstrinn
+    are for the last month.
+    """
+
+    tso_id: str
+    name: str
+    prisomrade: str
+    dag_kwh: float
+    natt_kwh: float
+    energiledd_kr: float
+    snitt_topp_kw: float
+    kapasitetstrinn: str
+    kapasitetsledd_kr: float
+    total_kr: float
+
+
+class TariffComparison:
+    """Every supported TSO's tariff compiled into flat tables.
+
+    Capacity tiers and dag/natt calendars are compiled once. TSOs with the
+    same schedule share a calendar, so pricing a profile is one pass over the
+    month per distinct schedule (a handful) plus a few multiplications per
+    TSO, instead of setting up a coordinator for each of them.
+    """
+
+    def __init__(self, tso_list: Mapping[str, TSOEntry] | None = None) -> None:
+        """Compile the tables (for the whole catalogue by default)."""
+        if tso_list is None:
+            tso_list = load_tso_list()
+        supported = [(tso_id, tso) for tso_id, tso in tso_list.items() if tso["supported"]]
+        self.tso_ids = [tso_id for tso_id, _ in supported]
+        self.names = [tso["name"] for _, tso in supported]
+        self.prisomrader = [tso["prisomrade"] for _, tso in supported]
+        self.energiledd_dag = [tso["energiledd_dag"] for _, tso in supported]
+        self.energiledd_natt = [tso["energiledd_natt"] for _, tso in supported]
+        self.tiers = [CapacityTiers(tso["kapasitetstrinn"]) for _, tso in supported]
+        self.top_days = [tso.get("kapasitet_antall_dager", DEFAULT_KAPASITET_ANTALL_DAGER) for _, tso in supported]
+        # Households in NO4 (Nord-Norge) pay no mva, so those TSOs list prices without it
+        self.mva_sats = [
+            0.0 if tso["prisomrade"] == "NO4" or tso.get("tiltakssone") else MVA_SATS for _, tso in supported
+        ]
+
+        # One calendar per distinct schedule, TSOs point to theirs by index
+        self.calendars: list[TariffCalendar] = []
+        self.calendar_index: list[int] = []
+        by_schedule: dict[str, int] = {}
+        for _, tso in supported:
+            tidsplan = tso.get("tidsplan", DEFAULT_TIDSPLAN)
+            key = repr(tidsplan)
+            if key not in by_schedule:
+                by_schedule[key] = len(self.calendars)
+                self.calendars.append(TariffCalendar(tidsplan))
+            self.calendar_index.append(by_schedule[key])
+
+    def __len__(self) -> int:
+        """Number of TSOs in the tables."""
+        return len(self.tso_ids)
+
+    def rank(
+        self,
+        months: Sequence[MonthProfile],
+        prisomrade: str | None = None,
+        mva_sats: float = MVA_SATS,
+    ) -> list[TsoCost]:
+        """Nettleie for some months' interval energy with every TSO, cheapest first.
+
+        Capacity is the average of each TSO's own number of top days, from
+        the highest interval average per day, and is charged per month.
+        Every TSO's prices are converted to ``mva_sats`` (the customer's), so
+        TSOs listing prices with and without mva are ranked on the same basis.
+        """
+        dag_kwh = [0.0] * len(self.tso_ids)
+        natt_kwh = [0.0] * len(self.tso_ids)
+        energiledd_kr = [0.0] * len(self.tso_ids)
+        kapasitetsledd_kr = [0.0] * len(self.tso_ids)
+        last_month: list[tuple[float, str]] = [(0.0, "")] * len(self.tso_ids)
+        for month in months:
+            calendar_dag_kwh, total_kwh, peak_sums = self._month_totals(month)
+            for i in range(len(self.tso_ids)):
+                dag = calendar_dag_kwh[self.calendar_index[i]]
+                natt = total_kwh - dag
+                dag_kwh[i] += dag
+                natt_kwh[i] += natt
+                energiledd_kr[i] += dag * self.energiledd_dag[i] + natt * self.energiledd_natt[i]
+                count = min(self.top_days[i], len(peak_sums) - 1)
+                snitt_topp_kw = peak_sums[count] / count if count else 0.0
+                month_kapasitetsledd, _, trinn = self.tiers[i].lookup(snitt_topp_kw)
+                kapasitetsledd_kr[i] += month_kapasitetsledd
+                last_month[i] = (snitt_topp_kw, trinn)
+
+        costs = []
+        for i, tso_id in enumerate(self.tso_ids):
+            if prisomrade is not None and self.prisomrader[i] != prisomrade:
+                continue
+            mva_factor = (1 + mva_sats) / (1 + self.mva_sats[i])
+            energiledd = energiledd_kr[i] * mva_factor
+            kapasitetsledd = kapasitetsledd_kr[i] * mva_factor
+            snitt_topp_kw, trinn = last_month[i]
+            costs.append(
+                TsoCost(
+                    tso_id,
+                    self.names[i],
+                    self.prisomrader[i],
+                    dag_kwh[i],
+                    natt_kwh[i],
+                    energiledd,
+                    snitt_topp_kw,
+                    trinn,
+                    kapasitetsledd,
+                    energiledd + kapasitetsledd,
+                )
+            )
+        costs.sort(key=lambda cost: cost.total_kr)
+        return costs
+
+    def _month_totals(self, month: MonthProfile) -> tuple[list[float], float, list[float]]:
+        """Dag kWh per calendar, total kWh and prefix sums of the sorted daily peaks for a month."""
+        slots_per_hour = 60 // month.resolution_minutes
+        slots_per_day = 24 * slots_per_hour
+        interval_hours = month.resolution_minutes / 60
+        days = calendar.monthrange(month.month_start.year, month.month_start.month)[1]
+
+        dag_kwh = [0.0] * len(self.calendars)
+        total_kwh = 0.0
+        peaks = []
+        for day_index in range(days):
+            first = day_index * slots_per_day
+            slots = month.interval_kwh[first : first + slots_per_day]
+            if not any(slots):
+                continue
+            peaks.append(max(slots) / interval_hours)
+            hours = [sum(slots[hour * slots_per_hour : (hour + 1) * slots_per_hour]) for hour in range(24)]
+            total_kwh += sum(hours)
+            day = month.month_start + timedelta(days=day_index)
+            for i, tariff_calendar in enumerate(self.calendars):
+                mask = tariff_calendar.day_mask(day)
+                dag_kwh[i] += sum(kwh for kwh, is_day in zip(hours, mask, strict=True) if is_day)
+
+        # Average of the N highest days for any N: prefix sums over the sorted peaks
+        peaks.sort(reverse=True)
+        return dag_kwh, total_kwh, [0.0, *accumulate(peaks)]
+
+
+@cache
+def get_comparison() -> TariffComparison:
+    """Shared tables for the whole catalogue (compiled on first use).
+
+    Blocking the first time (reads tso.json), run in the executor.
+    """
+    return TariffComparison()
+
+
+def as_rows(costs: Sequence[TsoCost], digits: int = 2) -> list[dict[str, Any]]:
+    """One dict per TSO with its place in the ranking (for service responses)."""
+    return [
+        {"plass": place, **{k: round(v, digits) if isinstance(v, float) else v for k, v in cost._asdict().items()}}
+        for place, cost in enumerate(costs, 1)
+    ]
@@ -17,17 +17,29 @@ from .const import (
     CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR,
     CONF_ENERGILEDD_DAG,
     CONF_ENERGILEDD_NATT,
+    CONF_ENERGY_SENSOR,
+    CONF_EVENT_INGESTION,
     CONF_HAR_NORGESPRIS,
+    CONF_INTEGRATION_METHOD,
+    CONF_MAX_GAP_SECONDS,
     CONF_POWER_SENSOR,
+    CONF_SAVE_DELAY,
+    CONF_SETTLEMENT_MINUTES,
     CONF_SPOT_PRICE_SENSOR,
     CONF_TSO,
     DEFAULT_ENERGILEDD_DAG,
     DEFAULT_ENERGILEDD_NATT,
+    DEFAULT_INTEGRATION_METHOD,
+    DEFAULT_MAX_GAP_SECONDS,
     DEFAULT_NAME,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_SETTLEMENT_MINUTES,
     DEFAULT_TSO,
     DOMAIN,
-    TSO_LIST,
+    INTEGRATION_METHOD_OPTIONS,
+    SETTLEMENT_MINUTES_OPTIONS,
 )
+from .tso import get_tso, tso_names
 
 if TYPE_CHECKING:
     from homeassistant.data_entry_flow import FlowResult
@@ -36,10 +48,20 @@ if TYPE_CHECKING:
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Optional sensors in the options flow that can be cleared
+_CLEARABLE_OPTIONS: tuple[str, ...] = (CONF_ENERGY_SENSOR, CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR)
 
-def _get_tso_options() -> dict[str, str]:
-    """Get TSO options for selector (only supported ones)."""
-    return {key: str(value["name"]) for key, value in TSO_LIST.items() if value.get("supported", False)}
+
+def _get_settlement_selector() -> selector.SelectSelector:
+    """Get selector for settlement resolution (60 or 15 minutes)."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=[
+                selector.SelectOptionDict(value=key, label=label) for key, label in SETTLEMENT_MINUTES_OPTIONS.items()
+            ],
+            mode=selector.SelectSelectorMode.DROPDOWN,
+        ),
+    )
 
 
 class NettleieConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg,misc]
@@ -59,17 +81,15 @@ class NettleieConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ign
             self._data.update(user_input)
             return await self.async_step_sensors()
 
+        # Bare navnene, prisene leses når nettselskapet er valgt
+        names: dict[str, str] = await self.hass.async_add_executor_job(tso_names)
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_TSO, default=DEFAULT_TSO): selector.SelectSelector(
                         selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(value=key, label=value["name"])
-                                for key, value in TSO_LIST.items()
-                                if value.get("supported", False)
-                            ],
+                            options=[selector.SelectOptionDict(value=key, label=name) for key, name in names.items()],
                             mode=selector.SelectSelectorMode.DROPDOWN,
                         ),
                     ),
@@ -113,7 +133,7 @@ class NettleieConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ign
                     return await self.async_step_pricing()
 
                 # Otherwise, use defaults from TSO
-                tso: TSOEntry = TSO_LIST[self._data[CONF_TSO]]
+                tso: TSOEntry = await self.hass.async_add_executor_job(get_tso, self._data[CONF_TSO])
                 self._data[CONF_ENERGILEDD_DAG] = tso["energiledd_dag"]
                 self._data[CONF_ENERGILEDD_NATT] = tso["energiledd_natt"]
 
@@ -129,12 +149,22 @@ class NettleieConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ign
                             device_class="power",
                         ),
                     ),
+                    vol.Optional(CONF_ENERGY_SENSOR): selector.EntitySelector(
+                        selector.EntitySelectorConfig(
+                            domain="sensor",
+                            device_class="energy",
+                        ),
+                    ),
                     vol.Required(CONF_SPOT_PRICE_SENSOR): selector.EntitySelector(
                         selector.EntitySelectorConfig(domain="sensor"),
                     ),
                     vol.Optional(CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR): selector.EntitySelector(
                         selector.EntitySelectorConfig(domain="sensor"),
                     ),
+                    vol.Optional(CONF_EVENT_INGESTION, default=False): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_SETTLEMENT_MINUTES, default=str(DEFAULT_SETTLEMENT_MINUTES)
+                    ): _get_settlement_selector(),
                 }
             ),
             errors=errors,
@@ -180,7 +210,8 @@ class NettleieConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ign
         await self.async_set_unique_id(f"{DOMAIN}_{self._data[CONF_POWER_SENSOR]}")
         self._abort_if_unique_id_configured()
 
-        tso_name: str = TSO_LIST[self._data[CONF_TSO]]["name"]
+        names: dict[str, str] = await self.hass.async_add_executor_job(tso_names)
+        tso_name: str = names[self._data[CONF_TSO]]
         title: str = f"{DEFAULT_NAME} ({tso_name})"
 
         return self.async_create_entry(
@@ -203,17 +234,20 @@ class NettleieOptionsFlow(config_entries.OptionsFlow):  # type: ignore[misc]
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Manage the options."""
         if user_input is not None:
-            # Update config entry data
+            # Update config entry data. Optional sensors left empty are not in
+            # user_input, so drop them rather than keep the old value.
             new_data: dict[str, Any] = {**self.config_entry.data, **user_input}
+            for key in _CLEARABLE_OPTIONS:
+                if key not in user_input:
+                    new_data.pop(key, None)
             self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
             return self.async_create_entry(title="", data={})
 
         # Get current values from config entry
         current: dict[str, Any] = self.config_entry.data
+        names: dict[str, str] = await self.hass.async_add_executor_job(tso_names)
         tso_options: list[selector.SelectOptionDict] = [
-            selector.SelectOptionDict(value=key, label=value["name"])
-            for key, value in TSO_LIST.items()
-            if value.get("supported", False)
+            selector.SelectOptionDict(value=key, label=name) for key, name in names.items()
         ]
         avgiftssone_options: list[selector.SelectOptionDict] = [
             selector.SelectOptionDict(value=key, label=label) for key, label in AVGIFTSSONE_OPTIONS.items()
@@ -250,6 +284,12 @@ class NettleieOptionsFlow(config_entries.OptionsFlow):  # type: ignore[misc]
                 ): selector.EntitySelector(
                     selector.EntitySelectorConfig(domain="sensor"),
                 ),
+                vol.Optional(
+                    CONF_ENERGY_SENSOR,
+                    description={"suggested_value": current.get(CONF_ENERGY_SENSOR)},
+                ): selector.EntitySelector(
+                    selector.EntitySelectorConfig(domain="sensor", device_class="energy"),
+                ),
                 vol.Required(
                     CONF_SPOT_PRICE_SENSOR,
                     default=current.get(CONF_SPOT_PRICE_SENSOR),
@@ -262,6 +302,50 @@ class NettleieOptionsFlow(config_entries.OptionsFlow):  # type: ignore[misc]
                 ): selector.EntitySelector(
                     selector.EntitySelectorConfig(domain="sensor"),
                 ),
+                vol.Optional(
+                    CONF_EVENT_INGESTION,
+                    default=current.get(CONF_EVENT_INGESTION, False),
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_SETTLEMENT_MINUTES,
+                    default=str(current.get(CONF_SETTLEMENT_MINUTES, DEFAULT_SETTLEMENT_MINUTES)),
+                ): _get_settlement_selector(),
+                vol.Optional(
+                    CONF_INTEGRATION_METHOD,
+                    default=current.get(CONF_INTEGRATION_METHOD, DEFAULT_INTEGRATION_METHOD),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[
+                            selector.SelectOptionDict(value=key, label=label)
+                            for key, label in INTEGRATION_METHOD_OPTIONS.items()
+                        ],
+                        mode=selector.SelectSelectorMode.DROPDOWN,
+                    ),
+                ),
+                vol.Optional(
+                    CONF_MAX_GAP_SECONDS,
+                    default=current.get(CONF_MAX_GAP_SECONDS, DEFAULT_MAX_GAP_SECONDS),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=3600,
+                        step=1,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
+                vol.Optional(
+                    CONF_SAVE_DELAY,
+                    default=current.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=3600,
+                        step=1,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
                 vol.Required(
                     CONF_ENERGILEDD_DAG,
                     default=current.get(CONF_ENERGILEDD_DAG, DEFAULT_ENERGILEDD_DAG),
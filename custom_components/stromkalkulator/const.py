@@ -2,20 +2,41 @@
 
 from typing import Final
 
-from .tso import TSO_LIST
-
-__all__ = ["TSO_LIST"]
+from .tso import TidsplanPeriode
 
 DOMAIN: Final[str] = "stromkalkulator"
 
 # Config keys
 CONF_POWER_SENSOR: Final[str] = "power_sensor"
+CONF_ENERGY_SENSOR: Final[str] = "energy_sensor"
 CONF_SPOT_PRICE_SENSOR: Final[str] = "spot_price_sensor"
 CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR: Final[str] = "electricity_provider_price_sensor"
 CONF_TSO: Final[str] = "tso"
 CONF_ENERGILEDD_DAG: Final[str] = "energiledd_dag"
 CONF_ENERGILEDD_NATT: Final[str] = "energiledd_natt"
 CONF_AVGIFTSSONE: Final[str] = "avgiftssone"
+CONF_EVENT_INGESTION: Final[str] = "event_ingestion"
+CONF_SETTLEMENT_MINUTES: Final[str] = "settlement_minutes"
+CONF_SAVE_DELAY: Final[str] = "save_delay"
+CONF_INTEGRATION_METHOD: Final[str] = "integration_method"
+CONF_MAX_GAP_SECONDS: Final[str] = "max_gap_seconds"
+
+# Dispatcher signal for capacity headroom updates between coordinator ticks (format with entry_id)
+SIGNAL_HEADROOM_UPDATED: Final[str] = "stromkalkulator_headroom_updated_{}"
+
+# Services
+SERVICE_GET_PRICE_CURVE: Final[str] = "get_price_curve"
+SERVICE_COMPARE_TSO: Final[str] = "compare_tso"
+SERVICE_SIMULATE_NORGESPRIS: Final[str] = "simulate_norgespris"
+ATTR_CONFIG_ENTRY_ID: Final[str] = "config_entry_id"
+ATTR_PRISOMRADE: Final[str] = "prisomrade"
+ATTR_START: Final[str] = "start"
+ATTR_END: Final[str] = "end"
+# Importert timeserie til simulate_norgespris: [{time, kwh, spotpris}, ...]
+ATTR_TIMER: Final[str] = "timer"
+ATTR_TIME: Final[str] = "time"
+ATTR_KWH: Final[str] = "kwh"
+ATTR_SPOTPRIS: Final[str] = "spotpris"
 
 # Avgiftssoner for forbruksavgift og mva
 # - standard: Full forbruksavgift + mva (Sør-Norge: NO1, NO2, NO5)
@@ -37,6 +58,46 @@ DEFAULT_ENERGILEDD_DAG: Final[float] = 0.4613
 DEFAULT_ENERGILEDD_NATT: Final[float] = 0.2329
 DEFAULT_TSO: Final[str] = "bkk"
 
+# Kapasitetsledd: snitt av de N dagene med høyest effekt i måneden.
+# De fleste nettselskap bruker 3, men TSO-er kan overstyre med "kapasitet_antall_dager".
+DEFAULT_KAPASITET_ANTALL_DAGER: Final[int] = 3
+
+# Avregningsoppløsning (kvartersoppgjør)
+# Elhub og det nordiske markedet går over fra timesoppgjør til 15-minutters oppgjør.
+# Energi og effekttopper bokføres per avregningsintervall.
+DEFAULT_SETTLEMENT_MINUTES: Final[int] = 60
+SETTLEMENT_MINUTES_OPTIONS: Final[dict[str, str]] = {
+    "60": "60 minutter (timesoppgjør)",
+    "15": "15 minutter (kvartersoppgjør)",
+}
+
+# Lagring: endringer samles og skrives til disk maks én gang per vindu (sekunder).
+# Sparer SD-kort på Raspberry Pi. 0 = skriv ved neste anledning.
+DEFAULT_SAVE_DELAY: Final[int] = 300
+
+# Energimåler (kWh-register, f.eks. AMS/HAN): faktor til kWh per enhet
+ENERGY_UNIT_TO_KWH: Final[dict[str, float]] = {"Wh": 0.001, "kWh": 1.0, "MWh": 1000.0}
+
+# Integrasjon av effekt til energi mellom to målinger (uten energimåler).
+# Hendelsesbasert måling bruker alltid "left" (verdien sensoren holdt til den endret seg).
+DEFAULT_INTEGRATION_METHOD: Final[str] = "right"
+INTEGRATION_METHOD_OPTIONS: Final[dict[str, str]] = {
+    "right": "Ny måling (standard)",
+    "left": "Forrige måling",
+    "trapezoid": "Trapes (snitt av begge)",
+}
+# Opphold mellom målinger lenger enn dette (sekunder) bokføres bare delvis,
+# resten telles som udekket tid i stedet for å krediteres én måling.
+DEFAULT_MAX_GAP_SECONDS: Final[int] = 300
+
+# Gjenoppretting: ved opphold lenger enn dette (minutter) siden siste måling
+# hentes timesstatistikk fra recorder for perioden HA var nede.
+BACKFILL_MIN_GAP_MINUTES: Final[int] = 5
+
+# Sammenligning av nettselskap (compare_tso): antall måneder, denne måneden
+# og månedene før den fra timesarkivet
+COMPARE_TSO_MONTHS: Final[int] = 12
+
 # === STRØMSTØTTE ===
 # Primærkilde: Forskrift om strømstønad § 5
 # https://lovdata.no/dokument/SF/forskrift/2025-09-08-1791
@@ -127,6 +188,7 @@ def get_norgespris_inkl_mva(avgiftssone: str) -> float:
 # MVA: 25% i Sør-Norge, fritak for husholdninger i Nord-Norge og tiltakssonen
 #
 # For 2027-satser, sjekk: https://www.skatteetaten.no/satser/elektrisk-kraft/
+# Tidligere satser ligger i tariff_history.py
 
 # 2026: Flat sats hele året, ingen sesongvariasjon
 FORBRUKSAVGIFT_ALMINNELIG: Final[float] = 0.0713  # 7,13 øre/kWh eks. mva (husholdninger)
@@ -187,6 +249,10 @@ def get_default_avgiftssone(prisomrade: str) -> str:
     return AVGIFTSSONE_STANDARD
 
 
+# Dagtariff hverdager 06-22 (ikke helligdager), natt resten av tiden.
+# Kan overstyres per nettselskap med tidsplan i tso.py
+DEFAULT_TIDSPLAN: Final[list[TidsplanPeriode]] = [{"timer": (6, 22)}]
+
 # Helligdager (YYYY-MM-DD for bevegelige, MM-DD for faste)
 # Faste helligdager
 HELLIGDAGER_FASTE: Final[list[str]] = [
@@ -197,7 +263,8 @@ HELLIGDAGER_FASTE: Final[list[str]] = [
     "12-26",  # 2. juledag
 ]
 
-# Bevegelige helligdager (må oppdateres årlig)
+# Bevegelige helligdager 2026-2027 (for oppslag og kontroll).
+# Tariffkalenderen beregner dem for alle år fra påskedatoen, se holidays.py
 HELLIGDAGER_BEVEGELIGE: Final[list[str]] = [
     # 2026
     "2026-04-02",  # Skjærtorsdag
@@ -3,38 +3,72 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, cast
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.helpers.storage import Store
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .accumulator import ConsumptionAccumulator, MeterRegister, energy_sum_segments
+from .archive import HourlyArchive
+from .capacity import CapacityHeadroom, CapacityTiers
+from .comparison import MonthProfile, TsoCost, get_comparison
 from .const import (
     AVGIFTSSONE_STANDARD,
+    BACKFILL_MIN_GAP_MINUTES,
+    COMPARE_TSO_MONTHS,
     CONF_AVGIFTSSONE,
     CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR,
     CONF_ENERGILEDD_DAG,
     CONF_ENERGILEDD_NATT,
+    CONF_ENERGY_SENSOR,
+    CONF_EVENT_INGESTION,
     CONF_HAR_NORGESPRIS,
+    CONF_INTEGRATION_METHOD,
+    CONF_MAX_GAP_SECONDS,
     CONF_POWER_SENSOR,
+    CONF_SAVE_DELAY,
+    CONF_SETTLEMENT_MINUTES,
     CONF_SPOT_PRICE_SENSOR,
     CONF_TSO,
+    DEFAULT_INTEGRATION_METHOD,
+    DEFAULT_KAPASITET_ANTALL_DAGER,
+    DEFAULT_MAX_GAP_SECONDS,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_SETTLEMENT_MINUTES,
+    DEFAULT_TIDSPLAN,
+    DEFAULT_TSO,
     DOMAIN,
-    ENOVA_AVGIFT,
-    HELLIGDAGER_BEVEGELIGE,
-    HELLIGDAGER_FASTE,
-    STROMSTOTTE_LEVEL,
+    ENERGY_UNIT_TO_KWH,
+    SIGNAL_HEADROOM_UPDATED,
     STROMSTOTTE_RATE,
-    TSO_LIST,
-    get_forbruksavgift,
     get_mva_sats,
     get_norgespris_inkl_mva,
 )
+from .ledger import CostLedger, IntervalRates
+from .prices import PriceCurve, PriceParams, build_curve, calculate_prices, parse_spot_attributes
+from .simulator import MonthSavings, simulate
+from .snapshot import EMPTY_SNAPSHOT, SensorSnapshot, build_snapshot
+from .storage import StoredState, StromkalkulatorStore, decode, encode
+from .tariff_calendar import TariffCalendar
+from .tariff_history import (
+    ENOVA_AVGIFT_HISTORY,
+    STROMSTOTTE_LEVEL_HISTORY,
+    energiledd_history,
+    forbruksavgift_at,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from datetime import date
+
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
 
+    from .tariff_history import EnergileddHistory
     from .tso import TSOEntry
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,24 +82,28 @@ class NettleieCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignor
     spot_price_sensor: str | None
     electricity_company_price_sensor: str | None
     tso: TSOEntry
-    _tso_id: str
+    tso_id: str
     avgiftssone: str
     har_norgespris: bool
     energiledd_dag: float
     energiledd_natt: float
-    kapasitetstrinn: list[tuple[float, int]]
-    _daily_max_power: dict[str, float]
+    energiledd_history: EnergileddHistory
+    capacity_tiers: CapacityTiers
+    event_ingestion: bool
+    settlement_minutes: int
+    _accumulator: ConsumptionAccumulator
     _current_month: int
-    _monthly_consumption: dict[str, float]
-    _last_update: datetime | None
+    _month_start: date
     _previous_month_consumption: dict[str, float]
     _previous_month_top_3: dict[str, float]
     _previous_month_name: str | None
-    _store: Store[dict[str, Any]]
+    _previous_month_ledger: CostLedger
+    snapshot: SensorSnapshot
+    _store: StromkalkulatorStore
     _store_loaded: bool
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        """Initialize the coordinator."""
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, tso: TSOEntry) -> None:
+        """Initialize the coordinator with the entry's TSO (from get_tso)."""
         super().__init__(
             hass,
             _LOGGER,
@@ -74,13 +112,16 @@ class NettleieCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignor
         )
         self.entry = entry
         self.power_sensor = entry.data.get(CONF_POWER_SENSOR)
+        # Optional cumulative kWh register. When set, energy comes from register
+        # deltas and the power sensor only feeds the open interval projection.
+        self.energy_sensor = entry.data.get(CONF_ENERGY_SENSOR)
+        self._meter = MeterRegister()
         self.spot_price_sensor = entry.data.get(CONF_SPOT_PRICE_SENSOR)
         self.electricity_company_price_sensor = entry.data.get(CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR)
 
         # Get TSO config
-        tso_id = entry.data.get(CONF_TSO, "bkk")
-        self.tso = TSO_LIST.get(tso_id, TSO_LIST["bkk"])
-        self._tso_id = tso_id
+        self.tso = tso
+        self.tso_id = entry.data.get(CONF_TSO, DEFAULT_TSO)
 
         # Get avgiftssone from config
         self.avgiftssone = entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
@@ -91,157 +132,168 @@ class NettleieCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignor
         # Get energiledd from config (allows override)
         self.energiledd_dag = float(entry.data.get(CONF_ENERGILEDD_DAG, self.tso["energiledd_dag"]))
         self.energiledd_natt = float(entry.data.get(CONF_ENERGILEDD_NATT, self.tso["energiledd_natt"]))
-
-        # Get kapasitetstrinn from TSO
-        # Type: list of tuples (kW_threshold, NOK_per_month)
-        self.kapasitetstrinn = cast("list[tuple[float, int]]", self.tso["kapasitetstrinn"])
-
-        # Track max power for capacity calculation
-        # Format: {date_str: max_power_kw}
-        self._daily_max_power = {}
+        # Earlier energiledd from the TSO's historikk, for intervals before today's prices applied
+        self.energiledd_history = energiledd_history(self.tso, self.energiledd_dag, self.energiledd_natt)
+
+        # Dag/natt per hour from the TSO's schedule, precompiled per year
+        self.tariff_calendar = TariffCalendar(self.tso.get("tidsplan", DEFAULT_TIDSPLAN))
+
+        # Kapasitetstrinn from TSO, compiled once (both tuple and dict format)
+        self.capacity_tiers = CapacityTiers(self.tso["kapasitetstrinn"])
+        # Room left before the tier goes up, refreshed on every sample
+        self.headroom = CapacityHeadroom(None, None, None, None, None)
+        # Every sensor's state, computed once per refresh for all entities.
+        # Only sensors in changed_sensors write state after a refresh.
+        self.snapshot = EMPTY_SNAPSHOT
+        self.changed_sensors: frozenset[str] = frozenset()
+        self.state_writes = 0
+        self.state_writes_skipped = 0
+
+        # Event ingestion: fold every power sensor state change into the
+        # accumulators instead of only sampling once per coordinator tick
+        self.event_ingestion = entry.data.get(CONF_EVENT_INGESTION, False)
+
+        # Track energy per settlement interval (60 or 15 min) for capacity
+        # calculation (highest interval per day) and monthly utility meter
+        self.settlement_minutes = int(entry.data.get(CONF_SETTLEMENT_MINUTES, DEFAULT_SETTLEMENT_MINUTES))
+        # Capacity tier is based on the average of the N highest days (usually 3)
+        self.kapasitet_antall_dager = int(self.tso.get("kapasitet_antall_dager", DEFAULT_KAPASITET_ANTALL_DAGER))
+        # Power to energy: integration method and max gap between samples.
+        # A metered register delta is exact, so no gap cap in that case.
+        self.integration_method = entry.data.get(CONF_INTEGRATION_METHOD, DEFAULT_INTEGRATION_METHOD)
+        self.max_gap_seconds: int | None = None
+        if not self.energy_sensor:
+            self.max_gap_seconds = int(entry.data.get(CONF_MAX_GAP_SECONDS, DEFAULT_MAX_GAP_SECONDS))
+        self._accumulator = ConsumptionAccumulator(
+            self._is_day_rate,
+            self.settlement_minutes,
+            top_days=self.kapasitet_antall_dager,
+            integration_method=self.integration_method,
+            max_gap_seconds=self.max_gap_seconds,
+            on_energy=self._book_cost,
+        )
+        # Monthly costs, booked per interval at that interval's prices
+        self.ledger = CostLedger()
+        self._rates_interval: datetime | None = None
+        self._rates = IntervalRates(False, 0.0, 0.0, 0.0, 0.0, 0.0)
         self._current_month = datetime.now().month
-
-        # Track energy consumption for monthly utility meter
-        # Format: {"dag": kwh, "natt": kwh}
-        self._monthly_consumption = {"dag": 0.0, "natt": 0.0}
-        self._last_update = None
+        self._month_start = datetime.now().date().replace(day=1)
 
         # Track previous month's data for invoice verification
         self._previous_month_consumption = {"dag": 0.0, "natt": 0.0}
         self._previous_month_top_3 = {}
         self._previous_month_name = None  # e.g., "januar 2026"
+        self._previous_month_ledger = CostLedger()
 
         # Persistent storage - use TSO id for stable storage across reinstalls
-        self._store = Store(hass, 1, f"{DOMAIN}_{tso_id}")
+        self._store = StromkalkulatorStore(hass, f"{DOMAIN}_{self.tso_id}")
         self._store_loaded = False
 
+        # Write-behind: changes mark the store dirty and are coalesced into
+        # one write per save_delay window instead of one write per tick
+        self.save_delay = int(entry.data.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY))
+        self._save_pending = False
+        self.save_requests = 0
+        self.store_writes = 0
+
+        # Rolling archive of hourly consumption, price and cost (13 months),
+        # memory-mapped from .storage. The open hour's prices are kept until it closes.
+        self.archive: HourlyArchive | None = None
+        # Hour being archived and its totals so far (kWh, kWh with a spot price, spot kr, cost kr)
+        self._archive_hour: datetime | None = None
+        self._archive_totals = (0.0, 0.0, 0.0, 0.0)
+
+        # Day-ahead price curve, cached until the spot sensor updates
+        self._price_curve: dict[str, PriceCurve | None] = {"today": None, "tomorrow": None}
+        self._price_curve_key: tuple[Any, ...] | None = None
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from sensors and calculate values."""
         now = datetime.now()
+        # Nothing changed until the new snapshot is built (e.g. if this refresh fails)
+        self.changed_sensors = frozenset()
 
         # Load stored data on first run
         if not self._store_loaded:
             await self._load_stored_data()
             self._store_loaded = True
+            # Price curve first, so backfilled intervals get their own spot price
+            kapasitetsledd = self.capacity_tiers.lookup(self._accumulator.top_days.average)[0]
+            self._get_price_curve(self.hass.states.get(self.spot_price_sensor), kapasitetsledd)
+            await self._async_backfill(now)
+
+        # Get current power consumption
+        current_power_kw = self._parse_power_kw(self.hass.states.get(self.power_sensor))
 
         # Reset at new month
         if now.month != self._current_month:
-            # Save previous month's data before reset
-            self._previous_month_consumption = self._monthly_consumption.copy()
-            self._previous_month_top_3 = self._get_top_3_days()
-            # Format: "januar 2026" (Norwegian month name)
-            prev_month_date = now.replace(day=1) - timedelta(days=1)
-            self._previous_month_name = self._format_month_name(prev_month_date)
-
-            # Reset current month data
-            self._daily_max_power = {}
-            self._monthly_consumption = {"dag": 0.0, "natt": 0.0}
-            self._current_month = now.month
-            await self._save_stored_data()
+            self._roll_month(now, current_power_kw)
+            await self.async_flush_stored_data()
 
-        # Get current power consumption
-        power_state = self.hass.states.get(self.power_sensor)
-        current_power_w = (
-            float(power_state.state) if power_state and power_state.state not in ("unknown", "unavailable") else 0
-        )
-        current_power_kw = current_power_w / 1000
-
-        # Calculate energy consumption since last update (riemann sum)
-        consumption_updated = False
-        if self._last_update is not None and current_power_kw > 0:
-            elapsed_hours = (now - self._last_update).total_seconds() / 3600
-            energy_kwh = current_power_kw * elapsed_hours
-            # Add to appropriate tariff bucket
-            tariff = "dag" if self._is_day_rate(now) else "natt"
-            self._monthly_consumption[tariff] += energy_kwh
-            consumption_updated = True
-        self._last_update = now
-
-        # Update daily max
-        today_str = now.strftime("%Y-%m-%d")
-        old_max = self._daily_max_power.get(today_str, 0)
-        new_max = max(old_max, current_power_kw)
-        if new_max > old_max:
-            self._daily_max_power[today_str] = new_max
-
-        # Save if anything changed
-        if new_max > old_max or consumption_updated:
-            await self._save_stored_data()
-
-        # Get top 3 days
+        if self.energy_sensor:
+            # Book the register delta if the meter has reported since last time
+            consumption_updated = self._read_energy_meter(now, self.hass.states.get(self.energy_sensor))
+            self._accumulator.last_power_kw = current_power_kw
+        else:
+            # Fold current power into hourly energy and peak.
+            # With event ingestion every state change has already been folded in,
+            # so this only closes the interval up to now at the held reading.
+            consumption_updated = self._accumulator.add_sample(
+                now, current_power_kw, method="left" if self.event_ingestion else None
+            )
+
+        # Save (debounced) if anything changed
+        if consumption_updated:
+            self._async_schedule_save()
+
+        # Get top days (kept up to date incrementally by the accumulator)
         top_3 = self._get_top_3_days()
-        avg_power = sum(top_3.values()) / 3 if len(top_3) >= 3 else sum(top_3.values()) / max(len(top_3), 1)
+        avg_power = self._accumulator.top_days.average
 
         # Calculate capacity tier
-        kapasitetsledd, trinn_nummer, trinn_intervall = self._get_kapasitetsledd(avg_power)
+        kapasitetsledd, trinn_nummer, trinn_intervall = self.capacity_tiers.lookup(avg_power)
+        self._update_headroom(now)
 
         # Calculate energiledd
         energiledd = self._get_energiledd(now)
 
         # Get spot price
         spot_state = self.hass.states.get(self.spot_price_sensor)
-        spot_price = float(spot_state.state) if spot_state and spot_state.state not in ("unknown", "unavailable") else 0
+        spot_price = self._parse_spot_price(spot_state)
 
-        # Calculate strømstøtte
+        # Strømstøtte, totalpriser og sammenligning med Norgespris regnes ut av samme
+        # funksjon som priskurven for i dag og i morgen (se prices.py)
         # Forskrift § 5: 90% av spotpris over 77 øre/kWh eks. mva (96,25 øre inkl. mva) i 2026
         # Kilde: https://lovdata.no/dokument/SF/forskrift/2025-09-08-1791
-        stromstotte: float
-        if self.har_norgespris:
-            # Norgespris: Ingen strømstøtte (kan ikke kombineres)
-            stromstotte = 0.0
-        elif spot_price > STROMSTOTTE_LEVEL:
-            stromstotte = (spot_price - STROMSTOTTE_LEVEL) * STROMSTOTTE_RATE
-        else:
-            stromstotte = 0.0
-
-        # Spotpris etter strømstøtte
-        spotpris_etter_stotte = spot_price - stromstotte
-
-        # Calculate fastledd per kWh
-        days_in_month = self._days_in_month(now)
-        fastledd_per_kwh = (kapasitetsledd / days_in_month) / 24
+        params = self._price_params(now, kapasitetsledd)
+        current = calculate_prices([spot_price], [self._is_day_rate(now)], params)
+        stromstotte = current.stromstotte[0]
+        spotpris_etter_stotte = current.spotpris_etter_stotte[0]
+        total_price = current.total_price[0]
+        total_price_uten_stotte = current.total_price_uten_stotte[0]
+        total_price_inkl_avgifter = current.total_price_inkl_avgifter[0]
+        # Positiv = du betaler mer enn Norgespris, negativ = mindre (0 når du HAR Norgespris)
+        kroner_spart_per_kwh = current.kroner_spart_per_kwh[0]
+        fastledd_per_kwh = params.fastledd_per_kwh
 
         # Norgespris - fast pris basert på avgiftssone
         # Kilde: https://www.regjeringen.no/no/tema/energi/strom/regjeringens-stromtiltak/id2900232/
         # Sør-Norge: 40 øre + 25% mva = 50 øre/kWh
         # Nord-Norge/Tiltakssonen: 40 øre (mva-fritak)
-        norgespris = get_norgespris_inkl_mva(self.avgiftssone)
+        norgespris = params.norgespris
 
         # Norgespris har ingen strømstøtte
         norgespris_stromstotte = 0
 
-        # Total price calculation depends on whether user has Norgespris
-        if self.har_norgespris:
-            # Bruker har Norgespris: bruk fast pris i stedet for spotpris
-            total_price = norgespris + energiledd + fastledd_per_kwh
-            total_price_uten_stotte = norgespris + energiledd + fastledd_per_kwh  # Samme som total_price
-        else:
-            # Standard: spotpris minus strømstøtte
-            total_price = spot_price - stromstotte + energiledd + fastledd_per_kwh
-            total_price_uten_stotte = spot_price + energiledd + fastledd_per_kwh
-
         # Total pris med norgespris (for sammenligning)
         total_pris_norgespris = norgespris + energiledd + fastledd_per_kwh
 
         # Offentlige avgifter (for Energy Dashboard)
-        # Forbruksavgift og Enova-avgift inkl. mva
-        mva_sats = get_mva_sats(self.avgiftssone)
-        forbruksavgift = get_forbruksavgift(self.avgiftssone, now.month)
-        forbruksavgift_inkl_mva = forbruksavgift * (1 + mva_sats)
-        enova_inkl_mva = ENOVA_AVGIFT * (1 + mva_sats)
-        offentlige_avgifter = forbruksavgift_inkl_mva + enova_inkl_mva
-
-        # Totalpris inkl. alle avgifter (for Energy Dashboard)
-        total_price_inkl_avgifter = total_price + offentlige_avgifter
-
-        # Kroner spart/tapt per kWh (sammenligning)
-        # Positiv = du betaler mer enn Norgespris
-        # Negativ = du betaler mindre enn Norgespris
-        kroner_spart_per_kwh: float
-        if self.har_norgespris:
-            kroner_spart_per_kwh = 0.0  # Ingen forskjell når du HAR Norgespris
-        else:
-            kroner_spart_per_kwh = total_price - total_pris_norgespris
+        forbruksavgift_inkl_mva, enova_inkl_mva = self._avgifter_inkl_mva(now)
+        offentlige_avgifter = params.offentlige_avgifter
+
+        # Price curve for today and tomorrow, recalculated when the spot sensor updates
+        price_curve = self._get_price_curve(spot_state, kapasitetsledd)
 
         # Get electricity company price if configured
         electricity_company_price = None
@@ -253,7 +305,9 @@ class NettleieCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignor
                 # Electricity company total = strømpris + nettleie (energiledd + kapasitetsledd per kWh)
                 electricity_company_total = electricity_company_price + energiledd + fastledd_per_kwh
 
-        return {
+        monthly_consumption = self._accumulator.monthly_consumption
+        previous_avg_top = sum(self._previous_month_top_3.values()) / max(len(self._previous_month_top_3), 1)
+        data: dict[str, Any] = {
             "energiledd": round(energiledd, 4),
             "energiledd_dag": self.energiledd_dag,
             "energiledd_natt": self.energiledd_natt,
@@ -274,6 +328,11 @@ class NettleieCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignor
             "forbruksavgift_inkl_mva": round(forbruksavgift_inkl_mva, 4),
             "enova_inkl_mva": round(enova_inkl_mva, 4),
             "offentlige_avgifter": round(offentlige_avgifter, 4),
+            # Satsene som gjelder nå, fra satshistorikken (for attributtene i snapshot)
+            "forbruksavgift_eks_mva": forbruksavgift_at(self.avgiftssone, now),
+            "enova_avgift_eks_mva": ENOVA_AVGIFT_HISTORY.at(now),
+            "stromstotte_terskel": params.stromstotte_level,
+            "price_curve": price_curve,
             "electricity_company_price": round(electricity_company_price, 4)
             if electricity_company_price is not None
             else None,
@@ -281,18 +340,23 @@ class NettleieCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignor
             if electricity_company_total is not None
             else None,
             "current_power_kw": round(current_power_kw, 2),
+            "settlement_minutes": self.settlement_minutes,
+            "current_interval_kwh": round(self._accumulator.current_interval_kwh, 3),
+            "current_interval_projection_kw": round(self._accumulator.current_interval_projection_kw(now), 2),
+            "uncovered_seconds_hour": round(self._accumulator.uncovered_seconds_in_hour(now)),
+            "uncovered_minutes_month": round(sum(self._accumulator.uncovered_seconds) / 60, 1),
             "avg_top_3_kw": round(avg_power, 2),
+            "capacity_headroom": self.headroom,
             "top_3_days": top_3,
             "is_day_rate": self._is_day_rate(now),
             "tso": self.tso["name"],
             "har_norgespris": self.har_norgespris,
             "avgiftssone": self.avgiftssone,
             # Monthly consumption tracking
-            "monthly_consumption_dag_kwh": round(self._monthly_consumption["dag"], 3),
-            "monthly_consumption_natt_kwh": round(self._monthly_consumption["natt"], 3),
-            "monthly_consumption_total_kwh": round(
-                self._monthly_consumption["dag"] + self._monthly_consumption["natt"], 3
-            ),
+            "monthly_consumption_dag_kwh": round(monthly_consumption["dag"], 3),
+            "monthly_consumption_natt_kwh": round(monthly_consumption["natt"], 3),
+            "monthly_consumption_total_kwh": round(monthly_consumption["dag"] + monthly_consumption["natt"], 3),
+            "monthly_costs": self.ledger.summary(kapasitetsledd),
             # Previous month data for invoice verification
             "previous_month_consumption_dag_kwh": round(self._previous_month_consumption["dag"], 3),
             "previous_month_consumption_natt_kwh": round(self._previous_month_consumption["natt"], 3),
@@ -300,36 +364,173 @@ class NettleieCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignor
                 self._previous_month_consumption["dag"] + self._previous_month_consumption["natt"], 3
             ),
             "previous_month_top_3": self._previous_month_top_3,
-            "previous_month_avg_top_3_kw": round(
-                sum(self._previous_month_top_3.values()) / max(len(self._previous_month_top_3), 1), 2
-            )
-            if self._previous_month_top_3
-            else 0.0,
+            "previous_month_avg_top_3_kw": round(previous_avg_top, 2),
             "previous_month_name": self._previous_month_name,
+            "previous_month_costs": self._previous_month_ledger.summary(
+                self.capacity_tiers.price(previous_avg_top) if self._previous_month_top_3 else 0
+            ),
         }
+        snapshot = build_snapshot(
+            data,
+            avgiftssone=self.avgiftssone,
+            month=now.month,
+            tariff_periods=self.tariff_calendar.describe(),
+        )
+        self.changed_sensors = snapshot.changed(self.snapshot)
+        self.snapshot = snapshot
+        return data
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_start_event_ingestion(self) -> None:
+        """Subscribe to power and energy sensor state changes if event ingestion is enabled.
+
+        Every sample is folded into the energy and peak accumulators as it
+        arrives. The price and derived-value recompute stays on the regular
+        coordinator schedule, so this does not add any refresh cost.
+        """
+        if not self.event_ingestion:
+            return
+        if self.power_sensor:
+            self.entry.async_on_unload(
+                async_track_state_change_event(self.hass, [self.power_sensor], self._async_handle_power_event)
+            )
+        if self.energy_sensor:
+            self.entry.async_on_unload(
+                async_track_state_change_event(self.hass, [self.energy_sensor], self._async_handle_energy_event)
+            )
+
+    @callback  # type: ignore[untyped-decorator]
+    def _async_handle_power_event(self, event: Event[EventStateChangedData]) -> None:
+        """Fold a power sensor state change into the accumulators."""
+        now = datetime.now()
+        power_kw = self._parse_power_kw(event.data["new_state"])
+        if now.month != self._current_month:
+            self._roll_month(now, power_kw)
+            self.hass.async_create_task(self.async_flush_stored_data())
+        if self.energy_sensor:
+            # Energy comes from the meter, power only feeds the projection
+            self._accumulator.last_power_kw = power_kw
+        elif self._accumulator.add_sample(now, power_kw, method="left"):
+            self._async_schedule_save()
+        if self._update_headroom(now):
+            async_dispatcher_send(self.hass, SIGNAL_HEADROOM_UPDATED.format(self.entry.entry_id))
+
+    @callback  # type: ignore[untyped-decorator]
+    def _async_handle_energy_event(self, event: Event[EventStateChangedData]) -> None:
+        """Book an energy meter reading as it arrives."""
+        now = datetime.now()
+        if now.month != self._current_month:
+            self._roll_month(now, 0.0)
+            self.hass.async_create_task(self.async_flush_stored_data())
+        if self._read_energy_meter(now, event.data["new_state"]):
+            self._async_schedule_save()
+        if self._update_headroom(now):
+            async_dispatcher_send(self.hass, SIGNAL_HEADROOM_UPDATED.format(self.entry.entry_id))
+
+    def _read_energy_meter(self, now: datetime, state: State | None) -> bool:
+        """Book the energy since the previous meter reading. Returns True if anything changed.
+
+        The delta is spread evenly over the time since the previous reading.
+        Repeated readings are skipped, so the poll and events can both call this.
+        """
+        reading_kwh = self._parse_energy_kwh(state)
+        if reading_kwh is None or reading_kwh == self._meter.last_reading:
+            return False
+        first_reading = self._meter.last_reading is None
+        energy_kwh = self._meter.delta(reading_kwh)
+        if first_reading:
+            # Nothing to compare with yet, start counting from here
+            self._accumulator.last_sample = max(self._accumulator.last_sample or now, now)
+            return True
+        if energy_kwh <= 0:
+            # Jitter below the previous reading, wait for the register to move on
+            return False
+        self._accumulator.add_energy(now, energy_kwh)
+        return True
+
+    @staticmethod
+    def _parse_energy_kwh(state: State | None) -> float | None:
+        """Parse a cumulative energy sensor state to kWh, None if unknown."""
+        if state is None or state.state in ("unknown", "unavailable"):
+            return None
+        try:
+            value = float(state.state)
+        except ValueError:
+            return None
+        return value * ENERGY_UNIT_TO_KWH.get(state.attributes.get("unit_of_measurement", "kWh"), 1.0)
+
+    @staticmethod
+    def _parse_spot_price(state: State | None) -> float:
+        """Parse the spot price sensor state (NOK/kWh), treating unknown states as 0."""
+        if state is None or state.state in ("unknown", "unavailable"):
+            return 0.0
+        try:
+            return float(state.state)
+        except ValueError:
+            return 0.0
+
+    @staticmethod
+    def _parse_power_kw(state: State | None) -> float:
+        """Parse a power sensor state (W) to kW, treating unknown states as 0."""
+        if state is None or state.state in ("unknown", "unavailable"):
+            return 0.0
+        try:
+            return float(state.state) / 1000
+        except ValueError:
+            return 0.0
+
+    def _roll_month(self, now: datetime, power_kw: float) -> None:
+        """Move current month data to previous month and reset."""
+        # Book energy up to midnight and close the last hour of the old month
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        if self.energy_sensor:
+            # Metered energy since the last reading lands in the new month with the next delta
+            self._accumulator.advance_to(month_start, 0.0)
+        else:
+            self._accumulator.advance_to(month_start, power_kw, method="left" if self.event_ingestion else None)
+
+        # Save previous month's data before reset
+        self._previous_month_consumption = self._accumulator.monthly_consumption.copy()
+        self._previous_month_top_3 = self._get_top_3_days()
+        # Format: "januar 2026" (Norwegian month name)
+        prev_month_date = now.replace(day=1) - timedelta(days=1)
+        self._previous_month_name = self._format_month_name(prev_month_date)
+        self._previous_month_ledger = self.ledger.copy()
+
+        # Reset current month data
+        self._accumulator.reset_month()
+        self.ledger.reset()
+        self._current_month = now.month
+        self._month_start = now.date().replace(day=1)
 
     def _get_top_3_days(self) -> dict[str, float]:
-        """Get the top 3 days with highest power consumption."""
-        sorted_days = sorted(self._daily_max_power.items(), key=lambda x: x[1], reverse=True)
-        return dict(sorted_days[:3])
+        """Get the top days (3 unless the TSO says otherwise) with highest power consumption."""
+        return self._accumulator.top_days.top
 
-    def _get_kapasitetsledd(self, avg_power: float) -> tuple[int, int, str]:
-        """Get kapasitetsledd based on average power.
+    def _update_headroom(self, now: datetime) -> bool:
+        """Recalculate room left before the next capacity tier. Returns True if it changed.
 
-        Returns: (price, tier_number, tier_range)
+        Uses the open interval and the tracked top days directly (no sorting),
+        so it is cheap enough to run on every power sample.
         """
-        for i, (threshold, price) in enumerate(self.kapasitetstrinn, 1):
-            if avg_power <= threshold:
-                prev_threshold = self.kapasitetstrinn[i - 2][0] if i > 1 else 0.0
-                if threshold == float("inf"):
-                    tier_range = f">{prev_threshold:.0f} kW"
-                else:
-                    tier_range = f"{prev_threshold:.0f}-{threshold:.0f} kW"
-                return price, i, tier_range
-        last_idx = len(self.kapasitetstrinn)
-        prev = self.kapasitetstrinn[-2][0] if last_idx > 1 else 0.0
-        last_price = self.kapasitetstrinn[-1][1]
-        return last_price, last_idx, f">{prev:.0f} kW"
+        ceiling = self.capacity_tiers.ceiling(self._accumulator.top_days.average)
+        if ceiling is None:
+            headroom = CapacityHeadroom(None, None, None, None, None)
+        else:
+            threshold, next_tier_cost = ceiling
+            max_interval_kw, headroom_kw = self._accumulator.interval_headroom(now, threshold)
+            projection_kw = self._accumulator.current_interval_projection_kw(now)
+            headroom = CapacityHeadroom(
+                round(headroom_kw, 2),
+                round(max_interval_kw, 2),
+                threshold,
+                next_tier_cost,
+                round(projection_kw / max_interval_kw * 100, 1) if max_interval_kw > 0 else None,
+            )
+        if headroom == self.headroom:
+            return False
+        self.headroom = headroom
+        return True
 
     def _get_energiledd(self, now: datetime) -> float:
         """Get energiledd based on time of day."""
@@ -339,15 +540,188 @@ class NettleieCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignor
 
     def _is_day_rate(self, now: datetime) -> bool:
         """Check if current time is day rate."""
-        date_mm_dd = now.strftime("%m-%d")
-        date_yyyy_mm_dd = now.strftime("%Y-%m-%d")
+        return self.tariff_calendar.is_day(now)
 
-        is_fixed_holiday = date_mm_dd in HELLIGDAGER_FASTE
-        is_moving_holiday = date_yyyy_mm_dd in HELLIGDAGER_BEVEGELIGE
-        is_weekend = now.weekday() >= 5
-        is_night = now.hour < 6 or now.hour >= 22
+    def _book_cost(self, interval_start: datetime, energy_kwh: float) -> None:
+        """Book energy from the accumulator in the cost ledger and the hourly archive."""
+        rates = self._interval_rates(interval_start)
+        cost_before = self.ledger.energy_cost_kr
+        self.ledger.book(energy_kwh, rates)
+        self._archive_energy(interval_start, energy_kwh, rates, self.ledger.energy_cost_kr - cost_before)
 
-        return not (is_fixed_holiday or is_moving_holiday or is_weekend or is_night)
+    def _archive_energy(self, interval_start: datetime, energy_kwh: float, rates: IntervalRates, cost: float) -> None:
+        """Add booked energy and its cost to the interval's hour in the archive.
+
+        The hour's totals are kept here and written over its record, so the
+        float32 record is rounded once per write rather than summed up. An
+        hour that was partly archived before a restart continues from its record.
+        """
+        if self.archive is None:
+            return
+        hour = interval_start.replace(minute=0, second=0, microsecond=0)
+        if self._archive_hour is None or (hour, hour.fold) != (self._archive_hour, self._archive_hour.fold):
+            if self._archive_hour is not None:
+                # The previous hour is done, get it to disk in the background
+                self.hass.async_add_executor_job(self.archive.flush)
+            self._archive_hour = hour
+            record = self.archive.get(hour)
+            if record is None:
+                self._archive_totals = (0.0, 0.0, 0.0, 0.0)
+            else:
+                priced_kwh = record.kwh if record.priced else 0.0
+                self._archive_totals = (record.kwh, priced_kwh, priced_kwh * record.spot_price, record.cost)
+        kwh, priced_kwh, spot_kr, cost_kr = self._archive_totals
+        kwh += energy_kwh
+        cost_kr += cost
+        if rates.spot_price is not None:
+            priced_kwh += energy_kwh
+            spot_kr += energy_kwh * rates.spot_price
+        self._archive_totals = (kwh, priced_kwh, spot_kr, cost_kr)
+        spot_price = spot_kr / priced_kwh if priced_kwh > 0 else (rates.spot_price or 0.0)
+        self.archive.write(hour, kwh, spot_price, cost_kr, rates.is_day, priced=priced_kwh >= kwh)
+
+    def _interval_rates(self, interval_start: datetime) -> IntervalRates:
+        """Prices for energy used in an interval (cached for the open interval).
+
+        Spot price and strømstøtte come from the price curve. The spot sensor's
+        current price is only used for an interval that is still live (open or
+        just closed), when the sensor has no curve. Older intervals the curve
+        does not cover (e.g. booked after downtime) get no spot price, so the
+        ledger books their nettleie and avgifter and marks the spot cost unknown.
+        """
+        if interval_start == self._rates_interval:
+            return self._rates
+        spot_price: float | None = None
+        stromstotte: float | None = None
+        for curve in self._price_curve.values():
+            if curve is not None and curve.start and curve.start[0] <= interval_start < curve.end[-1]:
+                i = bisect_right(curve.start, interval_start) - 1
+                spot_price, stromstotte = curve.spot_price[i], curve.stromstotte[i]
+                break
+        live_after = datetime.now() - timedelta(minutes=BACKFILL_MIN_GAP_MINUTES)
+        interval_end = interval_start + timedelta(minutes=self._accumulator.resolution_minutes)
+        if spot_price is None and interval_end > live_after:
+            spot_price = self._parse_spot_price(self.hass.states.get(self.spot_price_sensor))
+            stromstotte = 0.0
+            level = STROMSTOTTE_LEVEL_HISTORY.at(interval_start)
+            if not self.har_norgespris and spot_price > level:
+                stromstotte = (spot_price - level) * STROMSTOTTE_RATE
+        is_day = self._is_day_rate(interval_start)
+        forbruksavgift, enova = self._avgifter_inkl_mva(interval_start)
+        self._rates_interval = interval_start
+        # Satsene som gjaldt da energien ble brukt (f.eks. etter nedetid over et årsskifte)
+        self._rates = IntervalRates(
+            is_day,
+            self.energiledd_history.at(interval_start, is_day),
+            forbruksavgift,
+            enova,
+            spot_price,
+            stromstotte,
+        )
+        return self._rates
+
+    def _seed_ledger(self, ledger: CostLedger, consumption: dict[str, float], month_start: date) -> None:
+        """Fill a ledger from dag/natt kWh with that month's rates (data stored before costs were booked)."""
+        forbruksavgift, enova = self._avgifter_inkl_mva(month_start)
+        dag, natt = self.energiledd_history.at(month_start, True), self.energiledd_history.at(month_start, False)
+        ledger.reset()
+        ledger.book(consumption["dag"], IntervalRates(True, dag, forbruksavgift, enova, 0.0, 0.0))
+        ledger.book(consumption["natt"], IntervalRates(False, natt, forbruksavgift, enova, 0.0, 0.0))
+
+    def _avgifter_inkl_mva(self, when: date | datetime) -> tuple[float, float]:
+        """Forbruksavgift and Enova-avgift including MVA, at the rates in effect on a date."""
+        mva_sats = get_mva_sats(self.avgiftssone)
+        forbruksavgift_inkl_mva = forbruksavgift_at(self.avgiftssone, when) * (1 + mva_sats)
+        enova_inkl_mva = ENOVA_AVGIFT_HISTORY.at(when) * (1 + mva_sats)
+        return forbruksavgift_inkl_mva, enova_inkl_mva
+
+    def _price_params(self, day: datetime, kapasitetsledd: int) -> PriceParams:
+        """Price parameters for a day (fastledd and avgifter depend on the month)."""
+        forbruksavgift_inkl_mva, enova_inkl_mva = self._avgifter_inkl_mva(day)
+        return PriceParams(
+            energiledd_dag=self.energiledd_history.at(day, True),
+            energiledd_natt=self.energiledd_history.at(day, False),
+            fastledd_per_kwh=(kapasitetsledd / self._days_in_month(day)) / 24,
+            offentlige_avgifter=forbruksavgift_inkl_mva + enova_inkl_mva,
+            norgespris=get_norgespris_inkl_mva(self.avgiftssone),
+            har_norgespris=self.har_norgespris,
+            stromstotte_level=STROMSTOTTE_LEVEL_HISTORY.at(day),
+            stromstotte_rate=STROMSTOTTE_RATE,
+        )
+
+    def _get_price_curve(self, spot_state: State | None, kapasitetsledd: int) -> dict[str, PriceCurve | None]:
+        """Price curve for today and tomorrow from the spot sensor's attributes.
+
+        Only recalculated when the spot sensor, the capacity tier or the date changes.
+        """
+        if spot_state is None:
+            return {"today": None, "tomorrow": None}
+        key = (spot_state.last_updated, kapasitetsledd, datetime.now().date())
+        if key == self._price_curve_key:
+            return self._price_curve
+        self._price_curve_key = key
+
+        curve: dict[str, PriceCurve | None] = {}
+        for day, points in zip(("today", "tomorrow"), parse_spot_attributes(spot_state.attributes), strict=True):
+            if not points:
+                curve[day] = None
+                continue
+            is_day = [self._is_day_rate(start) for start, _, _ in points]
+            curve[day] = build_curve(points, is_day, self._price_params(points[0][0], kapasitetsledd))
+        self._price_curve = curve
+        # Rates for the open interval may now come from the curve
+        self._rates_interval = None
+        return curve
+
+    async def async_compare_tso(self, prisomrade: str | None = None) -> tuple[list[date], list[TsoCost]]:
+        """Consumption priced with every TSO's tariff, cheapest first, and the months used.
+
+        Uses this month so far and the archived months before it (up to
+        COMPARE_TSO_MONTHS in all). This month is copied here, reading the
+        archive and pricing run in the executor.
+        """
+        current = MonthProfile(
+            self._month_start, list(self._accumulator.interval_kwh), self._accumulator.resolution_minutes
+        )
+        result: tuple[list[date], list[TsoCost]] = await self.hass.async_add_executor_job(
+            self._compare_tso, current, prisomrade
+        )
+        return result
+
+    def _compare_tso(self, current: MonthProfile, prisomrade: str | None) -> tuple[list[date], list[TsoCost]]:
+        """Price the archived months and the current month with every TSO. Blocking, run in the executor."""
+        months: list[MonthProfile] = []
+        if self.archive is not None:
+            month_start = current.month_start
+            for _ in range(COMPARE_TSO_MONTHS - 1):
+                month_start = (month_start - timedelta(days=1)).replace(day=1)
+                hours = self.archive.month_hours(month_start.year, month_start.month)
+                if any(hours):
+                    months.insert(0, MonthProfile(month_start, hours, 60))
+        months.append(current)
+        costs = get_comparison().rank(months, prisomrade, get_mva_sats(self.avgiftssone))
+        return [month.month_start for month in months], costs
+
+    def simulate_norgespris(
+        self, start: datetime, end: datetime, imported: Sequence[tuple[datetime, float, float]] | None = None
+    ) -> list[MonthSavings]:
+        """Hours in [start, end) replayed with spot price and with Norgespris, per month.
+
+        Uses the hourly archive unless an imported series is given. Reads the
+        archive file, run in the executor.
+        """
+        if imported is not None:
+            hours: Iterable[tuple[datetime, float, float]] = (hour for hour in imported if start <= hour[0] < end)
+        elif self.archive is not None:
+            # Hours without a known spot price (e.g. after downtime) are left out
+            hours = (
+                (record.hour, record.kwh, record.spot_price)
+                for record in self.archive.records(start, end)
+                if record.priced
+            )
+        else:
+            return []
+        return list(simulate(hours, get_norgespris_inkl_mva(self.avgiftssone)))
 
     def _days_in_month(self, now: datetime) -> int:
         """Get number of days in current month."""
@@ -374,11 +748,16 @@ class NettleieCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignor
 
     async def _load_stored_data(self) -> None:
         """Load stored data from disk."""
+        self.archive = await self.hass.async_add_executor_job(
+            HourlyArchive.open, self.hass.config.path(".storage", f"{DOMAIN}_{self.tso_id}_archive.bin")
+        )
+
+        # Older versions are migrated to the current schema by the store
         data: dict[str, Any] | None = await self._store.async_load()
 
         # Migration: try to load from old entry_id based storage if new storage is empty
         if not data:
-            old_store: Store[dict[str, Any]] = Store(self.hass, 1, f"{DOMAIN}_{self.entry.entry_id}")
+            old_store = StromkalkulatorStore(self.hass, f"{DOMAIN}_{self.entry.entry_id}")
             data = await old_store.async_load()
             if data:
                 _LOGGER.info("Migrated data from old storage format")
@@ -386,27 +765,169 @@ class NettleieCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # type: ignor
                 await self._store.async_save(data)
 
         if data:
-            self._daily_max_power = data.get("daily_max_power", {})
-            self._monthly_consumption = data.get("monthly_consumption", {"dag": 0.0, "natt": 0.0})
-            self._previous_month_consumption = data.get("previous_month_consumption", {"dag": 0.0, "natt": 0.0})
-            self._previous_month_top_3 = data.get("previous_month_top_3", {})
-            self._previous_month_name = data.get("previous_month_name")
-            stored_month = data.get("current_month")
+            state = decode(data)
+            self._previous_month_consumption = state["previous_month_consumption"]
+            self._previous_month_top_3 = state["previous_month_top_3"]
+            self._previous_month_name = state["previous_month_name"]
+            if state["previous_month_costs"] is not None:
+                self._previous_month_ledger.load(state["previous_month_costs"])
+            else:
+                # Stored before costs were booked: estimate with the rates for that month
+                previous_month = (self._month_start - timedelta(days=1)).replace(day=1)
+                self._seed_ledger(self._previous_month_ledger, self._previous_month_consumption, previous_month)
             # If stored month is different, clear data
-            if stored_month and stored_month != self._current_month:
-                self._daily_max_power = {}
-                self._monthly_consumption = {"dag": 0.0, "natt": 0.0}
-            _LOGGER.debug("Loaded stored data: %s", self._daily_max_power)
+            if state["month_start"] == self._month_start:
+                self._accumulator.daily_max_power = state["daily_max_power"]
+                self._accumulator.monthly_consumption = state["monthly_consumption"]
+                self._accumulator.load_intervals(state["interval_kwh"], state["settlement_minutes"])
+                if state["current_interval"] is not None:
+                    self._accumulator.current_interval = self._accumulator.interval_start(state["current_interval"])
+                self._accumulator.last_sample = state["last_sample"]
+                self._accumulator.load_uncovered(state["uncovered_seconds"])
+                if state["costs"] is not None:
+                    self.ledger.load(state["costs"])
+                else:
+                    self._seed_ledger(self.ledger, state["monthly_consumption"], self._month_start)
+            else:
+                self._accumulator.reset_month()
+            if self.energy_sensor:
+                self._meter.last_reading = state["meter_reading"]
+            self._accumulator.top_days.rebuild(self._accumulator.daily_max_power)
+            _LOGGER.debug("Loaded stored data: %s", self._accumulator.daily_max_power)
+
+    async def _async_backfill(self, now: datetime) -> None:
+        """Replay recorder statistics for the time Home Assistant was down.
+
+        Without this the gap since the last stored sample would either be
+        lost or charged at whatever the power reading is right now.
+        """
+        last_sample = self._accumulator.last_sample
+        if last_sample is None or now - last_sample < timedelta(minutes=BACKFILL_MIN_GAP_MINUTES):
+            return
+        if self.energy_sensor and self._meter.last_reading is not None:
+            # The next register delta covers the downtime exactly
+            return
+
+        segments: list[tuple[datetime, datetime, float]] = []
+        if "recorder" in self.hass.config.components and (self.power_sensor or self.energy_sensor):
+            from homeassistant.components.recorder import get_instance
+
+            # Only the current month's energy lives in the accumulator
+            start = max(last_sample, datetime.combine(self._month_start, time.min))
+            start = start.replace(minute=0, second=0, microsecond=0)
+            if self.power_sensor:
+                segments = await get_instance(self.hass).async_add_executor_job(
+                    self._fetch_power_statistics, start, now
+                )
+            else:
+                # Without a power sensor, use the energy sensor's hourly sums.
+                # One hour earlier, so the first hour has a sum to subtract.
+                segments = await get_instance(self.hass).async_add_executor_job(
+                    self._fetch_energy_statistics, start - timedelta(hours=1), now
+                )
+
+        booked_kwh = self._accumulator.backfill(segments, now)
+        _LOGGER.info(
+            "Recovered %.3f kWh from %d hours of statistics after %s downtime",
+            booked_kwh,
+            len(segments),
+            now - last_sample,
+        )
+        self._async_schedule_save()
+
+    def _fetch_power_statistics(self, start: datetime, end: datetime) -> list[tuple[datetime, datetime, float]]:
+        """Fetch hourly mean power (kW) for the power sensor. Runs in the recorder executor."""
+        from homeassistant.components.recorder.statistics import statistics_during_period
+
+        stats = statistics_during_period(
+            self.hass,
+            start.astimezone(),
+            end.astimezone(),
+            {self.power_sensor},
+            "hour",
+            {"power": "kW"},
+            {"mean"},
+        )
+        return [
+            (datetime.fromtimestamp(row["start"]), datetime.fromtimestamp(row["end"]), row["mean"])
+            for row in stats.get(self.power_sensor, [])
+            if row.get("mean") is not None
+        ]
 
-    async def _save_stored_data(self) -> None:
-        """Save data to disk."""
-        data: dict[str, Any] = {
-            "daily_max_power": self._daily_max_power,
-            "monthly_consumption": self._monthly_consumption,
-            "current_month": self._current_month,
+    def _fetch_energy_statistics(self, start: datetime, end: datetime) -> list[tuple[datetime, datetime, float]]:
+        """Fetch hourly average power (kW) from the energy sensor's sums. Runs in the recorder executor."""
+        from homeassistant.components.recorder.statistics import statistics_during_period
+
+        stats = statistics_during_period(
+            self.hass,
+            start.astimezone(),
+            end.astimezone(),
+            {self.energy_sensor},
+            "hour",
+            {"energy": "kWh"},
+            {"sum"},
+        )
+        return energy_sum_segments(
+            (datetime.fromtimestamp(row["end"]), row["sum"])
+            for row in stats.get(self.energy_sensor, [])
+            if row.get("sum") is not None
+        )
+
+    @callback  # type: ignore[untyped-decorator]
+    def _async_schedule_save(self) -> None:
+        """Mark stored data dirty and schedule a coalesced write.
+
+        Only the first change in a window schedules a write, later changes
+        ride along with it. Store.async_delay_save restarts its timer on every
+        call, so calling it each tick would postpone the write indefinitely.
+        Pending writes are flushed by Store on Home Assistant shutdown.
+        """
+        self.save_requests += 1
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, self.save_delay)
+
+    async def async_flush_stored_data(self) -> None:
+        """Write stored data to disk now (unload, month rollover)."""
+        if not self._store_loaded:
+            # Never overwrite stored data with an empty state
+            return
+        await self._store.async_save(self._data_to_save())
+        if self.archive is not None:
+            await self.hass.async_add_executor_job(self.archive.flush)
+        _LOGGER.debug("Flushed stored data")
+
+    async def async_close_archive(self) -> None:
+        """Release the archive file mapping (unload)."""
+        if self.archive is not None:
+            archive, self.archive = self.archive, None
+            await self.hass.async_add_executor_job(archive.close)
+
+    @property
+    def writes_avoided(self) -> int:
+        """Number of save requests coalesced into another write."""
+        return max(self.save_requests - self.store_writes, 0)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Build the data to persist. Called by Store at write time."""
+        self._save_pending = False
+        self.store_writes += 1
+        state: StoredState = {
+            "month_start": self._month_start,
+            "settlement_minutes": self.settlement_minutes,
+            "interval_kwh": self._accumulator.interval_kwh,
+            "daily_max_power": self._accumulator.daily_max_power,
+            "monthly_consumption": self._accumulator.monthly_consumption,
+            "current_interval": self._accumulator.current_interval,
+            "last_sample": self._accumulator.last_sample,
+            "meter_reading": self._meter.last_reading if self.energy_sensor else None,
+            "uncovered_seconds": self._accumulator.uncovered_seconds,
+            "costs": self.ledger.totals(),
             "previous_month_consumption": self._previous_month_consumption,
             "previous_month_top_3": self._previous_month_top_3,
             "previous_month_name": self._previous_month_name,
+            "previous_month_costs": self._previous_month_ledger.totals(),
         }
-        await self._store.async_save(data)
-        _LOGGER.debug("Saved data: %s", data)
+        _LOGGER.debug("Saving data: %s", self._accumulator.daily_max_power)
+        return encode(state)
@@ -15,8 +15,14 @@ from .const import (
     CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR,
     CONF_ENERGILEDD_DAG,
     CONF_ENERGILEDD_NATT,
+    CONF_ENERGY_SENSOR,
+    CONF_EVENT_INGESTION,
     CONF_HAR_NORGESPRIS,
+    CONF_INTEGRATION_METHOD,
+    CONF_MAX_GAP_SECONDS,
     CONF_POWER_SENSOR,
+    CONF_SAVE_DELAY,
+    CONF_SETTLEMENT_MINUTES,
     CONF_SPOT_PRICE_SENSOR,
     CONF_TSO,
 )
@@ -44,19 +50,44 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
                 "har_norgespris": entry.data.get(CONF_HAR_NORGESPRIS),
                 "energiledd_dag_override": entry.data.get(CONF_ENERGILEDD_DAG),
                 "energiledd_natt_override": entry.data.get(CONF_ENERGILEDD_NATT),
+                "event_ingestion": entry.data.get(CONF_EVENT_INGESTION, False),
+                "settlement_minutes": entry.data.get(CONF_SETTLEMENT_MINUTES),
+                "save_delay": entry.data.get(CONF_SAVE_DELAY),
+                "integration_method": entry.data.get(CONF_INTEGRATION_METHOD),
+                "max_gap_seconds": entry.data.get(CONF_MAX_GAP_SECONDS),
             },
         },
         "sensor_entity_ids": {
             "power_sensor": entry.data.get(CONF_POWER_SENSOR),
+            "energy_sensor": entry.data.get(CONF_ENERGY_SENSOR),
             "spot_price_sensor": entry.data.get(CONF_SPOT_PRICE_SENSOR),
             "electricity_provider_price_sensor": entry.data.get(CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR),
         },
         "tso_info": {
-            "id": coordinator._tso_id,
+            "id": coordinator.tso_id,
             "name": coordinator.tso.get("name"),
             "energiledd_dag": coordinator.energiledd_dag,
             "energiledd_natt": coordinator.energiledd_natt,
-            "kapasitetstrinn_count": len(coordinator.kapasitetstrinn),
+            "kapasitetstrinn_count": len(coordinator.capacity_tiers),
         },
-        "coordinator_data": coordinator.data if coordinator.data else {},
+        "storage": {
+            "save_delay_s": coordinator.save_delay,
+            "save_requests": coordinator.save_requests,
+            "store_writes": coordinator.store_writes,
+            "writes_avoided": coordinator.writes_avoided,
+        },
+        "entity_updates": {
+            "state_writes": coordinator.state_writes,
+            "state_writes_skipped": coordinator.state_writes_skipped,
+            "changed_last_refresh": sorted(coordinator.changed_sensors),
+        },
+        "archive": {
+            "capacity_hours": coordinator.archive.capacity if coordinator.archive else 0,
+            "stored_hours": coordinator.archive.count() if coordinator.archive else 0,
+        },
+        "price_curve_intervals": {
+            day: len(curve.start) if curve else 0
+            for day, curve in (coordinator.data or {}).get("price_curve", {}).items()
+        },
+        "coordinator_data": {key: value for key, value in (coordinator.data or {}).items() if key != "price_curve"},
     }
@@ -0,0 +1,48 @@
+"""Norwegian public holidays for Strømkalkulator."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from functools import lru_cache
+
+from .const import HELLIGDAGER_FASTE
+
+# Bevegelige helligdager som dager fra 1. påskedag
+_EASTER_OFFSETS: dict[int, str] = {
+    -3: "Skjærtorsdag",
+    -2: "Langfredag",
+    0: "1. påskedag",
+    1: "2. påskedag",
+    39: "Kristi himmelfartsdag",
+    49: "1. pinsedag",
+    50: "2. pinsedag",
+}
+
+
+def easter_sunday(year: int) -> date:
+    """1. påskedag (Gregorian computus, anonymous algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+@lru_cache(maxsize=8)
+def moving_holidays(year: int) -> frozenset[date]:
+    """Easter-based holidays (påske, Kristi himmelfart, pinse) for a year."""
+    easter = easter_sunday(year)
+    return frozenset(easter + timedelta(days=offset) for offset in _EASTER_OFFSETS)
+
+
+@lru_cache(maxsize=8)
+def norwegian_holidays(year: int) -> frozenset[date]:
+    """All public holidays for a year (fixed and Easter-based)."""
+    fixed = {date(year, int(mm_dd[:2]), int(mm_dd[3:])) for mm_dd in HELLIGDAGER_FASTE}
+    return frozenset(fixed) | moving_holidays(year)
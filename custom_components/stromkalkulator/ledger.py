@@ -0,0 +1,142 @@
+"""Monthly cost ledger for Strømkalkulator."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from .const import STROMSTOTTE_MAX_KWH
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class IntervalRates(NamedTuple):
+    """Prices per kWh for energy used in one settlement interval (NOK, inkl. mva).
+
+    Spot price and strømstøtte are None when the interval's spot price is unknown.
+    """
+
+    is_day: bool
+    energiledd: float
+    forbruksavgift: float
+    enova: float
+    spot_price: float | None
+    stromstotte: float | None
+
+
+class CostLedger:
+    """Running cost totals for a month, booked as energy arrives.
+
+    Each booking adds kWh x the rates for the interval the energy was used
+    in, so the totals reflect the prices at the time rather than today's
+    prices applied to the whole month. Reading a total is O(1).
+    Strømstøtte is only given for the month's first ``stromstotte_max_kwh``.
+    Energy without a known spot price gets nettleie and avgifter only and is
+    counted in ``unpriced_kwh``, so spot cost and strømstøtte are marked incomplete.
+    """
+
+    # Stored fields, in this order
+    FIELDS: tuple[str, ...] = (
+        "energiledd_dag_kr",
+        "energiledd_natt_kr",
+        "forbruksavgift_kr",
+        "enova_kr",
+        "spot_kr",
+        "stromstotte_kr",
+        "stromstotte_kwh",
+        "unpriced_kwh",
+    )
+
+    energiledd_dag_kr: float
+    energiledd_natt_kr: float
+    forbruksavgift_kr: float
+    enova_kr: float
+    spot_kr: float
+    stromstotte_kr: float
+    stromstotte_kwh: float
+    unpriced_kwh: float
+    stromstotte_max_kwh: float
+
+    def __init__(self, stromstotte_max_kwh: float = STROMSTOTTE_MAX_KWH) -> None:
+        """Initialize an empty ledger."""
+        self.stromstotte_max_kwh = stromstotte_max_kwh
+        self.reset()
+
+    @property
+    def energiledd_kr(self) -> float:
+        """Energiledd dag + natt."""
+        return self.energiledd_dag_kr + self.energiledd_natt_kr
+
+    @property
+    def avgifter_kr(self) -> float:
+        """Forbruksavgift + Enova-avgift."""
+        return self.forbruksavgift_kr + self.enova_kr
+
+    @property
+    def energy_cost_kr(self) -> float:
+        """Everything booked per kWh: spot price, energiledd and avgifter minus strømstøtte."""
+        return self.spot_kr + self.energiledd_kr + self.avgifter_kr - self.stromstotte_kr
+
+    def book(self, energy_kwh: float, rates: IntervalRates) -> None:
+        """Book energy used in an interval at that interval's rates."""
+        if rates.is_day:
+            self.energiledd_dag_kr += energy_kwh * rates.energiledd
+        else:
+            self.energiledd_natt_kr += energy_kwh * rates.energiledd
+        self.forbruksavgift_kr += energy_kwh * rates.forbruksavgift
+        self.enova_kr += energy_kwh * rates.enova
+        # Strømstøtte for the part of the energy still under the monthly cap.
+        # Energy without a spot price still uses up the cap.
+        capped_kwh = min(energy_kwh, max(self.stromstotte_max_kwh - self.stromstotte_kwh, 0.0))
+        self.stromstotte_kwh += capped_kwh
+        if rates.spot_price is None or rates.stromstotte is None:
+            self.unpriced_kwh += energy_kwh
+            return
+        self.spot_kr += energy_kwh * rates.spot_price
+        self.stromstotte_kr += capped_kwh * rates.stromstotte
+
+    def summary(self, kapasitetsledd: float) -> dict[str, float]:
+        """Rounded totals for the sensors, with the month's kapasitetsledd added to nettleie."""
+        nettleie = self.energiledd_kr + kapasitetsledd
+        return {
+            "energiledd_dag_kr": round(self.energiledd_dag_kr, 2),
+            "energiledd_natt_kr": round(self.energiledd_natt_kr, 2),
+            "kapasitetsledd_kr": kapasitetsledd,
+            "nettleie_kr": round(nettleie, 2),
+            "forbruksavgift_kr": round(self.forbruksavgift_kr, 2),
+            "enovaavgift_kr": round(self.enova_kr, 2),
+            "avgifter_kr": round(self.avgifter_kr, 2),
+            "spotpris_kr": round(self.spot_kr, 2),
+            "stromstotte_kr": round(self.stromstotte_kr, 2),
+            "stromstotte_kwh": round(self.stromstotte_kwh, 3),
+            # Spotpris og strømstøtte mangler for denne energien (f.eks. etter nedetid)
+            "spotpris_ukjent_kwh": round(self.unpriced_kwh, 3),
+            # Nettleie + avgifter - strømstøtte (uten spotpris, som på nettleiefakturaen)
+            "total_kr": round(nettleie + self.avgifter_kr - self.stromstotte_kr, 2),
+        }
+
+    def reset(self) -> None:
+        """Clear all totals for a new month."""
+        self.energiledd_dag_kr = 0.0
+        self.energiledd_natt_kr = 0.0
+        self.forbruksavgift_kr = 0.0
+        self.enova_kr = 0.0
+        self.spot_kr = 0.0
+        self.stromstotte_kr = 0.0
+        self.stromstotte_kwh = 0.0
+        self.unpriced_kwh = 0.0
+
+    def copy(self) -> CostLedger:
+        """Independent copy (e.g. to keep as previous month)."""
+        ledger = CostLedger(self.stromstotte_max_kwh)
+        ledger.load(self.totals())
+        return ledger
+
+    def totals(self) -> dict[str, float]:
+        """All totals as {field: value} (for storage)."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def load(self, totals: Mapping[str, float]) -> None:
+        """Load stored totals, missing fields are zero."""
+        for field in self.FIELDS:
+            setattr(self, field, float(totals.get(field, 0.0)))
@@ -0,0 +1,192 @@
+"""Day-ahead price curve for Strømkalkulator."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+# Antall priser per døgn (23/25 ved sommertid-skifte) og oppløsningen det tilsvarer
+_RESOLUTION_BY_COUNT: dict[range, int] = {
+    range(23, 26): 60,
+    range(92, 101): 15,
+}
+
+
+class PriceParams(NamedTuple):
+    """Everything but the spot price that goes into the price for one day."""
+
+    energiledd_dag: float
+    energiledd_natt: float
+    fastledd_per_kwh: float
+    offentlige_avgifter: float
+    norgespris: float
+    har_norgespris: bool
+    stromstotte_level: float
+    stromstotte_rate: float
+
+
+class PriceCurve(NamedTuple):
+    """Derived price columns, one entry per spot price interval."""
+
+    start: list[datetime]
+    end: list[datetime]
+    spot_price: list[float]
+    stromstotte: list[float]
+    spotpris_etter_stotte: list[float]
+    energiledd: list[float]
+    total_price: list[float]
+    total_price_uten_stotte: list[float]
+    total_price_inkl_avgifter: list[float]
+    kroner_spart_per_kwh: list[float]
+
+    def as_rows(self, digits: int = 4) -> list[dict[str, Any]]:
+        """One dict per interval (for attributes and service responses)."""
+        columns = self._asdict()
+        return [
+            {
+                name: values[i].isoformat() if isinstance(values[i], datetime) else round(values[i], digits)
+                for name, values in columns.items()
+            }
+            for i in range(len(self.start))
+        ]
+
+
+def calculate_prices(spot: Sequence[float], is_day: Sequence[bool], params: PriceParams) -> PriceCurve:
+    """Calculate every derived price column for a list of spot prices in one pass.
+
+    The same formula is used for the current price, so the curve and the
+    price sensors always agree. start/end are left empty, see build_curve.
+    """
+    n = len(spot)
+    stromstotte = [0.0] * n
+    etter_stotte = [0.0] * n
+    energiledd = [0.0] * n
+    total = [0.0] * n
+    uten_stotte = [0.0] * n
+    inkl_avgifter = [0.0] * n
+    spart = [0.0] * n
+
+    fastledd = params.fastledd_per_kwh
+    avgifter = params.offentlige_avgifter
+    norgespris = params.norgespris
+    level = params.stromstotte_level
+    rate = params.stromstotte_rate
+
+    for i in range(n):
+        spot_price = spot[i]
+        energiledd[i] = params.energiledd_dag if is_day[i] else params.energiledd_natt
+        nettleie = energiledd[i] + fastledd
+        total_norgespris = norgespris + nettleie
+
+        if params.har_norgespris:
+            # Norgespris: fast pris, ingen strømstøtte
+            etter_stotte[i] = spot_price
+            total[i] = uten_stotte[i] = total_norgespris
+        else:
+            # Strømstøtte: 90 % av spotpris over terskel
+            stotte = (spot_price - level) * rate if spot_price > level else 0.0
+            stromstotte[i] = stotte
+            etter_stotte[i] = spot_price - stotte
+            total[i] = spot_price - stotte + nettleie
+            uten_stotte[i] = spot_price + nettleie
+            spart[i] = total[i] - total_norgespris
+
+        inkl_avgifter[i] = total[i] + avgifter
+
+    return PriceCurve(
+        [], [], list(spot), stromstotte, etter_stotte, energiledd, total, uten_stotte, inkl_avgifter, spart
+    )
+
+
+def build_curve(
+    points: Sequence[tuple[datetime, datetime, float]],
+    is_day: Sequence[bool],
+    params: PriceParams,
+) -> PriceCurve:
+    """Price curve for (start, end, spot) points from parse_spot_attributes."""
+    curve = calculate_prices([spot for _, _, spot in points], is_day, params)
+    return curve._replace(start=[start for start, _, _ in points], end=[end for _, end, _ in points])
+
+
+def parse_spot_attributes(
+    attributes: Mapping[str, Any],
+) -> tuple[list[tuple[datetime, datetime, float]], list[tuple[datetime, datetime, float]]]:
+    """Today's and tomorrow's spot prices from a Nord Pool or ENTSO-E sensor.
+
+    Supported attribute formats:
+    - Nord Pool: raw_today/raw_tomorrow as [{start, end, value}], or today/tomorrow as plain lists
+    - ENTSO-E: prices_today/prices_tomorrow as [{time, price}]
+
+    Times are returned as naive local time, like the rest of the coordinator.
+    Missing or unknown values give an empty list for that day.
+    """
+    return _parse_day(attributes, "today"), _parse_day(attributes, "tomorrow")
+
+
+def _parse_day(attributes: Mapping[str, Any], day: str) -> list[tuple[datetime, datetime, float]]:
+    """Spot prices for one day ("today" or "tomorrow")."""
+    raw = attributes.get(f"raw_{day}")
+    if raw:
+        return _parse_rows(raw, "start", "value")
+
+    entsoe = attributes.get(f"prices_{day}")
+    if entsoe:
+        return _parse_rows(entsoe, "time", "price")
+
+    values = attributes.get(day)
+    if not values:
+        return []
+    resolution = next((minutes for counts, minutes in _RESOLUTION_BY_COUNT.items() if len(values) in counts), None)
+    if resolution is None:
+        return []
+    # Plain lists carry no timestamps, so they are placed from local midnight
+    midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    if day == "tomorrow":
+        midnight += timedelta(days=1)
+    step = timedelta(minutes=resolution)
+    points = []
+    for i, value in enumerate(values):
+        if value is None:
+            return []
+        start = midnight + i * step
+        points.append((start, start + step, float(value)))
+    return points
+
+
+def _parse_rows(
+    rows: Sequence[Mapping[str, Any]], time_key: str, price_key: str
+) -> list[tuple[datetime, datetime, float]]:
+    """Parse rows with a start time and a price; end is taken from the next row when missing."""
+    parsed: list[tuple[datetime, datetime | None, float]] = []
+    for row in rows:
+        try:
+            start = _local_naive(row[time_key])
+            end = _local_naive(row["end"]) if row.get("end") else None
+            value = float(row[price_key])
+        except (KeyError, TypeError, ValueError):
+            return []
+        parsed.append((start, end, value))
+    parsed.sort(key=lambda point: point[0])
+
+    points: list[tuple[datetime, datetime, float]] = []
+    for i, (start, end, value) in enumerate(parsed):
+        if end is None:
+            if i + 1 < len(parsed):
+                end = parsed[i + 1][0]
+            elif i > 0:
+                end = start + (start - parsed[i - 1][0])
+            else:
+                end = start + timedelta(hours=1)
+        points.append((start, end, value))
+    return points
+
+
+def _local_naive(value: datetime | str) -> datetime:
+    """Datetime or ISO string as naive local time."""
+    dt = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone().replace(tzinfo=None)
+    return dt
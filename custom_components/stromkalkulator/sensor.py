@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,26 +10,20 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import EntityCategory
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    AVGIFTSSONE_STANDARD,
-    CONF_AVGIFTSSONE,
-    CONF_TSO,
-    DOMAIN,
-    ENOVA_AVGIFT,
-    STROMSTOTTE_LEVEL,
-    TSO_LIST,
-    get_forbruksavgift,
-    get_mva_sats,
-)
+from .const import DOMAIN, SIGNAL_HEADROOM_UPDATED
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .capacity import CapacityHeadroom
     from .coordinator import NettleieCoordinator
+    from .snapshot import SensorSnapshot
     from .tso import TSOEntry
 
 # Device group constants
@@ -58,6 +51,7 @@ async def async_setup_entry(
         MaksForbrukSensor(coordinator, entry, 2),
         MaksForbrukSensor(coordinator, entry, 3),
         GjsForbrukSensor(coordinator, entry),
+        EffektromSensor(coordinator, entry),
         TrinnNummerSensor(coordinator, entry),
         TrinnIntervallSensor(coordinator, entry),
         KapasitetstrinnSensor(coordinator, entry),
@@ -103,14 +97,23 @@ async def async_setup_entry(
 
 
 class NettleieBaseSensor(CoordinatorEntity, SensorEntity):  # type: ignore[misc]
-    """Base class for Strømkalkulator sensors."""
+    """Base class for Strømkalkulator sensors.
+
+    State and attributes come from the coordinator's snapshot, computed once
+    per refresh for all sensors (see snapshot.py). State is only written when
+    the sensor's entry in the snapshot or its availability changed. Each
+    sensor lists its own static attributes in _unrecorded_attributes, so the
+    recorder only stores what follows consumption and prices.
+    """
 
     _attr_has_entity_name = True
     _device_group: str = DEVICE_NETTLEIE
     _attr_unique_id: str
     _attr_translation_key: str
     _entry: ConfigEntry
+    _sensor_type: str
     _tso: TSOEntry
+    _written_available: bool | None = None
 
     def __init__(
         self,
@@ -124,10 +127,10 @@ class NettleieBaseSensor(CoordinatorEntity, SensorEntity):  # type: ignore[misc]
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
         self._attr_translation_key = translation_key
         self._entry = entry
+        self._sensor_type = sensor_type
 
-        # Get TSO name for device info
-        tso_id = entry.data.get(CONF_TSO, "bkk")
-        self._tso = TSO_LIST.get(tso_id, TSO_LIST["bkk"])
+        # TSO name for device info
+        self._tso = coordinator.tso
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -144,6 +147,27 @@ class NettleieBaseSensor(CoordinatorEntity, SensorEntity):  # type: ignore[misc]
             "model": "Strømkalkulator",
         }
 
+    @callback  # type: ignore[untyped-decorator]
+    def _handle_coordinator_update(self) -> None:
+        """Write state if this sensor changed in the refresh, skip it otherwise."""
+        if self._sensor_type not in self.coordinator.changed_sensors and self.available == self._written_available:
+            self.coordinator.state_writes_skipped += 1
+            return
+        self._written_available = self.available
+        self.coordinator.state_writes += 1
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state."""
+        return self.coordinator.snapshot.value(self._sensor_type)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return extra attributes."""
+        snapshot: SensorSnapshot = self.coordinator.snapshot
+        return snapshot.attributes(self._sensor_type)
+
 
 class EnergileddSensor(NettleieBaseSensor):
     """Sensor for energiledd."""
@@ -153,6 +177,7 @@ class EnergileddSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:currency-usd"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset({"energiledd_dag", "energiledd_natt", "tso"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -162,26 +187,6 @@ class EnergileddSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:currency-usd"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("energiledd"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            return {
-                "is_day_rate": self.coordinator.data.get("is_day_rate"),
-                "rate_type": "dag" if self.coordinator.data.get("is_day_rate") else "natt/helg",
-                "energiledd_dag": self.coordinator.data.get("energiledd_dag"),
-                "energiledd_natt": self.coordinator.data.get("energiledd_natt"),
-                "tso": self.coordinator.data.get("tso"),
-            }
-        return None
-
 
 class KapasitetstrinnSensor(NettleieBaseSensor):
     """Sensor for kapasitetstrinn."""
@@ -190,6 +195,7 @@ class KapasitetstrinnSensor(NettleieBaseSensor):
     _attr_native_unit_of_measurement: str = "kr/mnd"
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:transmission-tower"
+    _unrecorded_attributes = frozenset({"avregning_minutter", "tso"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -198,31 +204,6 @@ class KapasitetstrinnSensor(NettleieBaseSensor):
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:transmission-tower"
 
-    @property
-    def native_value(self) -> float | int | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | int | None", self.coordinator.data.get("kapasitetsledd"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            top_3 = self.coordinator.data.get("top_3_days", {})
-            attrs: dict[str, Any] = {
-                "trinn": self.coordinator.data.get("kapasitetstrinn_nummer"),
-                "intervall": self.coordinator.data.get("kapasitetstrinn_intervall"),
-                "gjennomsnitt_kw": self.coordinator.data.get("avg_top_3_kw"),
-                "current_power_kw": self.coordinator.data.get("current_power_kw"),
-                "tso": self.coordinator.data.get("tso"),
-            }
-            for i, (date, power) in enumerate(top_3.items(), 1):
-                attrs[f"maks_{i}_dato"] = date
-                attrs[f"maks_{i}_kw"] = round(power, 2)
-            return attrs
-        return None
-
 
 class TotalPriceSensor(NettleieBaseSensor):
     """Sensor for total electricity price (without strømstøtte)."""
@@ -232,6 +213,7 @@ class TotalPriceSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:cash"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset({"tso"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -241,25 +223,6 @@ class TotalPriceSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:cash"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("total_price_uten_stotte"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            return {
-                "spot_price": self.coordinator.data.get("spot_price"),
-                "energiledd": self.coordinator.data.get("energiledd"),
-                "kapasitetsledd_per_kwh": self.coordinator.data.get("kapasitetsledd_per_kwh"),
-                "tso": self.coordinator.data.get("tso"),
-            }
-        return None
-
 
 class MaksForbrukSensor(NettleieBaseSensor):
     """Sensor for max power consumption on a specific day."""
@@ -269,36 +232,14 @@ class MaksForbrukSensor(NettleieBaseSensor):
     _attr_native_unit_of_measurement: str = "kW"
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:lightning-bolt"
-    _rank: int
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry, rank: int) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, f"maks_forbruk_{rank}", "maks_forbruk")
-        self._rank = rank
         self._attr_native_unit_of_measurement = "kW"
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:lightning-bolt"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            top_3 = self.coordinator.data.get("top_3_days", {})
-            if len(top_3) >= self._rank:
-                values = list(top_3.values())
-                return round(cast("float", values[self._rank - 1]), 2)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            top_3 = self.coordinator.data.get("top_3_days", {})
-            if len(top_3) >= self._rank:
-                dates = list(top_3.keys())
-                return {"dato": dates[self._rank - 1]}
-        return None
-
 
 class GjsForbrukSensor(NettleieBaseSensor):
     """Sensor for average of top 3 power consumption days."""
@@ -308,6 +249,7 @@ class GjsForbrukSensor(NettleieBaseSensor):
     _attr_native_unit_of_measurement: str = "kW"
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:chart-line"
+    _unrecorded_attributes = frozenset({"tso"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -316,24 +258,62 @@ class GjsForbrukSensor(NettleieBaseSensor):
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:chart-line"
 
+
+class EffektromSensor(NettleieBaseSensor):
+    """Sensor for power that can be drawn for the rest of the interval without a higher tier.
+
+    Updated on every power sample (with event ingestion) in addition to the
+    coordinator tick, so it can drive load control such as EV charging.
+    """
+
+    _attr_device_class: SensorDeviceClass = SensorDeviceClass.POWER
+    _attr_native_unit_of_measurement: str = "kW"
+    _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
+    _attr_icon: str = "mdi:gauge"
+    _attr_suggested_display_precision: int = 2
+
+    def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "effektrom", "effektrom")
+        self._attr_native_unit_of_measurement = "kW"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:gauge"
+        self._attr_suggested_display_precision = 2
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to headroom updates between coordinator ticks."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_HEADROOM_UPDATED.format(self._entry.entry_id), self.async_write_ha_state
+            )
+        )
+
+    @callback  # type: ignore[untyped-decorator]
+    def _handle_coordinator_update(self) -> None:
+        """Write state on every refresh (not in the snapshot, the projection moves every tick)."""
+        self.coordinator.state_writes += 1
+        self.async_write_ha_state()
+
     @property
     def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            avg = self.coordinator.data.get("avg_top_3_kw")
-            if avg is not None:
-                return round(cast("float", avg), 2)
-        return None
+        """Return the state (None in the top tier, where there is no next threshold)."""
+        headroom: CapacityHeadroom = self.coordinator.headroom
+        return headroom.headroom_kw
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra attributes."""
-        if self.coordinator.data:
-            return {
-                "kapasitetstrinn": self.coordinator.data.get("kapasitetsledd"),
-                "tso": self.coordinator.data.get("tso"),
-            }
-        return None
+        headroom = self.coordinator.headroom
+        return {
+            "maks_intervall_kw": headroom.max_interval_kw,
+            "neste_trinn_grense_kw": headroom.next_threshold_kw,
+            "neste_trinn_kostnad_kr_mnd": headroom.next_tier_cost,
+            "risiko_prosent": headroom.risk_percent,
+            "intervall_prognose_kw": self.coordinator.data.get("current_interval_projection_kw")
+            if self.coordinator.data
+            else None,
+        }
 
 
 class TrinnNummerSensor(NettleieBaseSensor):
@@ -347,13 +327,6 @@ class TrinnNummerSensor(NettleieBaseSensor):
         super().__init__(coordinator, entry, "trinn_nummer", "trinn_nummer")
         self._attr_icon = "mdi:numeric"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("int | None", self.coordinator.data.get("kapasitetstrinn_nummer"))
-        return None
-
 
 class TrinnIntervallSensor(NettleieBaseSensor):
     """Sensor for capacity tier interval."""
@@ -366,13 +339,6 @@ class TrinnIntervallSensor(NettleieBaseSensor):
         super().__init__(coordinator, entry, "trinn_intervall", "trinn_intervall")
         self._attr_icon = "mdi:arrow-expand-horizontal"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("str | None", self.coordinator.data.get("kapasitetstrinn_intervall"))
-        return None
-
 
 class OffentligeAvgifterSensor(NettleieBaseSensor):
     """Sensor for offentlige avgifter (forbruksavgift, Enova, mva)."""
@@ -383,6 +349,18 @@ class OffentligeAvgifterSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:bank"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset(
+        {
+            "avgiftssone",
+            "sesong",
+            "forbruksavgift_eks_mva",
+            "forbruksavgift_inkl_mva",
+            "enova_avgift_eks_mva",
+            "enova_avgift_inkl_mva",
+            "mva_sats",
+            "note",
+        }
+    )
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -392,47 +370,6 @@ class OffentligeAvgifterSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:bank"
         self._attr_suggested_display_precision = 2
 
-    def _get_forbruksavgift(self) -> float:
-        """Get forbruksavgift based on avgiftssone and current month."""
-        avgiftssone = self._entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-        month = datetime.now().month
-        return get_forbruksavgift(avgiftssone, month)
-
-    def _get_mva_sats(self) -> float:
-        """Get MVA rate based on avgiftssone."""
-        avgiftssone = self._entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-        return get_mva_sats(avgiftssone)
-
-    @property
-    def native_value(self) -> float:
-        """Return total avgifter inkl. mva."""
-        forbruksavgift = self._get_forbruksavgift()
-        mva_sats = self._get_mva_sats()
-        total_eks_mva = forbruksavgift + ENOVA_AVGIFT
-        return round(total_eks_mva * (1 + mva_sats), 2)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return breakdown of fees."""
-        forbruksavgift = self._get_forbruksavgift()
-        mva_sats = self._get_mva_sats()
-        avgiftssone = self._entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-        month = datetime.now().month
-        sesong = "vinter" if month <= 3 else "sommer"
-
-        forbruksavgift_inkl_mva = round(forbruksavgift * (1 + mva_sats), 4)
-        enova_inkl_mva = round(ENOVA_AVGIFT * (1 + mva_sats), 4)
-        return {
-            "avgiftssone": avgiftssone,
-            "sesong": sesong,
-            "forbruksavgift_eks_mva": forbruksavgift,
-            "forbruksavgift_inkl_mva": forbruksavgift_inkl_mva,
-            "enova_avgift_eks_mva": ENOVA_AVGIFT,
-            "enova_avgift_inkl_mva": enova_inkl_mva,
-            "mva_sats": f"{int(mva_sats * 100)}%",
-            "note": "Disse avgiftene er inkludert i energileddet fra nettselskapet",
-        }
-
 
 class ElectricityCompanyTotalSensor(NettleieBaseSensor):
     """Sensor for total price with electricity company + nettleie."""
@@ -451,26 +388,6 @@ class ElectricityCompanyTotalSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:cash-plus"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            electricity_company_total = self.coordinator.data.get("electricity_company_total")
-            if electricity_company_total is not None:
-                return round(cast("float", electricity_company_total), 4)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            return {
-                "electricity_company_pris": self.coordinator.data.get("electricity_company_price"),
-                "energiledd": self.coordinator.data.get("energiledd"),
-                "kapasitetsledd_per_kwh": self.coordinator.data.get("kapasitetsledd_per_kwh"),
-            }
-        return None
-
 
 class StromstotteSensor(NettleieBaseSensor):
     """Sensor for strømstøtte per kWh."""
@@ -481,6 +398,7 @@ class StromstotteSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:cash-refund"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset({"terskel", "dekningsgrad"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -490,24 +408,6 @@ class StromstotteSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:cash-refund"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("stromstotte"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            return {
-                "spotpris": self.coordinator.data.get("spot_price"),
-                "terskel": STROMSTOTTE_LEVEL,
-                "dekningsgrad": "90%",
-            }
-        return None
-
 
 class SpotprisEtterStotteSensor(NettleieBaseSensor):
     """Sensor for spot price after strømstøtte."""
@@ -527,23 +427,6 @@ class SpotprisEtterStotteSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:currency-usd-off"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("spotpris_etter_stotte"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            return {
-                "spotpris": self.coordinator.data.get("spot_price"),
-                "stromstotte": self.coordinator.data.get("stromstotte"),
-            }
-        return None
-
 
 class TotalPrisEtterStotteSensor(NettleieBaseSensor):
     """Sensor for total price after strømstøtte (spot + nettleie - støtte)."""
@@ -563,26 +446,6 @@ class TotalPrisEtterStotteSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:cash-check"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("total_price"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            return {
-                "spotpris": self.coordinator.data.get("spot_price"),
-                "stromstotte": self.coordinator.data.get("stromstotte"),
-                "spotpris_etter_stotte": self.coordinator.data.get("spotpris_etter_stotte"),
-                "energiledd": self.coordinator.data.get("energiledd"),
-                "kapasitetsledd_per_kwh": self.coordinator.data.get("kapasitetsledd_per_kwh"),
-            }
-        return None
-
 
 class TotalPrisInklAvgifterSensor(NettleieBaseSensor):
     """Sensor for total price including all taxes (for Energy Dashboard)."""
@@ -593,6 +456,16 @@ class TotalPrisInklAvgifterSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:receipt-text-check"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset(
+        {
+            "forbruksavgift_inkl_mva",
+            "enova_inkl_mva",
+            "offentlige_avgifter",
+            "bruk",
+            "i_dag",
+            "i_morgen",
+        }
+    )
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -602,30 +475,6 @@ class TotalPrisInklAvgifterSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:receipt-text-check"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("total_price_inkl_avgifter"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes with breakdown."""
-        if self.coordinator.data:
-            return {
-                "spotpris": self.coordinator.data.get("spot_price"),
-                "stromstotte": self.coordinator.data.get("stromstotte"),
-                "spotpris_etter_stotte": self.coordinator.data.get("spotpris_etter_stotte"),
-                "energiledd": self.coordinator.data.get("energiledd"),
-                "kapasitetsledd_per_kwh": self.coordinator.data.get("kapasitetsledd_per_kwh"),
-                "forbruksavgift_inkl_mva": self.coordinator.data.get("forbruksavgift_inkl_mva"),
-                "enova_inkl_mva": self.coordinator.data.get("enova_inkl_mva"),
-                "offentlige_avgifter": self.coordinator.data.get("offentlige_avgifter"),
-                "bruk": "Bruk denne sensoren i Energy Dashboard for korrekt totalpris",
-            }
-        return None
-
 
 class TotalPrisNorgesprisSensor(NettleieBaseSensor):
     """Sensor for totalpris med norgespris."""
@@ -636,6 +485,7 @@ class TotalPrisNorgesprisSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:map-marker"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset({"norgespris", "norgespris_stromstotte", "note"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -645,26 +495,6 @@ class TotalPrisNorgesprisSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:map-marker"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("total_pris_norgespris"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            return {
-                "norgespris": self.coordinator.data.get("norgespris"),
-                "norgespris_stromstotte": self.coordinator.data.get("norgespris_stromstotte"),
-                "energiledd": self.coordinator.data.get("energiledd"),
-                "kapasitetsledd_per_kwh": self.coordinator.data.get("kapasitetsledd_per_kwh"),
-                "note": "Norgespris er fast 50 øre/kWh fra Elhub",
-            }
-        return None
-
 
 class PrisforskjellNorgesprisSensor(NettleieBaseSensor):
     """Sensor for prisforskjell mellom norgespris og vanlig pris."""
@@ -675,6 +505,7 @@ class PrisforskjellNorgesprisSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:cash-minus"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset({"note"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -684,30 +515,6 @@ class PrisforskjellNorgesprisSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:cash-minus"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("kroner_spart_per_kwh"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            norgespris = self.coordinator.data.get("norgespris")
-            norgespris_stromstotte = self.coordinator.data.get("norgespris_stromstotte")
-            norgespris_etter_stotte: float | None = None
-            if norgespris is not None and norgespris_stromstotte is not None:
-                norgespris_etter_stotte = norgespris - norgespris_stromstotte
-            return {
-                "din_pris_etter_stotte": self.coordinator.data.get("spotpris_etter_stotte"),
-                "norgespris_etter_stotte": norgespris_etter_stotte,
-                "differens_per_kwh": self.coordinator.data.get("kroner_spart_per_kwh"),
-                "note": "Norgespris er fast 50 øre/kWh fra Elhub",
-            }
-        return None
-
 
 class NorgesprisAktivSensor(NettleieBaseSensor):
     """Sensor showing if Norgespris is active."""
@@ -721,14 +528,6 @@ class NorgesprisAktivSensor(NettleieBaseSensor):
         super().__init__(coordinator, entry, "norgespris_aktiv", "norgespris_aktiv")
         self._attr_icon = "mdi:check-circle"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return 'Ja' if Norgespris is active, 'Nei' otherwise."""
-        if self.coordinator.data:
-            has_norgespris = self.coordinator.data.get("has_norgespris", False)
-            return "Ja" if has_norgespris else "Nei"
-        return None
-
 
 # =============================================================================
 # Fakturasammenligning - Separate sensorer for hver fakturalinje
@@ -744,6 +543,7 @@ class EnergileddDagSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:weather-sunny"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset({"inkl_avgifter_mva", "eks_avgifter_mva", "note"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -753,32 +553,6 @@ class EnergileddDagSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:weather-sunny"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("energiledd_dag"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            avgiftssone = self._entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-            mva_sats = get_mva_sats(avgiftssone)
-            energiledd_dag = self.coordinator.data.get("energiledd_dag", 0)
-            # Beregn pris eks. avgifter for fakturasammenligning
-            forbruksavgift = get_forbruksavgift(avgiftssone, datetime.now().month)
-            energiledd_eks_avgifter = energiledd_dag - forbruksavgift - ENOVA_AVGIFT
-            if mva_sats > 0:
-                energiledd_eks_avgifter = energiledd_eks_avgifter / (1 + mva_sats)
-            return {
-                "inkl_avgifter_mva": energiledd_dag,
-                "eks_avgifter_mva": round(energiledd_eks_avgifter, 4),
-                "note": "Fakturaen viser pris eks. avgifter. Sammenlign med eks_avgifter_mva.",
-            }
-        return None
-
 
 class EnergileddNattSensor(NettleieBaseSensor):
     """Sensor for energiledd natt/helg-sats (eks. avgifter, for fakturasammenligning)."""
@@ -789,6 +563,7 @@ class EnergileddNattSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:weather-night"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset({"inkl_avgifter_mva", "eks_avgifter_mva", "note"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -798,32 +573,6 @@ class EnergileddNattSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:weather-night"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("energiledd_natt"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra attributes."""
-        if self.coordinator.data:
-            avgiftssone = self._entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-            mva_sats = get_mva_sats(avgiftssone)
-            energiledd_natt = self.coordinator.data.get("energiledd_natt", 0)
-            # Beregn pris eks. avgifter for fakturasammenligning
-            forbruksavgift = get_forbruksavgift(avgiftssone, datetime.now().month)
-            energiledd_eks_avgifter = energiledd_natt - forbruksavgift - ENOVA_AVGIFT
-            if mva_sats > 0:
-                energiledd_eks_avgifter = energiledd_eks_avgifter / (1 + mva_sats)
-            return {
-                "inkl_avgifter_mva": energiledd_natt,
-                "eks_avgifter_mva": round(energiledd_eks_avgifter, 4),
-                "note": "Fakturaen viser pris eks. avgifter. Sammenlign med eks_avgifter_mva.",
-            }
-        return None
-
 
 class ForbruksavgiftSensor(NettleieBaseSensor):
     """Sensor for forbruksavgift (elavgift) per kWh."""
@@ -834,6 +583,16 @@ class ForbruksavgiftSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:lightning-bolt"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset(
+        {
+            "eks_mva",
+            "inkl_mva",
+            "mva_sats",
+            "avgiftssone",
+            "ore_per_kwh_eks_mva",
+            "note",
+        }
+    )
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -843,39 +602,6 @@ class ForbruksavgiftSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:lightning-bolt"
         self._attr_suggested_display_precision = 2
 
-    def _get_forbruksavgift(self) -> float:
-        """Get forbruksavgift based on avgiftssone."""
-        avgiftssone = self._entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-        month = datetime.now().month
-        return get_forbruksavgift(avgiftssone, month)
-
-    def _get_mva_sats(self) -> float:
-        """Get MVA rate based on avgiftssone."""
-        avgiftssone = self._entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-        return get_mva_sats(avgiftssone)
-
-    @property
-    def native_value(self) -> float:
-        """Return forbruksavgift inkl. mva."""
-        forbruksavgift = self._get_forbruksavgift()
-        mva_sats = self._get_mva_sats()
-        return round(forbruksavgift * (1 + mva_sats), 4)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return breakdown."""
-        forbruksavgift = self._get_forbruksavgift()
-        mva_sats = self._get_mva_sats()
-        avgiftssone = self._entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-        return {
-            "eks_mva": forbruksavgift,
-            "inkl_mva": round(forbruksavgift * (1 + mva_sats), 4),
-            "mva_sats": f"{int(mva_sats * 100)}%",
-            "avgiftssone": avgiftssone,
-            "ore_per_kwh_eks_mva": round(forbruksavgift * 100, 2),
-            "note": "Fakturaen viser forbruksavgift eks. mva",
-        }
-
 
 class EnovaavgiftSensor(NettleieBaseSensor):
     """Sensor for Enova-avgift per kWh."""
@@ -886,6 +612,16 @@ class EnovaavgiftSensor(NettleieBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.MEASUREMENT
     _attr_icon: str = "mdi:leaf"
     _attr_suggested_display_precision: int = 2
+    _unrecorded_attributes = frozenset(
+        {
+            "eks_mva",
+            "inkl_mva",
+            "mva_sats",
+            "avgiftssone",
+            "ore_per_kwh_eks_mva",
+            "note",
+        }
+    )
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -895,31 +631,6 @@ class EnovaavgiftSensor(NettleieBaseSensor):
         self._attr_icon = "mdi:leaf"
         self._attr_suggested_display_precision = 2
 
-    def _get_mva_sats(self) -> float:
-        """Get MVA rate based on avgiftssone."""
-        avgiftssone = self._entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-        return get_mva_sats(avgiftssone)
-
-    @property
-    def native_value(self) -> float:
-        """Return Enova-avgift inkl. mva."""
-        mva_sats = self._get_mva_sats()
-        return round(ENOVA_AVGIFT * (1 + mva_sats), 4)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return breakdown."""
-        mva_sats = self._get_mva_sats()
-        avgiftssone = self._entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-        return {
-            "eks_mva": ENOVA_AVGIFT,
-            "inkl_mva": round(ENOVA_AVGIFT * (1 + mva_sats), 4),
-            "mva_sats": f"{int(mva_sats * 100)}%",
-            "avgiftssone": avgiftssone,
-            "ore_per_kwh_eks_mva": round(ENOVA_AVGIFT * 100, 2),
-            "note": "Fakturaen viser Enova-avgift eks. mva (1,0 øre/kWh)",
-        }
-
 
 class StromstotteKwhSensor(NettleieBaseSensor):
     """Sensor for strømstøtte-berettiget forbruk (kWh over terskel)."""
@@ -927,66 +638,25 @@ class StromstotteKwhSensor(NettleieBaseSensor):
     _device_group: str = DEVICE_STROMSTOTTE
     _attr_entity_category: EntityCategory = EntityCategory.DIAGNOSTIC
     _attr_icon: str = "mdi:cash-check"
+    _unrecorded_attributes = frozenset({"terskel", "note"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "stromstotte_aktiv", "stromstotte_kwh")
         self._attr_icon = "mdi:cash-check"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return 'Ja' if strømstøtte is active, 'Nei' otherwise."""
-        if self.coordinator.data:
-            stromstotte = self.coordinator.data.get("stromstotte", 0)
-            return "Ja" if stromstotte > 0 else "Nei"
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return attributes."""
-        if self.coordinator.data:
-            spot_price = self.coordinator.data.get("spot_price", 0)
-            stromstotte = self.coordinator.data.get("stromstotte", 0)
-            return {
-                "spotpris": spot_price,
-                "terskel": STROMSTOTTE_LEVEL,
-                "over_terskel": spot_price > STROMSTOTTE_LEVEL,
-                "stromstotte_per_kwh": stromstotte,
-                "note": f"Timer hvor spotpris > {STROMSTOTTE_LEVEL * 100:.2f} øre/kWh gir strømstøtte på fakturaen",
-            }
-        return None
-
 
 class TariffSensor(NettleieBaseSensor):
     """Sensor for current tariff period (dag/natt) - for use with utility_meter."""
 
     _attr_icon: str = "mdi:clock-outline"
+    _unrecorded_attributes = frozenset({"dag_periode", "natt_periode", "bruk"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "tariff", "tariff")
         self._attr_icon = "mdi:clock-outline"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return current tariff: 'dag' or 'natt'."""
-        if self.coordinator.data:
-            is_day = self.coordinator.data.get("is_day_rate")
-            return "dag" if is_day else "natt"
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return attributes with schedule info."""
-        if self.coordinator.data:
-            return {
-                "is_day_rate": self.coordinator.data.get("is_day_rate"),
-                "dag_periode": "Hverdager 06:00-22:00 (ikke helligdager)",
-                "natt_periode": "22:00-06:00, helger og helligdager",
-                "bruk": "Bruk denne sensoren til å styre utility_meter tariff-bytte",
-            }
-        return None
-
 
 # =============================================================================
 # MÅNEDLIG FORBRUK OG KOSTNAD - Device: "Månedlig"
@@ -1026,13 +696,6 @@ class MaanedligForbrukDagSensor(MaanedligBaseSensor):
         self._attr_icon = "mdi:weather-sunny"
         self._attr_suggested_display_precision = 1
 
-    @property
-    def native_value(self) -> float | None:
-        """Return monthly day consumption."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("monthly_consumption_dag_kwh"))
-        return None
-
 
 class MaanedligForbrukNattSensor(MaanedligBaseSensor):
     """Sensor for monthly night tariff consumption."""
@@ -1051,13 +714,6 @@ class MaanedligForbrukNattSensor(MaanedligBaseSensor):
         self._attr_icon = "mdi:weather-night"
         self._attr_suggested_display_precision = 1
 
-    @property
-    def native_value(self) -> float | None:
-        """Return monthly night consumption."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("monthly_consumption_natt_kwh"))
-        return None
-
 
 class MaanedligForbrukTotalSensor(MaanedligBaseSensor):
     """Sensor for total monthly consumption."""
@@ -1076,23 +732,6 @@ class MaanedligForbrukTotalSensor(MaanedligBaseSensor):
         self._attr_icon = "mdi:lightning-bolt"
         self._attr_suggested_display_precision = 1
 
-    @property
-    def native_value(self) -> float | None:
-        """Return total monthly consumption."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("monthly_consumption_total_kwh"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return consumption breakdown."""
-        if self.coordinator.data:
-            return {
-                "dag_kwh": self.coordinator.data.get("monthly_consumption_dag_kwh"),
-                "natt_kwh": self.coordinator.data.get("monthly_consumption_natt_kwh"),
-            }
-        return None
-
 
 class MaanedligNettleieSensor(MaanedligBaseSensor):
     """Sensor for monthly grid rent cost (energiledd + kapasitetsledd)."""
@@ -1111,39 +750,6 @@ class MaanedligNettleieSensor(MaanedligBaseSensor):
         self._attr_icon = "mdi:transmission-tower"
         self._attr_suggested_display_precision = 0
 
-    @property
-    def native_value(self) -> float | None:
-        """Calculate monthly grid rent cost."""
-        if self.coordinator.data:
-            dag_kwh = self.coordinator.data.get("monthly_consumption_dag_kwh", 0)
-            natt_kwh = self.coordinator.data.get("monthly_consumption_natt_kwh", 0)
-            dag_pris = self.coordinator.data.get("energiledd_dag", 0)
-            natt_pris = self.coordinator.data.get("energiledd_natt", 0)
-            kapasitet = self.coordinator.data.get("kapasitetsledd", 0)
-            return round(
-                (cast("float", dag_kwh) * cast("float", dag_pris))
-                + (cast("float", natt_kwh) * cast("float", natt_pris))
-                + cast("float", kapasitet),
-                2,
-            )
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return cost breakdown."""
-        if self.coordinator.data:
-            dag_kwh = self.coordinator.data.get("monthly_consumption_dag_kwh", 0)
-            natt_kwh = self.coordinator.data.get("monthly_consumption_natt_kwh", 0)
-            dag_pris = self.coordinator.data.get("energiledd_dag", 0)
-            natt_pris = self.coordinator.data.get("energiledd_natt", 0)
-            kapasitet = self.coordinator.data.get("kapasitetsledd", 0)
-            return {
-                "energiledd_dag_kr": round(dag_kwh * dag_pris, 2),
-                "energiledd_natt_kr": round(natt_kwh * natt_pris, 2),
-                "kapasitetsledd_kr": kapasitet,
-            }
-        return None
-
 
 class MaanedligAvgifterSensor(MaanedligBaseSensor):
     """Sensor for monthly public fees (forbruksavgift + Enova)."""
@@ -1153,7 +759,7 @@ class MaanedligAvgifterSensor(MaanedligBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.TOTAL
     _attr_icon: str = "mdi:bank"
     _attr_suggested_display_precision: int = 0
-    _avgiftssone: str
+    _unrecorded_attributes = frozenset({"avgiftssone"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -1162,49 +768,13 @@ class MaanedligAvgifterSensor(MaanedligBaseSensor):
         self._attr_state_class = SensorStateClass.TOTAL
         self._attr_icon = "mdi:bank"
         self._attr_suggested_display_precision = 0
-        self._avgiftssone = entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-
-    @property
-    def native_value(self) -> float | None:
-        """Calculate monthly public fees."""
-        if self.coordinator.data:
-            total_kwh = self.coordinator.data.get("monthly_consumption_total_kwh", 0)
-            month = datetime.now().month
-            forbruksavgift = get_forbruksavgift(self._avgiftssone, month)
-            mva_sats = get_mva_sats(self._avgiftssone)
-
-            # Avgifter inkl. mva
-            forbruksavgift_inkl = forbruksavgift * (1 + mva_sats)
-            enova_inkl = ENOVA_AVGIFT * (1 + mva_sats)
-
-            return round(cast("float", total_kwh) * (forbruksavgift_inkl + enova_inkl), 2)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return fee breakdown."""
-        if self.coordinator.data:
-            total_kwh = self.coordinator.data.get("monthly_consumption_total_kwh", 0)
-            month = datetime.now().month
-            forbruksavgift = get_forbruksavgift(self._avgiftssone, month)
-            mva_sats = get_mva_sats(self._avgiftssone)
-
-            forbruksavgift_inkl = forbruksavgift * (1 + mva_sats)
-            enova_inkl = ENOVA_AVGIFT * (1 + mva_sats)
-
-            return {
-                "forbruksavgift_kr": round(total_kwh * forbruksavgift_inkl, 2),
-                "enovaavgift_kr": round(total_kwh * enova_inkl, 2),
-                "avgiftssone": self._avgiftssone,
-            }
-        return None
 
 
 class MaanedligStromstotteSensor(MaanedligBaseSensor):
-    """Sensor for estimated monthly electricity subsidy.
+    """Sensor for monthly electricity subsidy.
 
-    Note: This is an estimate based on current subsidy rate.
-    Actual subsidy is calculated hourly by grid company.
+    Booked per settlement interval at that interval's price, for the first
+    5000 kWh of the month (like the grid company does).
     """
 
     _attr_device_class: SensorDeviceClass = SensorDeviceClass.MONETARY
@@ -1212,6 +782,7 @@ class MaanedligStromstotteSensor(MaanedligBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.TOTAL
     _attr_icon: str = "mdi:cash-plus"
     _attr_suggested_display_precision: int = 0
+    _unrecorded_attributes = frozenset({"merknad", "tak_kwh", "har_norgespris"})
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -1221,26 +792,6 @@ class MaanedligStromstotteSensor(MaanedligBaseSensor):
         self._attr_icon = "mdi:cash-plus"
         self._attr_suggested_display_precision = 0
 
-    @property
-    def native_value(self) -> float | None:
-        """Estimate monthly subsidy (rough calculation)."""
-        if self.coordinator.data:
-            total_kwh = self.coordinator.data.get("monthly_consumption_total_kwh", 0)
-            stromstotte_per_kwh = self.coordinator.data.get("stromstotte", 0)
-            return round(cast("float", total_kwh) * cast("float", stromstotte_per_kwh), 2)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return subsidy info."""
-        if self.coordinator.data:
-            return {
-                "merknad": "Estimat basert på gjeldende strømstøtte-sats. Faktisk støtte beregnes time-for-time.",
-                "stromstotte_per_kwh": self.coordinator.data.get("stromstotte"),
-                "har_norgespris": self.coordinator.data.get("har_norgespris"),
-            }
-        return None
-
 
 class MaanedligTotalSensor(MaanedligBaseSensor):
     """Sensor for total monthly cost (nettleie + avgifter - strømstøtte)."""
@@ -1250,7 +801,6 @@ class MaanedligTotalSensor(MaanedligBaseSensor):
     _attr_state_class: SensorStateClass = SensorStateClass.TOTAL
     _attr_icon: str = "mdi:receipt-text"
     _attr_suggested_display_precision: int = 0
-    _avgiftssone: str
 
     def __init__(self, coordinator: NettleieCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
@@ -1259,69 +809,6 @@ class MaanedligTotalSensor(MaanedligBaseSensor):
         self._attr_state_class = SensorStateClass.TOTAL
         self._attr_icon = "mdi:receipt-text"
         self._attr_suggested_display_precision = 0
-        self._avgiftssone = entry.data.get(CONF_AVGIFTSSONE, AVGIFTSSONE_STANDARD)
-
-    @property
-    def native_value(self) -> float | None:
-        """Calculate total monthly cost."""
-        if self.coordinator.data:
-            dag_kwh = self.coordinator.data.get("monthly_consumption_dag_kwh", 0)
-            natt_kwh = self.coordinator.data.get("monthly_consumption_natt_kwh", 0)
-            total_kwh = dag_kwh + natt_kwh
-            dag_pris = self.coordinator.data.get("energiledd_dag", 0)
-            natt_pris = self.coordinator.data.get("energiledd_natt", 0)
-            kapasitet = self.coordinator.data.get("kapasitetsledd", 0)
-            stromstotte = self.coordinator.data.get("stromstotte", 0)
-
-            month = datetime.now().month
-            forbruksavgift = get_forbruksavgift(self._avgiftssone, month)
-            mva_sats = get_mva_sats(self._avgiftssone)
-
-            # Nettleie
-            nettleie = (
-                (cast("float", dag_kwh) * cast("float", dag_pris))
-                + (cast("float", natt_kwh) * cast("float", natt_pris))
-                + cast("float", kapasitet)
-            )
-
-            # Avgifter inkl. mva
-            avgifter = cast("float", total_kwh) * ((forbruksavgift + ENOVA_AVGIFT) * (1 + mva_sats))
-
-            # Strømstøtte (fratrekk)
-            stotte = cast("float", total_kwh) * cast("float", stromstotte)
-
-            return round(nettleie + avgifter - stotte, 2)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return cost breakdown."""
-        if self.coordinator.data:
-            dag_kwh = self.coordinator.data.get("monthly_consumption_dag_kwh", 0)
-            natt_kwh = self.coordinator.data.get("monthly_consumption_natt_kwh", 0)
-            total_kwh = dag_kwh + natt_kwh
-            dag_pris = self.coordinator.data.get("energiledd_dag", 0)
-            natt_pris = self.coordinator.data.get("energiledd_natt", 0)
-            kapasitet = self.coordinator.data.get("kapasitetsledd", 0)
-            stromstotte = self.coordinator.data.get("stromstotte", 0)
-
-            month = datetime.now().month
-            forbruksavgift = get_forbruksavgift(self._avgiftssone, month)
-            mva_sats = get_mva_sats(self._avgiftssone)
-
-            nettleie = (dag_kwh * dag_pris) + (natt_kwh * natt_pris) + kapasitet
-            avgifter = total_kwh * ((forbruksavgift + ENOVA_AVGIFT) * (1 + mva_sats))
-            stotte = total_kwh * stromstotte
-
-            return {
-                "nettleie_kr": round(nettleie, 2),
-                "avgifter_kr": round(avgifter, 2),
-                "stromstotte_kr": round(stotte, 2),
-                "forbruk_dag_kwh": round(dag_kwh, 1),
-                "forbruk_natt_kwh": round(natt_kwh, 1),
-                "forbruk_total_kwh": round(total_kwh, 1),
-            }
-        return None
 
 
 # =============================================================================
@@ -1362,20 +849,6 @@ class ForrigeMaanedForbrukDagSensor(ForrigeMaanedBaseSensor):
         self._attr_icon = "mdi:weather-sunny"
         self._attr_suggested_display_precision = 1
 
-    @property
-    def native_value(self) -> float | None:
-        """Return previous month day consumption."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("previous_month_consumption_dag_kwh"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return the month name."""
-        if self.coordinator.data:
-            return {"måned": self.coordinator.data.get("previous_month_name")}
-        return None
-
 
 class ForrigeMaanedForbrukNattSensor(ForrigeMaanedBaseSensor):
     """Sensor for previous month night tariff consumption."""
@@ -1394,20 +867,6 @@ class ForrigeMaanedForbrukNattSensor(ForrigeMaanedBaseSensor):
         self._attr_icon = "mdi:weather-night"
         self._attr_suggested_display_precision = 1
 
-    @property
-    def native_value(self) -> float | None:
-        """Return previous month night consumption."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("previous_month_consumption_natt_kwh"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return the month name."""
-        if self.coordinator.data:
-            return {"måned": self.coordinator.data.get("previous_month_name")}
-        return None
-
 
 class ForrigeMaanedForbrukTotalSensor(ForrigeMaanedBaseSensor):
     """Sensor for previous month total consumption."""
@@ -1426,24 +885,6 @@ class ForrigeMaanedForbrukTotalSensor(ForrigeMaanedBaseSensor):
         self._attr_icon = "mdi:lightning-bolt"
         self._attr_suggested_display_precision = 1
 
-    @property
-    def native_value(self) -> float | None:
-        """Return previous month total consumption."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("previous_month_consumption_total_kwh"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return consumption breakdown."""
-        if self.coordinator.data:
-            return {
-                "måned": self.coordinator.data.get("previous_month_name"),
-                "dag_kwh": self.coordinator.data.get("previous_month_consumption_dag_kwh"),
-                "natt_kwh": self.coordinator.data.get("previous_month_consumption_natt_kwh"),
-            }
-        return None
-
 
 class ForrigeMaanedNettleieSensor(ForrigeMaanedBaseSensor):
     """Sensor for previous month grid rent cost."""
@@ -1462,65 +903,6 @@ class ForrigeMaanedNettleieSensor(ForrigeMaanedBaseSensor):
         self._attr_icon = "mdi:transmission-tower"
         self._attr_suggested_display_precision = 0
 
-    @property
-    def native_value(self) -> float | None:
-        """Calculate previous month grid rent cost."""
-        if self.coordinator.data:
-            dag_kwh = self.coordinator.data.get("previous_month_consumption_dag_kwh", 0)
-            natt_kwh = self.coordinator.data.get("previous_month_consumption_natt_kwh", 0)
-            dag_pris = self.coordinator.data.get("energiledd_dag", 0)
-            natt_pris = self.coordinator.data.get("energiledd_natt", 0)
-
-            # Get kapasitetsledd from previous month's top 3
-            top_3 = self.coordinator.data.get("previous_month_top_3", {})
-            if top_3:
-                avg_power = sum(top_3.values()) / len(top_3)
-                kapasitet = self._get_kapasitetsledd_for_avg(avg_power)
-            else:
-                kapasitet = 0
-
-            return round(
-                (cast("float", dag_kwh) * cast("float", dag_pris))
-                + (cast("float", natt_kwh) * cast("float", natt_pris))
-                + cast("float", kapasitet),
-                2,
-            )
-        return None
-
-    def _get_kapasitetsledd_for_avg(self, avg_power: float) -> int:
-        """Get kapasitetsledd based on average power."""
-        kapasitetstrinn = self.coordinator.kapasitetstrinn
-        for threshold, price in kapasitetstrinn:
-            if avg_power <= threshold:
-                return cast("int", price)
-        return cast("int", kapasitetstrinn[-1][1]) if kapasitetstrinn else 0
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return cost breakdown."""
-        if self.coordinator.data:
-            dag_kwh = self.coordinator.data.get("previous_month_consumption_dag_kwh", 0)
-            natt_kwh = self.coordinator.data.get("previous_month_consumption_natt_kwh", 0)
-            dag_pris = self.coordinator.data.get("energiledd_dag", 0)
-            natt_pris = self.coordinator.data.get("energiledd_natt", 0)
-
-            top_3 = self.coordinator.data.get("previous_month_top_3", {})
-            if top_3:
-                avg_power = sum(top_3.values()) / len(top_3)
-                kapasitet = self._get_kapasitetsledd_for_avg(avg_power)
-            else:
-                avg_power = 0
-                kapasitet = 0
-
-            return {
-                "måned": self.coordinator.data.get("previous_month_name"),
-                "energiledd_dag_kr": round(dag_kwh * dag_pris, 2),
-                "energiledd_natt_kr": round(natt_kwh * natt_pris, 2),
-                "kapasitetsledd_kr": kapasitet,
-                "snitt_topp_3_kw": round(avg_power, 2),
-            }
-        return None
-
 
 class ForrigeMaanedToppforbrukSensor(ForrigeMaanedBaseSensor):
     """Sensor for previous month top 3 power consumption average."""
@@ -1538,22 +920,3 @@ class ForrigeMaanedToppforbrukSensor(ForrigeMaanedBaseSensor):
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:arrow-up-bold"
         self._attr_suggested_display_precision = 2
-
-    @property
-    def native_value(self) -> float | None:
-        """Return previous month average top 3 power."""
-        if self.coordinator.data:
-            return cast("float | None", self.coordinator.data.get("previous_month_avg_top_3_kw"))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return top 3 days breakdown."""
-        if self.coordinator.data:
-            top_3 = self.coordinator.data.get("previous_month_top_3", {})
-            attrs: dict[str, Any] = {"måned": self.coordinator.data.get("previous_month_name")}
-            for i, (date, kw) in enumerate(sorted(top_3.items(), key=lambda x: x[1], reverse=True), 1):
-                attrs[f"topp_{i}_dato"] = date
-                attrs[f"topp_{i}_kw"] = round(kw, 2)
-            return attrs
-        return None
@@ -0,0 +1,154 @@
+"""Services for Strømkalkulator."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from . import comparison, simulator
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_END,
+    ATTR_KWH,
+    ATTR_PRISOMRADE,
+    ATTR_SPOTPRIS,
+    ATTR_START,
+    ATTR_TIME,
+    ATTR_TIMER,
+    DOMAIN,
+    SERVICE_COMPARE_TSO,
+    SERVICE_GET_PRICE_CURVE,
+    SERVICE_SIMULATE_NORGESPRIS,
+)
+from .tso import PRISOMRADER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .coordinator import NettleieCoordinator
+
+GET_PRICE_CURVE_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+COMPARE_TSO_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_PRISOMRADE): vol.In(sorted(PRISOMRADER)),
+    }
+)
+SIMULATE_NORGESPRIS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_START): cv.date,
+        vol.Optional(ATTR_END): cv.date,
+        vol.Optional(ATTR_TIMER): [
+            vol.Schema(
+                {
+                    vol.Required(ATTR_TIME): cv.datetime,
+                    vol.Required(ATTR_KWH): vol.Coerce(float),
+                    vol.Required(ATTR_SPOTPRIS): vol.Coerce(float),
+                }
+            )
+        ],
+    }
+)
+
+
+@callback  # type: ignore[untyped-decorator]
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_get_price_curve(call: ServiceCall) -> ServiceResponse:
+        """Return today's and tomorrow's price curve with every price column."""
+        coordinator = _get_coordinator(hass, call)
+        data: dict[str, Any] = coordinator.data or {}
+        curve = data.get("price_curve", {})
+        return {
+            "tso": data.get("tso"),
+            "har_norgespris": data.get("har_norgespris"),
+            "today": curve["today"].as_rows() if curve.get("today") else [],
+            "tomorrow": curve["tomorrow"].as_rows() if curve.get("tomorrow") else [],
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_PRICE_CURVE,
+        async_get_price_curve,
+        schema=GET_PRICE_CURVE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_compare_tso(call: ServiceCall) -> ServiceResponse:
+        """Return nettleie for the last months' consumption with every grid company's tariff, cheapest first."""
+        coordinator = _get_coordinator(hass, call)
+        # Hele katalogen leses og kompileres første gang tjenesten brukes (i executor)
+        months, costs = await coordinator.async_compare_tso(call.data.get(ATTR_PRISOMRADE))
+        return {
+            "tso": coordinator.tso_id,
+            "maaneder": [month.isoformat() for month in months],
+            "nettselskaper": comparison.as_rows(costs),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_COMPARE_TSO,
+        async_compare_tso,
+        schema=COMPARE_TSO_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_simulate_norgespris(call: ServiceCall) -> ServiceResponse:
+        """Return what the archived (or imported) months cost with spot price and with Norgespris."""
+        coordinator = _get_coordinator(hass, call)
+        imported = simulator.imported_hours(call.data[ATTR_TIMER]) if ATTR_TIMER in call.data else None
+        if imported:
+            # Standard: hele den importerte serien
+            default_start, default_end = imported[0][0].date(), imported[-1][0].date()
+        else:
+            # Standard: hele arkivet (samme måned i fjor til i dag)
+            default_end = date.today()
+            default_start = default_end.replace(year=default_end.year - 1, day=1)
+        start = call.data.get(ATTR_START, default_start)
+        end = call.data.get(ATTR_END, default_end) + timedelta(days=1)
+        months = await hass.async_add_executor_job(
+            coordinator.simulate_norgespris,
+            datetime.combine(start, time()),
+            datetime.combine(end, time()),
+            imported,
+        )
+        return {
+            "har_norgespris": coordinator.har_norgespris,
+            "maaneder": simulator.as_rows(months),
+            "sum_differanse_kr": round(sum(month.differanse_kr for month in months), 2),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SIMULATE_NORGESPRIS,
+        async_simulate_norgespris,
+        schema=SIMULATE_NORGESPRIS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> NettleieCoordinator:
+    """Coordinator for the entry in the call, or the only loaded entry."""
+    entries = [entry for entry in hass.config_entries.async_entries(DOMAIN) if entry.state is ConfigEntryState.LOADED]
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is not None:
+        entries = [entry for entry in entries if entry.entry_id == entry_id]
+        if not entries:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entry_not_loaded",
+                translation_placeholders={"entry_id": entry_id},
+            )
+    elif len(entries) != 1:
+        raise ServiceValidationError(translation_domain=DOMAIN, translation_key="entry_required")
+    coordinator: NettleieCoordinator = entries[0].runtime_data
+    return coordinator
@@ -0,0 +1,121 @@
+"""Norgespris vs spot price simulator for Strømkalkulator."""
+
+from __future__ import annotations
+
+from datetime import date
+from itertools import groupby
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .const import (
+    ATTR_KWH,
+    ATTR_SPOTPRIS,
+    ATTR_TIME,
+    NORGESPRIS_MAX_KWH_BOLIG,
+    STROMSTOTTE_MAX_KWH,
+    STROMSTOTTE_RATE,
+)
+from .tariff_history import STROMSTOTTE_LEVEL_HISTORY, RateHistory
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from datetime import datetime
+
+
+class MonthSavings(NamedTuple):
+    """What a month's consumption cost with spot price and with Norgespris."""
+
+    month: date
+    hours: int
+    kwh: float
+    spot_kr: float  # Spotpris minus strømstøtte
+    stromstotte_kr: float
+    stromstotte_kwh: float  # kWh innenfor støttetaket (maks STROMSTOTTE_MAX_KWH)
+    norgespris_kr: float  # Norgespris opp til taket, spotpris for resten
+    norgespris_kwh: float  # kWh til Norgespris (maks NORGESPRIS_MAX_KWH_BOLIG)
+    differanse_kr: float  # Positiv = Norgespris hadde vært billigere
+
+
+def simulate(
+    hours: Iterable[tuple[datetime, float, float]],
+    norgespris: float,
+    *,
+    stromstotte_level: RateHistory = STROMSTOTTE_LEVEL_HISTORY,
+    stromstotte_rate: float = STROMSTOTTE_RATE,
+    stromstotte_max_kwh: float = STROMSTOTTE_MAX_KWH,
+    norgespris_max_kwh: float = NORGESPRIS_MAX_KWH_BOLIG,
+) -> Iterator[MonthSavings]:
+    """Replay (hour, kWh, spot price) in time order under both regimes, one result per month.
+
+    Spot: strømstøtte per hour on the month's first ``stromstotte_max_kwh``.
+    Norgespris: fixed price on the month's first ``norgespris_max_kwh``, spot
+    price (without strømstøtte) above the cap. The strømstøtte threshold is the
+    one in effect for each hour, so past years use past thresholds. Nettleie
+    is the same either way and is left out. Only the open month is kept in
+    memory, so any number of years can be streamed through. Months without
+    data are skipped.
+    """
+    # groupby only holds the current month's rows, so memory stays bounded
+    for (year, month), rows in groupby(hours, key=lambda row: (row[0].year, row[0].month)):
+        hour_count = 0
+        total_kwh = spot_kr = stotte_kr = stotte_kwh = norgespris_kr = norgespris_kwh = 0.0
+        for hour, kwh, spot_price in rows:
+            hour_count += 1
+            if kwh <= 0:
+                continue
+            total_kwh += kwh
+
+            # Strømstøtte: 90 % over terskel, bare for kWh innenfor månedstaket
+            capped_kwh = min(kwh, max(stromstotte_max_kwh - stotte_kwh, 0.0))
+            stotte_kwh += capped_kwh
+            stotte = 0.0
+            level = stromstotte_level.at(hour)
+            if spot_price > level:
+                stotte = (spot_price - level) * stromstotte_rate * capped_kwh
+            stotte_kr += stotte
+            spot_kr += kwh * spot_price - stotte
+
+            # Norgespris opp til taket, spotpris for resten
+            capped_kwh = min(kwh, max(norgespris_max_kwh - norgespris_kwh, 0.0))
+            norgespris_kwh += capped_kwh
+            norgespris_kr += capped_kwh * norgespris + (kwh - capped_kwh) * spot_price
+
+        yield MonthSavings(
+            date(year, month, 1),
+            hour_count,
+            total_kwh,
+            spot_kr,
+            stotte_kr,
+            stotte_kwh,
+            norgespris_kr,
+            norgespris_kwh,
+            spot_kr - norgespris_kr,
+        )
+
+
+def imported_hours(rows: Iterable[Mapping[str, Any]]) -> list[tuple[datetime, float, float]]:
+    """Hours from an imported series as (hour, kWh, spot price) in time order.
+
+    Rows are {time, kwh, spotpris} as given to the service. Aware timestamps
+    are converted to naive local time, like the hourly archive.
+    """
+    hours = [
+        (
+            row[ATTR_TIME].astimezone().replace(tzinfo=None) if row[ATTR_TIME].tzinfo else row[ATTR_TIME],
+            float(row[ATTR_KWH]),
+            float(row[ATTR_SPOTPRIS]),
+        )
+        for row in rows
+    ]
+    hours.sort(key=lambda hour: hour[0])
+    return hours
+
+
+def as_rows(months: Sequence[MonthSavings], digits: int = 2) -> list[dict[str, Any]]:
+    """One dict per month (for service responses)."""
+    return [
+        {
+            name: value.isoformat() if isinstance(value, date) else round(value, digits)
+            for name, value in month._asdict().items()
+        }
+        for month in months
+    ]
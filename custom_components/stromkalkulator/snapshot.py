@@ -0,0 +1,333 @@
+"""Precomputed sensor states for Strømkalkulator."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import STROMSTOTTE_MAX_KWH, get_mva_sats
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class SensorSnapshot:
+    """Every sensor's state and attributes for one coordinator refresh.
+
+    Built once per refresh and read-only afterwards. Entities look up their
+    own key, so lookups, rounding and fee calculations are done once for all
+    sensors instead of once per sensor on every state write.
+    """
+
+    __slots__ = ("_attributes", "_values")
+
+    _values: dict[str, Any]
+    _attributes: dict[str, dict[str, Any]]
+
+    def __init__(self, values: dict[str, Any], attributes: dict[str, dict[str, Any]]) -> None:
+        """Wrap computed states (keyed by sensor type)."""
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_attributes", attributes)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Snapshots are shared by all entities and never change."""
+        raise AttributeError("SensorSnapshot is read-only")
+
+    def __contains__(self, sensor_type: object) -> bool:
+        """True if the snapshot has a state for the sensor."""
+        return sensor_type in self._values
+
+    def value(self, sensor_type: str) -> Any:
+        """State for a sensor, None if not computed."""
+        return self._values.get(sensor_type)
+
+    def attributes(self, sensor_type: str) -> dict[str, Any] | None:
+        """Extra state attributes for a sensor, None if it has none."""
+        return self._attributes.get(sensor_type)
+
+    def changed(self, previous: SensorSnapshot) -> frozenset[str]:
+        """Sensor types whose state or attributes differ from a previous snapshot."""
+        sensor_types = (
+            self._values.keys() | self._attributes.keys() | previous._values.keys() | previous._attributes.keys()
+        )
+        return frozenset(
+            sensor_type
+            for sensor_type in sensor_types
+            if self._values.get(sensor_type) != previous._values.get(sensor_type)
+            or self._attributes.get(sensor_type) != previous._attributes.get(sensor_type)
+        )
+
+
+# Before the first refresh
+EMPTY_SNAPSHOT = SensorSnapshot({}, {})
+
+
+def _curve_attribute(data: Mapping[str, Any], day: str) -> list[dict[str, Any]] | None:
+    """Total price per interval for today or tomorrow, in the Nord Pool raw_today format."""
+    curve = data.get("price_curve", {}).get(day)
+    if curve is None:
+        return None
+    return [
+        {"start": start.isoformat(), "end": end.isoformat(), "value": round(value, 4)}
+        for start, end, value in zip(curve.start, curve.end, curve.total_price_inkl_avgifter, strict=True)
+    ]
+
+
+def _eks_avgifter(energiledd: float, forbruksavgift: float, enova_avgift: float, mva_sats: float) -> float:
+    """Energiledd without forbruksavgift, Enova-avgift and mva (as on the invoice)."""
+    eks_avgifter = energiledd - forbruksavgift - enova_avgift
+    if mva_sats > 0:
+        eks_avgifter = eks_avgifter / (1 + mva_sats)
+    return round(eks_avgifter, 4)
+
+
+def build_snapshot(
+    data: Mapping[str, Any],
+    *,
+    avgiftssone: str,
+    month: int,
+    tariff_periods: tuple[str, str],
+) -> SensorSnapshot:
+    """Compute every sensor's state from the coordinator data.
+
+    Keys are the sensor types used in the entities' unique IDs. The capacity
+    headroom sensor is not included, it follows every power sample.
+    """
+    values: dict[str, Any] = {}
+    attributes: dict[str, dict[str, Any]] = {}
+    tso = data["tso"]
+    spot_price = data["spot_price"]
+    stromstotte = data["stromstotte"]
+
+    # Kapasitet
+    top_3 = data["top_3_days"]
+    for rank, (day, power) in enumerate(top_3.items(), 1):
+        values[f"maks_forbruk_{rank}"] = round(power, 2)
+        attributes[f"maks_forbruk_{rank}"] = {"dato": day}
+    values["gjennomsnitt_forbruk"] = round(data["avg_top_3_kw"], 2)
+    attributes["gjennomsnitt_forbruk"] = {"kapasitetstrinn": data["kapasitetsledd"], "tso": tso}
+    values["trinn_nummer"] = data["kapasitetstrinn_nummer"]
+    values["trinn_intervall"] = data["kapasitetstrinn_intervall"]
+    values["kapasitetstrinn"] = data["kapasitetsledd"]
+    attributes["kapasitetstrinn"] = {
+        "trinn": data["kapasitetstrinn_nummer"],
+        "intervall": data["kapasitetstrinn_intervall"],
+        "gjennomsnitt_kw": data["avg_top_3_kw"],
+        "current_power_kw": data["current_power_kw"],
+        "intervall_forbruk_kwh": data["current_interval_kwh"],
+        "intervall_prognose_kw": data["current_interval_projection_kw"],
+        "avregning_minutter": data["settlement_minutes"],
+        "udekket_sekunder_time": data["uncovered_seconds_hour"],
+        "udekket_minutter_maaned": data["uncovered_minutes_month"],
+        "tso": tso,
+    }
+    for rank, (day, power) in enumerate(top_3.items(), 1):
+        attributes["kapasitetstrinn"][f"maks_{rank}_dato"] = day
+        attributes["kapasitetstrinn"][f"maks_{rank}_kw"] = round(power, 2)
+
+    # Energiledd
+    is_day_rate = data["is_day_rate"]
+    values["energiledd"] = data["energiledd"]
+    attributes["energiledd"] = {
+        "is_day_rate": is_day_rate,
+        "rate_type": "dag" if is_day_rate else "natt/helg",
+        "energiledd_dag": data["energiledd_dag"],
+        "energiledd_natt": data["energiledd_natt"],
+        "tso": tso,
+    }
+    values["tariff"] = "dag" if is_day_rate else "natt"
+    attributes["tariff"] = {
+        "is_day_rate": is_day_rate,
+        "dag_periode": tariff_periods[0],
+        "natt_periode": tariff_periods[1],
+        "bruk": "Bruk denne sensoren til å styre utility_meter tariff-bytte",
+    }
+
+    # Offentlige avgifter, satsene som gjelder nå (fra coordinator)
+    forbruksavgift = data["forbruksavgift_eks_mva"]
+    enova_avgift = data["enova_avgift_eks_mva"]
+    mva_sats = get_mva_sats(avgiftssone)
+    mva_tekst = f"{int(mva_sats * 100)}%"
+    forbruksavgift_inkl_mva = round(forbruksavgift * (1 + mva_sats), 4)
+    enova_inkl_mva = round(enova_avgift * (1 + mva_sats), 4)
+    values["offentlige_avgifter"] = round((forbruksavgift + enova_avgift) * (1 + mva_sats), 2)
+    attributes["offentlige_avgifter"] = {
+        "avgiftssone": avgiftssone,
+        "sesong": "vinter" if month <= 3 else "sommer",
+        "forbruksavgift_eks_mva": forbruksavgift,
+        "forbruksavgift_inkl_mva": forbruksavgift_inkl_mva,
+        "enova_avgift_eks_mva": enova_avgift,
+        "enova_avgift_inkl_mva": enova_inkl_mva,
+        "mva_sats": mva_tekst,
+        "note": "Disse avgiftene er inkludert i energileddet fra nettselskapet",
+    }
+    values["forbruksavgift"] = forbruksavgift_inkl_mva
+    attributes["forbruksavgift"] = {
+        "eks_mva": forbruksavgift,
+        "inkl_mva": forbruksavgift_inkl_mva,
+        "mva_sats": mva_tekst,
+        "avgiftssone": avgiftssone,
+        "ore_per_kwh_eks_mva": round(forbruksavgift * 100, 2),
+        "note": "Fakturaen viser forbruksavgift eks. mva",
+    }
+    values["enovaavgift"] = enova_inkl_mva
+    enova_ore = f"{enova_avgift * 100:.1f}".replace(".", ",")
+    attributes["enovaavgift"] = {
+        "eks_mva": enova_avgift,
+        "inkl_mva": enova_inkl_mva,
+        "mva_sats": mva_tekst,
+        "avgiftssone": avgiftssone,
+        "ore_per_kwh_eks_mva": round(enova_avgift * 100, 2),
+        "note": f"Fakturaen viser Enova-avgift eks. mva ({enova_ore} øre/kWh)",
+    }
+
+    # Fakturasammenligning: energiledd eks. avgifter
+    for period in ("dag", "natt"):
+        energiledd = data[f"energiledd_{period}"]
+        values[f"energiledd_{period}"] = energiledd
+        attributes[f"energiledd_{period}"] = {
+            "inkl_avgifter_mva": energiledd,
+            "eks_avgifter_mva": _eks_avgifter(energiledd, forbruksavgift, enova_avgift, mva_sats),
+            "note": "Fakturaen viser pris eks. avgifter. Sammenlign med eks_avgifter_mva.",
+        }
+
+    # Strømpriser
+    values["total_price"] = data["total_price_uten_stotte"]
+    attributes["total_price"] = {
+        "spot_price": spot_price,
+        "energiledd": data["energiledd"],
+        "kapasitetsledd_per_kwh": data["kapasitetsledd_per_kwh"],
+        "tso": tso,
+    }
+    values["electricity_company_total"] = data["electricity_company_total"]
+    attributes["electricity_company_total"] = {
+        "electricity_company_pris": data["electricity_company_price"],
+        "energiledd": data["energiledd"],
+        "kapasitetsledd_per_kwh": data["kapasitetsledd_per_kwh"],
+    }
+
+    # Strømstøtte
+    stromstotte_terskel = data["stromstotte_terskel"]
+    values["stromstotte"] = stromstotte
+    attributes["stromstotte"] = {"spotpris": spot_price, "terskel": stromstotte_terskel, "dekningsgrad": "90%"}
+    values["spotpris_etter_stotte"] = data["spotpris_etter_stotte"]
+    attributes["spotpris_etter_stotte"] = {"spotpris": spot_price, "stromstotte": stromstotte}
+    price_breakdown = {
+        "spotpris": spot_price,
+        "stromstotte": stromstotte,
+        "spotpris_etter_stotte": data["spotpris_etter_stotte"],
+        "energiledd": data["energiledd"],
+        "kapasitetsledd_per_kwh": data["kapasitetsledd_per_kwh"],
+    }
+    values["total_pris_etter_stotte"] = data["total_price"]
+    attributes["total_pris_etter_stotte"] = price_breakdown
+    values["total_pris_inkl_avgifter"] = data["total_price_inkl_avgifter"]
+    attributes["total_pris_inkl_avgifter"] = {
+        **price_breakdown,
+        "forbruksavgift_inkl_mva": data["forbruksavgift_inkl_mva"],
+        "enova_inkl_mva": data["enova_inkl_mva"],
+        "offentlige_avgifter": data["offentlige_avgifter"],
+        "bruk": "Bruk denne sensoren i Energy Dashboard for korrekt totalpris",
+        "i_dag": _curve_attribute(data, "today"),
+        "i_morgen": _curve_attribute(data, "tomorrow"),
+    }
+    values["stromstotte_aktiv"] = "Ja" if stromstotte > 0 else "Nei"
+    attributes["stromstotte_aktiv"] = {
+        "spotpris": spot_price,
+        "terskel": stromstotte_terskel,
+        "over_terskel": spot_price > stromstotte_terskel,
+        "stromstotte_per_kwh": stromstotte,
+        "note": f"Timer hvor spotpris > {stromstotte_terskel * 100:.2f} øre/kWh gir strømstøtte på fakturaen",
+    }
+
+    # Norgespris
+    norgespris = data["norgespris"]
+    values["total_pris_norgespris"] = data["total_pris_norgespris"]
+    attributes["total_pris_norgespris"] = {
+        "norgespris": norgespris,
+        "norgespris_stromstotte": data["norgespris_stromstotte"],
+        "energiledd": data["energiledd"],
+        "kapasitetsledd_per_kwh": data["kapasitetsledd_per_kwh"],
+        "note": "Norgespris er fast 50 øre/kWh fra Elhub",
+    }
+    values["prisforskjell_norgespris"] = data["kroner_spart_per_kwh"]
+    attributes["prisforskjell_norgespris"] = {
+        "din_pris_etter_stotte": data["spotpris_etter_stotte"],
+        "norgespris_etter_stotte": norgespris - data["norgespris_stromstotte"],
+        "differens_per_kwh": data["kroner_spart_per_kwh"],
+        "note": "Norgespris er fast 50 øre/kWh fra Elhub",
+    }
+    values["norgespris_aktiv"] = "Ja" if data["har_norgespris"] else "Nei"
+
+    # Månedlig forbruk og kostnad
+    dag_kwh = data["monthly_consumption_dag_kwh"]
+    natt_kwh = data["monthly_consumption_natt_kwh"]
+    total_kwh = data["monthly_consumption_total_kwh"]
+    costs = data["monthly_costs"]
+    values["maanedlig_forbruk_dag"] = dag_kwh
+    values["maanedlig_forbruk_natt"] = natt_kwh
+    values["maanedlig_forbruk_total"] = total_kwh
+    attributes["maanedlig_forbruk_total"] = {"dag_kwh": dag_kwh, "natt_kwh": natt_kwh}
+    values["maanedlig_nettleie"] = costs["nettleie_kr"]
+    attributes["maanedlig_nettleie"] = {
+        "energiledd_dag_kr": costs["energiledd_dag_kr"],
+        "energiledd_natt_kr": costs["energiledd_natt_kr"],
+        "kapasitetsledd_kr": costs["kapasitetsledd_kr"],
+    }
+    values["maanedlig_avgifter"] = costs["avgifter_kr"]
+    attributes["maanedlig_avgifter"] = {
+        "forbruksavgift_kr": costs["forbruksavgift_kr"],
+        "enovaavgift_kr": costs["enovaavgift_kr"],
+        "avgiftssone": avgiftssone,
+    }
+    values["maanedlig_stromstotte"] = costs["stromstotte_kr"]
+    attributes["maanedlig_stromstotte"] = {
+        "merknad": "Beregnet per time/kvarter med spotprisen i intervallet, for de første 5000 kWh.",
+        "stromstotte_kwh": costs["stromstotte_kwh"],
+        "tak_kwh": STROMSTOTTE_MAX_KWH,
+        "stromstotte_per_kwh": stromstotte,
+        "har_norgespris": data["har_norgespris"],
+    }
+    values["maanedlig_total"] = costs["total_kr"]
+    attributes["maanedlig_total"] = {
+        "nettleie_kr": costs["nettleie_kr"],
+        "avgifter_kr": costs["avgifter_kr"],
+        "stromstotte_kr": costs["stromstotte_kr"],
+        "spotpris_kr": costs["spotpris_kr"],
+        "spotpris_ukjent_kwh": costs["spotpris_ukjent_kwh"],
+        "forbruk_dag_kwh": round(dag_kwh, 1),
+        "forbruk_natt_kwh": round(natt_kwh, 1),
+        "forbruk_total_kwh": round(total_kwh, 1),
+    }
+
+    # Forrige måned
+    month_name = data["previous_month_name"]
+    previous_dag_kwh = data["previous_month_consumption_dag_kwh"]
+    previous_natt_kwh = data["previous_month_consumption_natt_kwh"]
+    previous_costs = data["previous_month_costs"]
+    values["forrige_maaned_forbruk_dag"] = previous_dag_kwh
+    attributes["forrige_maaned_forbruk_dag"] = {"måned": month_name}
+    values["forrige_maaned_forbruk_natt"] = previous_natt_kwh
+    attributes["forrige_maaned_forbruk_natt"] = {"måned": month_name}
+    values["forrige_maaned_forbruk_total"] = data["previous_month_consumption_total_kwh"]
+    attributes["forrige_maaned_forbruk_total"] = {
+        "måned": month_name,
+        "dag_kwh": previous_dag_kwh,
+        "natt_kwh": previous_natt_kwh,
+    }
+    values["forrige_maaned_nettleie"] = previous_costs["nettleie_kr"]
+    attributes["forrige_maaned_nettleie"] = {
+        "måned": month_name,
+        "energiledd_dag_kr": previous_costs["energiledd_dag_kr"],
+        "energiledd_natt_kr": previous_costs["energiledd_natt_kr"],
+        "kapasitetsledd_kr": previous_costs["kapasitetsledd_kr"],
+        "snitt_topp_3_kw": data["previous_month_avg_top_3_kw"],
+        "stromstotte_kr": previous_costs["stromstotte_kr"],
+    }
+    values["forrige_maaned_toppforbruk"] = data["previous_month_avg_top_3_kw"]
+    attributes["forrige_maaned_toppforbruk"] = {"måned": month_name}
+    previous_top = sorted(data["previous_month_top_3"].items(), key=lambda item: item[1], reverse=True)
+    for rank, (day, power) in enumerate(previous_top, 1):
+        attributes["forrige_maaned_toppforbruk"][f"topp_{rank}_dato"] = day
+        attributes["forrige_maaned_toppforbruk"][f"topp_{rank}_kw"] = round(power, 2)
+
+    return SensorSnapshot(values, attributes)
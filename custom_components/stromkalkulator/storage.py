@@ -0,0 +1,248 @@
+"""Persistent storage schema for Strømkalkulator."""
+
+from __future__ import annotations
+
+import base64
+import logging
+import sys
+from array import array
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from homeassistant.helpers.storage import Store
+
+from .accumulator import MAX_DAYS_IN_MONTH
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from homeassistant.core import HomeAssistant
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+STORAGE_VERSION: int = 2
+
+# Day offsets are counted from this date (the "epoch" of the stored month)
+_EPOCH: date = date(1970, 1, 1)
+
+# Schema v2:
+# {
+#   "epoch_day": 20454,              # First day of current month, days since 1970-01-01
+#   "settlement_minutes": 60,
+#   "interval_kwh": "<base64>",      # float32 little-endian, one per interval in the month
+#   "daily_max_kw": [0.0, 4.2, ...], # Index = day of month - 1, 0.0 = no data
+#   "current_interval": 412,         # Open interval index (same indexing as interval_kwh) or None
+#   "last_sample": 1234567,          # Seconds from month start to the last booked sample, or None
+#   "meter_reading": 48213.52,       # Last energy meter register reading (kWh), or None
+#   "uncovered_s": "<base64>",       # float32 little-endian, seconds per hour no sample covered
+#   "consumption_kwh": [dag, natt],
+#   "costs": {"energiledd_dag_kr": 41.2, ...},  # CostLedger totals, None before costs were stored
+#   "previous_month": {
+#     "name": "januar 2026",
+#     "consumption_kwh": [dag, natt],
+#     "costs": {...},
+#     "top_days": [[-27, 6.1], ...], # [day offset from epoch_day, kW], negative = previous month
+#   },
+# }
+
+
+class StoredState(TypedDict):
+    """Decoded storage state."""
+
+    month_start: date
+    settlement_minutes: int
+    interval_kwh: Sequence[float]
+    daily_max_power: dict[str, float]
+    monthly_consumption: dict[str, float]
+    current_interval: datetime | None
+    last_sample: datetime | None
+    meter_reading: float | None
+    uncovered_seconds: Sequence[float]
+    costs: dict[str, float] | None
+    previous_month_consumption: dict[str, float]
+    previous_month_top_3: dict[str, float]
+    previous_month_name: str | None
+    previous_month_costs: dict[str, float] | None
+
+
+class StromkalkulatorStore(Store[dict[str, Any]]):  # type: ignore[misc]
+    """Store with migration from the v1 dict format."""
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the store."""
+        super().__init__(hass, STORAGE_VERSION, key)
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Migrate stored data to the current schema."""
+        if old_major_version == 1:
+            _LOGGER.info("Migrating %s from storage version 1 to %s", self.key, STORAGE_VERSION)
+            return migrate_v1_to_v2(old_data, date.today())
+        return old_data
+
+
+def encode(state: StoredState) -> dict[str, Any]:
+    """Encode state to the compact v2 format."""
+    month_start = state["month_start"]
+    epoch_day = (month_start - _EPOCH).days
+    settlement_minutes = state["settlement_minutes"]
+    slots_per_day = 1440 // settlement_minutes
+
+    daily_max = [0.0] * MAX_DAYS_IN_MONTH
+    for day_str, kw in state["daily_max_power"].items():
+        offset = _day_offset(day_str, month_start)
+        if 0 <= offset < MAX_DAYS_IN_MONTH:
+            daily_max[offset] = round(kw, 6)
+
+    current = state["current_interval"]
+    current_index = None
+    if current is not None:
+        current_index = (current.day - 1) * slots_per_day + (current.hour * 60 + current.minute) // settlement_minutes
+
+    return {
+        "epoch_day": epoch_day,
+        "settlement_minutes": settlement_minutes,
+        "interval_kwh": _pack_floats(state["interval_kwh"]),
+        "daily_max_kw": daily_max,
+        "current_interval": current_index,
+        "last_sample": (
+            None
+            if state["last_sample"] is None
+            else int((state["last_sample"] - datetime.combine(month_start, datetime.min.time())).total_seconds())
+        ),
+        "meter_reading": state["meter_reading"],
+        "uncovered_s": _pack_floats(state["uncovered_seconds"]),
+        "consumption_kwh": [state["monthly_consumption"]["dag"], state["monthly_consumption"]["natt"]],
+        "costs": _round_values(state["costs"]),
+        "previous_month": {
+            "name": state["previous_month_name"],
+            "costs": _round_values(state["previous_month_costs"]),
+            "consumption_kwh": [
+                state["previous_month_consumption"]["dag"],
+                state["previous_month_consumption"]["natt"],
+            ],
+            "top_days": [
+                [_day_offset(day_str, month_start), round(kw, 6)]
+                for day_str, kw in state["previous_month_top_3"].items()
+            ],
+        },
+    }
+
+
+def decode(data: dict[str, Any]) -> StoredState:
+    """Decode the compact v2 format."""
+    month_start = _EPOCH + timedelta(days=data["epoch_day"])
+    settlement_minutes = int(data.get("settlement_minutes", 60))
+    slots_per_day = 1440 // settlement_minutes
+
+    daily_max_power = {
+        (month_start + timedelta(days=offset)).isoformat(): kw
+        for offset, kw in enumerate(data.get("daily_max_kw", []))
+        if kw > 0
+    }
+
+    current_interval = None
+    current_index = data.get("current_interval")
+    if current_index is not None:
+        day, slot = divmod(current_index, slots_per_day)
+        current_interval = datetime.combine(month_start + timedelta(days=day), datetime.min.time()) + timedelta(
+            minutes=slot * settlement_minutes
+        )
+
+    last_sample = None
+    if data.get("last_sample") is not None:
+        last_sample = datetime.combine(month_start, datetime.min.time()) + timedelta(seconds=data["last_sample"])
+
+    dag, natt = data.get("consumption_kwh", [0.0, 0.0])
+    previous: dict[str, Any] = data.get("previous_month") or {}
+    prev_dag, prev_natt = previous.get("consumption_kwh", [0.0, 0.0])
+
+    return {
+        "month_start": month_start,
+        "settlement_minutes": settlement_minutes,
+        "interval_kwh": _unpack_floats(data.get("interval_kwh", "")),
+        "daily_max_power": daily_max_power,
+        "monthly_consumption": {"dag": dag, "natt": natt},
+        "current_interval": current_interval,
+        "last_sample": last_sample,
+        "meter_reading": data.get("meter_reading"),
+        "uncovered_seconds": _unpack_floats(data.get("uncovered_s", "")),
+        "costs": data.get("costs"),
+        "previous_month_consumption": {"dag": prev_dag, "natt": prev_natt},
+        "previous_month_top_3": {
+            (month_start + timedelta(days=offset)).isoformat(): kw for offset, kw in previous.get("top_days", [])
+        },
+        "previous_month_name": previous.get("name"),
+        "previous_month_costs": previous.get("costs"),
+    }
+
+
+def migrate_v1_to_v2(data: dict[str, Any], today: date) -> dict[str, Any]:
+    """Migrate the v1 dict format (string date keys) to v2.
+
+    v1 only stored the month number, so the year is taken from the stored
+    dates when there are any, otherwise the most recent such month up to today.
+    """
+    month = int(data.get("current_month") or today.month)
+    daily_max_power: dict[str, float] = data.get("daily_max_power") or {}
+    if daily_max_power:
+        year = date.fromisoformat(next(iter(daily_max_power))).year
+    elif data.get("current_interval"):
+        year = datetime.fromisoformat(data["current_interval"]).year
+    else:
+        year = today.year if month <= today.month else today.year - 1
+    month_start = date(year, month, 1)
+
+    settlement_minutes = int(data.get("settlement_minutes", 60))
+    size = MAX_DAYS_IN_MONTH * 1440 // settlement_minutes
+    interval_kwh = list(data.get("interval_kwh") or [])[:size]
+    interval_kwh.extend([0.0] * (size - len(interval_kwh)))
+
+    current_interval = data.get("current_interval")
+    state: StoredState = {
+        "month_start": month_start,
+        "settlement_minutes": settlement_minutes,
+        "interval_kwh": interval_kwh,
+        "daily_max_power": daily_max_power,
+        "monthly_consumption": data.get("monthly_consumption") or {"dag": 0.0, "natt": 0.0},
+        "current_interval": datetime.fromisoformat(current_interval) if current_interval else None,
+        "last_sample": None,
+        "meter_reading": None,
+        "uncovered_seconds": [],
+        "costs": None,
+        "previous_month_consumption": data.get("previous_month_consumption") or {"dag": 0.0, "natt": 0.0},
+        "previous_month_top_3": data.get("previous_month_top_3") or {},
+        "previous_month_name": data.get("previous_month_name"),
+        "previous_month_costs": None,
+    }
+    return encode(state)
+
+
+def _day_offset(day_str: str, month_start: date) -> int:
+    """Days from month start to a YYYY-MM-DD date."""
+    return (date.fromisoformat(day_str) - month_start).days
+
+
+def _round_values(values: dict[str, float] | None) -> dict[str, float] | None:
+    """Round stored amounts to 4 decimals."""
+    if values is None:
+        return None
+    return {key: round(value, 4) for key, value in values.items()}
+
+
+def _pack_floats(values: Sequence[float]) -> str:
+    """Pack floats as base64 float32 little-endian."""
+    packed = array("f", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def _unpack_floats(encoded: str) -> list[float]:
+    """Unpack base64 float32 little-endian."""
+    packed = array("f")
+    packed.frombytes(base64.b64decode(encoded))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tolist()
@@ -0,0 +1,136 @@
+"""Dag/natt tariff calendar for Strømkalkulator."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, NamedTuple
+
+from .const import DEFAULT_TIDSPLAN
+from .holidays import norwegian_holidays
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Sequence
+
+    from .tso import TidsplanPeriode
+
+_WEEKDAYS: tuple[int, ...] = (0, 1, 2, 3, 4)
+_WEEKDAY_NAMES: tuple[str, ...] = ("man", "tir", "ons", "tor", "fre", "lør", "søn")
+_MONTH_NAMES: tuple[str, ...] = ("jan", "feb", "mar", "apr", "mai", "jun", "jul", "aug", "sep", "okt", "nov", "des")
+
+
+class CompiledPeriode(NamedTuple):
+    """A schedule period with its day window as a 24-byte hour mask."""
+
+    hours: bytes
+    weekdays: frozenset[int]
+    months: frozenset[int]
+    holidays: bool
+    start: int
+    end: int
+
+
+def compile_tidsplan(tidsplan: Sequence[TidsplanPeriode]) -> tuple[CompiledPeriode, ...]:
+    """Validate a TSO schedule and compile it to hour masks."""
+    compiled = []
+    for periode in tidsplan:
+        start, end = periode["timer"]
+        if not 0 <= start < end <= 24:
+            raise ValueError(f"Invalid day window {start}-{end}")
+        weekdays = frozenset(periode.get("ukedager", _WEEKDAYS))
+        if not weekdays or not weekdays <= set(range(7)):
+            raise ValueError(f"Invalid weekdays {sorted(weekdays)}")
+        months = frozenset(periode.get("maaneder", range(1, 13)))
+        if not months or not months <= set(range(1, 13)):
+            raise ValueError(f"Invalid months {sorted(months)}")
+        hours = bytes(1 if start <= hour < end else 0 for hour in range(24))
+        compiled.append(CompiledPeriode(hours, weekdays, months, periode.get("helligdager", False), start, end))
+    return tuple(compiled)
+
+
+class TariffCalendar:
+    """Precompiled dag/natt lookup per hour.
+
+    The first lookup in a year builds a bytearray with one entry per hour of
+    the year (1 = dagtariff), so every later lookup is a single index. An hour
+    is dag when it is inside any period of the schedule for that month and
+    weekday (holidays only count when the period says so), otherwise natt.
+    """
+
+    def __init__(
+        self,
+        tidsplan: Sequence[TidsplanPeriode] = DEFAULT_TIDSPLAN,
+        holidays: Callable[[int], Collection[date]] = norwegian_holidays,
+    ) -> None:
+        """Initialize the calendar (nothing is built until first use)."""
+        self.periods = compile_tidsplan(tidsplan)
+        self._holidays = holidays
+        self._years: dict[int, bytearray] = {}
+        # Hour mask per (month, weekday, holiday), shared by all days that match
+        self._patterns: dict[tuple[int, int, bool], bytes] = {}
+
+    def is_day(self, dt: datetime) -> bool:
+        """Check if a time is on dagtariff."""
+        hours = self._years.get(dt.year)
+        if hours is None:
+            hours = self._years[dt.year] = self._compile_year(dt.year)
+        return bool(hours[(dt.timetuple().tm_yday - 1) * 24 + dt.hour])
+
+    def day_mask(self, day: date) -> bytes:
+        """Dag/natt for the 24 hours of a day (1 = dagtariff)."""
+        hours = self._years.get(day.year)
+        if hours is None:
+            hours = self._years[day.year] = self._compile_year(day.year)
+        first = (day.timetuple().tm_yday - 1) * 24
+        return bytes(hours[first : first + 24])
+
+    def describe(self) -> tuple[str, str]:
+        """Human-readable dag and natt periods (Norwegian)."""
+        parts = []
+        for period in self.periods:
+            text = f"{_describe_weekdays(period.weekdays)} {period.start:02d}:00-{period.end:02d}:00"
+            if len(period.months) < 12:
+                text += f" i {_describe_months(period.months)}"
+            text += " (også helligdager)" if period.holidays else " (ikke helligdager)"
+            parts.append(text)
+        if not parts:
+            return "Ingen", "Hele døgnet"
+        period = self.periods[0]
+        if len(self.periods) == 1 and period.weekdays == frozenset(_WEEKDAYS) and len(period.months) == 12:
+            return parts[0], f"{period.end:02d}:00-{period.start:02d}:00, helger og helligdager"
+        return ", ".join(parts), "Resten av tiden"
+
+    def _compile_year(self, year: int) -> bytearray:
+        """Build the hour bitmap for a year."""
+        holidays = self._holidays(year)
+        day = date(year, 1, 1)
+        hours = bytearray()
+        while day.year == year:
+            key = (day.month, day.weekday(), day in holidays)
+            pattern = self._patterns.get(key)
+            if pattern is None:
+                pattern = self._patterns[key] = self._day_pattern(*key)
+            hours += pattern
+            day += timedelta(days=1)
+        return hours
+
+    def _day_pattern(self, month: int, weekday: int, holiday: bool) -> bytes:
+        """Hour mask for a kind of day: union of the periods that apply."""
+        pattern = bytearray(24)
+        for period in self.periods:
+            if month in period.months and weekday in period.weekdays and (period.holidays or not holiday):
+                pattern = bytearray(a | b for a, b in zip(pattern, period.hours, strict=True))
+        return bytes(pattern)
+
+
+def _describe_weekdays(weekdays: frozenset[int]) -> str:
+    """Weekdays as text ("Hverdager", "Alle dager" or "man, lør")."""
+    if weekdays == frozenset(_WEEKDAYS):
+        return "Hverdager"
+    if len(weekdays) == 7:
+        return "Alle dager"
+    return ", ".join(_WEEKDAY_NAMES[day] for day in sorted(weekdays)).capitalize()
+
+
+def _describe_months(months: frozenset[int]) -> str:
+    """Months as text ("nov, des, jan")."""
+    return ", ".join(_MONTH_NAMES[month - 1] for month in sorted(months))
@@ -0,0 +1,107 @@
+"""Effective-dated rates for Strømkalkulator."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from .const import AVGIFTSSONE_TILTAKSSONE, ENOVA_AVGIFT, FORBRUKSAVGIFT_ALMINNELIG, STROMSTOTTE_LEVEL
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .tso import TSOEntry
+
+
+class RateHistory:
+    """One rate with the values it had in earlier periods.
+
+    Periods [fra, til) override the current value, outside them the current
+    value applies. The period boundaries are sorted into an index once, so
+    finding the rate for a timestamp is one bisect rather than a scan of the
+    periods for every interval replayed.
+    """
+
+    __slots__ = ("_starts", "_values")
+
+    _starts: list[date]
+    _values: list[float]
+
+    def __init__(self, current: float, periods: Iterable[tuple[date, date, float]] = ()) -> None:
+        """Build the index. Raises ValueError for empty or overlapping periods."""
+        # _values[i] gjelder fra _starts[i - 1] til _starts[i]
+        starts: list[date] = []
+        values: list[float] = [current]
+        for fra, til, value in sorted(periods):
+            if fra >= til or (starts and fra < starts[-1]):
+                raise ValueError(f"Tom eller overlappende periode {fra} - {til}")
+            if starts and fra == starts[-1]:
+                # Starter der forrige periode slutter
+                values[-1] = value
+            else:
+                starts.append(fra)
+                values.append(value)
+            starts.append(til)
+            values.append(current)
+        self._starts = starts
+        self._values = values
+
+    def at(self, when: date | datetime) -> float:
+        """The value in effect on a date (a timestamp uses its date)."""
+        if isinstance(when, datetime):
+            when = when.date()
+        return self._values[bisect_right(self._starts, when)]
+
+
+# Strømstøtte-terskel inkl. mva, time for time fra september 2023
+# Kilde: Forskrift om strømstønad § 5 (se const.py for historikken)
+STROMSTOTTE_LEVEL_HISTORY: Final[RateHistory] = RateHistory(
+    STROMSTOTTE_LEVEL,
+    [
+        (date(2023, 9, 1), date(2024, 1, 1), 0.8750),  # 70 øre eks. mva
+        (date(2024, 1, 1), date(2025, 1, 1), 0.9125),  # 73 øre eks. mva
+        (date(2025, 1, 1), date(2026, 1, 1), 0.9375),  # 75 øre eks. mva
+    ],
+)
+
+# Forbruksavgift, alminnelig sats eks. mva (før 2026 med vinter- og sommersats)
+# Kilde: https://www.skatteetaten.no/satser/elektrisk-kraft/
+# Okt-des 2025 stemmer med BKK-fakturaene (15,662 øre/kWh inkl. mva)
+FORBRUKSAVGIFT_HISTORY: Final[RateHistory] = RateHistory(
+    FORBRUKSAVGIFT_ALMINNELIG,
+    [
+        (date(2025, 1, 1), date(2025, 4, 1), 0.1566),  # 15,66 øre/kWh
+        (date(2025, 4, 1), date(2026, 1, 1), 0.1253),  # 12,53 øre/kWh
+    ],
+)
+
+# Enova-avgift eks. mva, uendret 1,0 øre/kWh (1,25 øre inkl. mva på 2025-fakturaene)
+ENOVA_AVGIFT_HISTORY: Final[RateHistory] = RateHistory(ENOVA_AVGIFT)
+
+
+def forbruksavgift_at(avgiftssone: str, when: date | datetime) -> float:
+    """Forbruksavgift eks. mva on a date (tiltakssonen is exempt)."""
+    if avgiftssone == AVGIFTSSONE_TILTAKSSONE:
+        return 0.0
+    return FORBRUKSAVGIFT_HISTORY.at(when)
+
+
+class EnergileddHistory(NamedTuple):
+    """Energiledd dag and natt for a TSO over time (NOK/kWh inkl. avgifter)."""
+
+    dag: RateHistory
+    natt: RateHistory
+
+    def at(self, when: date | datetime, is_day: bool) -> float:
+        """Energiledd in effect on a date."""
+        return (self.dag if is_day else self.natt).at(when)
+
+
+def energiledd_history(tso: TSOEntry, energiledd_dag: float, energiledd_natt: float) -> EnergileddHistory:
+    """The TSO's earlier energiledd from its historikk, with the configured prices as current."""
+    periods = tso.get("historikk", [])
+    return EnergileddHistory(
+        RateHistory(energiledd_dag, [(p["fra"], p["til"], p["energiledd_dag"]) for p in periods]),
+        RateHistory(energiledd_natt, [(p["fra"], p["til"], p["energiledd_natt"]) for p in periods]),
+    )
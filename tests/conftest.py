@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -15,12 +16,83 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components"))
 sys.modules["homeassistant"] = MagicMock()
 sys.modules["homeassistant.const"] = MagicMock()
 sys.modules["homeassistant.core"] = MagicMock()
+sys.modules["homeassistant.exceptions"] = MagicMock()
 sys.modules["homeassistant.config_entries"] = MagicMock()
 sys.modules["homeassistant.helpers"] = MagicMock()
 sys.modules["homeassistant.helpers.storage"] = MagicMock()
 sys.modules["homeassistant.helpers.update_coordinator"] = MagicMock()
 sys.modules["homeassistant.helpers.entity"] = MagicMock()
+sys.modules["homeassistant.helpers.event"] = MagicMock()
+sys.modules["homeassistant.helpers.dispatcher"] = MagicMock()
+sys.modules["homeassistant.helpers.config_validation"] = MagicMock()
 sys.modules["homeassistant.components.sensor"] = MagicMock()
+sys.modules["voluptuous"] = MagicMock()
+
+
+class DataUpdateCoordinator:
+    """Minimal DataUpdateCoordinator, so the coordinator can be built with a mocked hass."""
+
+    def __class_getitem__(cls, item: object) -> type:
+        return cls
+
+    def __init__(self, hass: object, logger: object, *, name: str, update_interval: object) -> None:
+        self.hass = hass
+        self.logger = logger
+        self.name = name
+        self.update_interval = update_interval
+        self.data = None
+
+
+sys.modules["homeassistant.helpers.update_coordinator"].DataUpdateCoordinator = DataUpdateCoordinator
+
+
+class ConfigFlow:
+    """Minimal ConfigFlow, so the config flow module can be imported."""
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__()
+
+
+class OptionsFlow:
+    """Minimal OptionsFlow returning results as dicts. Tests set hass and config_entry."""
+
+    def async_create_entry(self, *, title: str, data: dict[str, object]) -> dict[str, object]:
+        return {"type": "create_entry", "title": title, "data": data}
+
+    def async_show_form(self, *, step_id: str, **kwargs: object) -> dict[str, object]:
+        return {"type": "form", "step_id": step_id, **kwargs}
+
+
+class CoordinatorEntity:
+    """Minimal CoordinatorEntity, so the sensor classes can be built."""
+
+    def __init__(self, coordinator: object) -> None:
+        self.coordinator = coordinator
+
+
+class SensorEntity:
+    """Minimal SensorEntity, so the sensor classes keep their class attributes."""
+
+    _unrecorded_attributes: frozenset[str] = frozenset()
+
+
+sys.modules["homeassistant.helpers.update_coordinator"].CoordinatorEntity = CoordinatorEntity
+sys.modules["homeassistant.components.sensor"].SensorEntity = SensorEntity
+sys.modules["homeassistant.config_entries"].ConfigFlow = ConfigFlow
+sys.modules["homeassistant.config_entries"].OptionsFlow = OptionsFlow
+sys.modules["homeassistant"].config_entries = sys.modules["homeassistant.config_entries"]
+# Callbacks run as plain functions, so coordinator methods can be called directly
+sys.modules["homeassistant.core"].callback = lambda func: func
+
+
+@pytest.fixture
+def oslo_time(monkeypatch):
+    """Local time is Europe/Oslo (with daylight saving time), as in Home Assistant."""
+    monkeypatch.setenv("TZ", "Europe/Oslo")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
 
 
 @pytest.fixture
@@ -0,0 +1,571 @@
+"""Test energy and peak accumulation from power samples.
+
+Tests:
+- Poll sampling (interval charged at the new reading)
+- Event ingestion (interval charged at the held reading)
+- Hourly energy peaks (capacity tier uses hourly averages)
+- 15-minute settlement (kvartersoppgjør)
+- Open interval projection
+- Out-of-order samples
+- End of daylight saving time (repeated hour)
+- Incremental top-N days tracking
+- Backfill from recorder statistics after downtime (power means or energy sums)
+- Energy meter register deltas (reset, rollover, jitter)
+- Integration methods and gap capping
+- Capacity headroom (max peak before next tier)
+- Energy hook called per interval for cost booking
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.stromkalkulator.accumulator import (
+    ConsumptionAccumulator,
+    MeterRegister,
+    TopDaysTracker,
+    energy_sum_segments,
+)
+
+
+def is_day_rate(dt: datetime) -> bool:
+    """Simplified day rate: weekdays 06-22."""
+    return dt.weekday() < 5 and 6 <= dt.hour < 22
+
+
+@pytest.fixture
+def accumulator():
+    """Fresh accumulator."""
+    return ConsumptionAccumulator(is_day_rate)
+
+
+class TestPollSampling:
+    """Tests for the legacy 1-minute poll."""
+
+    def test_first_sample_gives_no_energy(self, accumulator):
+        """First sample has no interval to integrate over."""
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 0), 3.0)
+        assert accumulator.monthly_consumption == {"dag": 0.0, "natt": 0.0}
+
+    def test_interval_charged_at_new_reading(self, accumulator):
+        """Poll charges the interval at the latest reading."""
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 0), 1.0)
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 30), 4.0)
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(2.0)
+
+    def test_night_bucket(self, accumulator):
+        """Energy at night goes to the natt bucket."""
+        accumulator.add_sample(datetime(2026, 1, 5, 23, 0), 2.0)
+        accumulator.add_sample(datetime(2026, 1, 5, 23, 30), 2.0)
+        assert accumulator.monthly_consumption["natt"] == pytest.approx(1.0)
+        assert accumulator.monthly_consumption["dag"] == 0.0
+
+
+class TestEventIngestion:
+    """Tests for event-driven ingestion (every sensor change)."""
+
+    def test_interval_charged_at_held_reading(self, accumulator):
+        """A step from 1 kW to 4 kW charges the interval before it at 1 kW."""
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 0), 1.0, method="left")
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 30), 4.0, method="left")
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(0.5)
+
+    def test_two_second_samples_are_exact(self, accumulator):
+        """One hour of 2-second samples at 3 kW gives exactly 3 kWh."""
+        start = datetime(2026, 1, 5, 10, 0)
+        for i in range(1801):
+            accumulator.add_sample(start + timedelta(seconds=2 * i), 3.0, method="left")
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(3.0)
+
+    def test_short_peak_is_counted_in_hour(self, accumulator):
+        """A 36-second 9.5 kW kettle spike between polls is counted in the hour's energy."""
+        start = datetime(2026, 1, 5, 10, 0)
+        accumulator.add_sample(start, 1.0, method="left")
+        accumulator.add_sample(start + timedelta(seconds=20), 9.5, method="left")
+        accumulator.add_sample(start + timedelta(seconds=56), 1.0, method="left")
+        accumulator.add_sample(start + timedelta(hours=1), 1.0, method="left")
+        assert accumulator.daily_max_power["2026-01-05"] == pytest.approx(1.0 + 8.5 * 36 / 3600)
+
+    def test_out_of_order_sample_ignored(self, accumulator):
+        """A sample older than the last one is ignored."""
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 1), 2.0, method="left")
+        changed = accumulator.add_sample(datetime(2026, 1, 5, 10, 0), 8.0, method="left")
+        assert changed is False
+        assert accumulator.last_power_kw == 2.0
+
+    def test_repeated_hour_at_dst_end(self, accumulator, oslo_time):
+        """The hour repeated when summer time ends is booked as its own hour, not dropped."""
+        # 26. oktober 2025: klokken går fra 03:00 sommertid tilbake til 02:00
+        start = datetime(2025, 10, 25, 23, 0, tzinfo=UTC)  # 01:00 lokal tid
+        for minutes in range(0, 3 * 60 + 1, 10):
+            now = datetime.fromtimestamp((start + timedelta(minutes=minutes)).timestamp())
+            # 2 kW den første 02-timen, 5 kW den gjentatte, ellers 1 kW
+            power_kw = {1: 2.0, 2: 5.0}.get(minutes // 60, 1.0)
+            accumulator.add_sample(now, power_kw, method="left")
+        accumulator.add_sample(datetime(2025, 10, 26, 4, 0), 1.0, method="left")
+
+        assert accumulator.monthly_consumption["natt"] == pytest.approx(1.0 + 2.0 + 5.0 + 1.0)
+        assert accumulator.daily_max_power["2025-10-26"] == pytest.approx(5.0)
+        assert accumulator.last_sample == datetime(2025, 10, 26, 4, 0)
+
+
+class TestHourlyPeaks:
+    """Tests for the hourly energy peak engine."""
+
+    def test_open_hour_does_not_count(self, accumulator):
+        """Daily max is only fed by closed hours."""
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 0), 5.0)
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 30), 5.0)
+        assert accumulator.daily_max_power == {}
+        assert accumulator.current_interval_kwh == pytest.approx(2.5)
+
+    def test_closed_hour_feeds_daily_max(self, accumulator):
+        """A closed hour's energy becomes the day's peak in kWh/h."""
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 0), 4.0, method="left")
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 30), 2.0, method="left")
+        accumulator.add_sample(datetime(2026, 1, 5, 11, 0), 2.0, method="left")
+        assert accumulator.daily_max_power["2026-01-05"] == pytest.approx(3.0)
+
+    def test_kettle_spike_does_not_over_tier(self, accumulator):
+        """A 2-minute 10 kW spike in an otherwise 1 kW hour gives ~1.3 kWh/h, not 10 kW."""
+        start = datetime(2026, 1, 5, 10, 0)
+        accumulator.add_sample(start, 1.0, method="left")
+        accumulator.add_sample(start + timedelta(minutes=20), 10.0, method="left")
+        accumulator.add_sample(start + timedelta(minutes=22), 1.0, method="left")
+        accumulator.add_sample(start + timedelta(hours=1), 1.0, method="left")
+        assert accumulator.daily_max_power["2026-01-05"] == pytest.approx(1.3)
+
+    def test_interval_split_on_hour_boundary(self, accumulator):
+        """An interval crossing the hour is split between the two hours."""
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 30), 2.0, method="left")
+        accumulator.add_sample(datetime(2026, 1, 5, 11, 30), 2.0, method="left")
+        assert accumulator.daily_max_power["2026-01-05"] == pytest.approx(1.0)
+        assert accumulator.current_interval == datetime(2026, 1, 5, 11, 0)
+        assert accumulator.current_interval_kwh == pytest.approx(1.0)
+
+    def test_tariff_follows_hour(self, accumulator):
+        """Energy before 22:00 is dag even if the sample arrives after 22:00."""
+        accumulator.add_sample(datetime(2026, 1, 5, 21, 30), 2.0, method="left")
+        accumulator.add_sample(datetime(2026, 1, 5, 22, 30), 2.0, method="left")
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(1.0)
+        assert accumulator.monthly_consumption["natt"] == pytest.approx(1.0)
+
+    def test_highest_hour_of_day_wins(self, accumulator):
+        """Daily max keeps the highest closed hour of the day."""
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 0), 5.0, method="left")
+        accumulator.add_sample(datetime(2026, 1, 5, 11, 0), 3.0, method="left")
+        accumulator.add_sample(datetime(2026, 1, 5, 12, 0), 3.0, method="left")
+        assert accumulator.daily_max_power["2026-01-05"] == pytest.approx(5.0)
+
+    def test_projection(self, accumulator):
+        """Projection = energy so far + current power for the rest of the hour."""
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 0), 2.0, method="left")
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 15), 6.0, method="left")
+        # 0.5 kWh so far + 6 kW * 0.75 h
+        assert accumulator.current_interval_projection_kw(datetime(2026, 1, 5, 10, 15)) == pytest.approx(5.0)
+
+    def test_advance_to_month_start_closes_last_hour(self, accumulator):
+        """Advancing to midnight books the old month's last hour."""
+        accumulator.add_sample(datetime(2026, 1, 31, 23, 0), 3.0, method="left")
+        accumulator.advance_to(datetime(2026, 2, 1), 3.0, method="left")
+        assert accumulator.daily_max_power["2026-01-31"] == pytest.approx(3.0)
+        assert accumulator.current_interval is None
+
+    def test_reset_month(self, accumulator):
+        """Month reset clears energy and peaks."""
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 0), 5.0)
+        accumulator.add_sample(datetime(2026, 1, 5, 11, 0), 5.0)
+        accumulator.reset_month()
+        assert accumulator.daily_max_power == {}
+        assert accumulator.monthly_consumption == {"dag": 0.0, "natt": 0.0}
+        assert accumulator.current_interval is None
+        assert sum(accumulator.interval_kwh) == 0.0
+
+
+class TestQuarterHourSettlement:
+    """Tests for 15-minute settlement (kvartersoppgjør)."""
+
+    @pytest.fixture
+    def quarter(self):
+        """Accumulator with 15-minute resolution."""
+        return ConsumptionAccumulator(is_day_rate, resolution_minutes=15)
+
+    def test_bucket_array_is_fixed_size(self, quarter):
+        """Buckets are preallocated for 31 days x 96 intervals."""
+        assert len(quarter.interval_kwh) == 31 * 96
+        quarter.add_sample(datetime(2026, 1, 31, 23, 0), 2.0, method="left")
+        quarter.add_sample(datetime(2026, 1, 31, 23, 59), 2.0, method="left")
+        assert len(quarter.interval_kwh) == 31 * 96
+
+    def test_peak_is_quarter_hour_average(self, quarter):
+        """A 15-minute interval at 8 kW gives an 8 kW peak even if the hour average is lower."""
+        quarter.add_sample(datetime(2026, 1, 5, 10, 0), 8.0, method="left")
+        quarter.add_sample(datetime(2026, 1, 5, 10, 15), 0.0, method="left")
+        quarter.add_sample(datetime(2026, 1, 5, 11, 0), 0.0, method="left")
+        assert quarter.daily_max_power["2026-01-05"] == pytest.approx(8.0)
+
+    def test_bucket_index(self, quarter):
+        """Energy lands in the bucket for its day and quarter."""
+        quarter.add_sample(datetime(2026, 1, 2, 0, 30), 4.0, method="left")
+        quarter.add_sample(datetime(2026, 1, 2, 0, 45), 4.0, method="left")
+        assert quarter.interval_kwh[96 + 2] == pytest.approx(1.0)
+
+    def test_dag_natt_split_per_interval(self, quarter):
+        """An interval crossing 06:00 splits energy into natt and dag."""
+        quarter.add_sample(datetime(2026, 1, 5, 5, 45), 4.0, method="left")
+        quarter.add_sample(datetime(2026, 1, 5, 6, 15), 4.0, method="left")
+        assert quarter.monthly_consumption["natt"] == pytest.approx(1.0)
+        assert quarter.monthly_consumption["dag"] == pytest.approx(1.0)
+
+    def test_projection_is_interval_average(self, quarter):
+        """Projection is the average over the 15-minute interval."""
+        quarter.add_sample(datetime(2026, 1, 5, 10, 0), 4.0, method="left")
+        quarter.add_sample(datetime(2026, 1, 5, 10, 5), 1.0, method="left")
+        # (4 kW * 5 min + 1 kW * 10 min) / 15 min = 2 kW
+        assert quarter.current_interval_projection_kw(datetime(2026, 1, 5, 10, 5)) == pytest.approx(2.0)
+
+    def test_load_quarter_into_hourly(self, accumulator):
+        """Stored 15-minute buckets are summed when switching to hourly."""
+        values = [0.25] * 8 + [0.0] * (31 * 96 - 8)
+        accumulator.load_intervals(values, 15)
+        assert accumulator.interval_kwh[0] == pytest.approx(1.0)
+        assert accumulator.interval_kwh[1] == pytest.approx(1.0)
+        assert len(accumulator.interval_kwh) == 31 * 24
+
+    def test_load_hourly_into_quarter(self, quarter):
+        """Stored hourly buckets are spread evenly when switching to 15 minutes."""
+        quarter.load_intervals([2.0] + [0.0] * (31 * 24 - 1), 60)
+        assert list(quarter.interval_kwh[:5]) == [0.5, 0.5, 0.5, 0.5, 0.0]
+
+    def test_unsupported_resolution(self):
+        """Only 60 and 15 minutes are supported."""
+        with pytest.raises(ValueError):
+            ConsumptionAccumulator(is_day_rate, resolution_minutes=30)
+
+
+class TestTopDaysTracker:
+    """Incremental top-N days, compared against a full sort."""
+
+    def test_matches_full_sort(self):
+        """Random daily maxima give the same top 3 as sorting."""
+        import random
+
+        rng = random.Random(42)
+        tracker = TopDaysTracker(3)
+        daily_max: dict[str, float] = {}
+        for _ in range(500):
+            day = f"2026-01-{rng.randint(1, 31):02d}"
+            value = round(rng.uniform(0, 10), 3)
+            if value > daily_max.get(day, 0):
+                daily_max[day] = value
+                tracker.update(day, value)
+        expected = dict(sorted(daily_max.items(), key=lambda x: x[1], reverse=True)[:3])
+        assert tracker.top == expected
+        assert list(tracker.top) == list(expected)
+        assert tracker.average == pytest.approx(sum(expected.values()) / 3)
+
+    def test_same_day_improves(self):
+        """A day already in the top moves up instead of being added twice."""
+        tracker = TopDaysTracker(3)
+        tracker.update("2026-01-01", 3.0)
+        tracker.update("2026-01-02", 4.0)
+        tracker.update("2026-01-03", 5.0)
+        assert tracker.update("2026-01-01", 6.0)
+        assert tracker.top == {"2026-01-01": 6.0, "2026-01-03": 5.0, "2026-01-02": 4.0}
+
+    def test_lower_value_ignored(self):
+        """Values below the N-th best or the day's own value do not change the top."""
+        tracker = TopDaysTracker(2)
+        tracker.update("2026-01-01", 5.0)
+        tracker.update("2026-01-02", 4.0)
+        top = tracker.top
+        assert not tracker.update("2026-01-03", 3.0)
+        assert not tracker.update("2026-01-01", 4.5)
+        assert tracker.top is top
+
+    def test_configurable_n(self):
+        """N other than 3 keeps that many days."""
+        tracker = TopDaysTracker(5)
+        for day in range(1, 8):
+            tracker.update(f"2026-01-{day:02d}", float(day))
+        assert list(tracker.top.values()) == [7.0, 6.0, 5.0, 4.0, 3.0]
+        assert tracker.average == pytest.approx(5.0)
+
+    def test_fewer_days_than_n(self):
+        """Average uses the days available early in the month."""
+        tracker = TopDaysTracker(3)
+        assert tracker.average == 0.0
+        tracker.update("2026-01-01", 4.0)
+        tracker.update("2026-01-02", 2.0)
+        assert tracker.average == pytest.approx(3.0)
+
+    def test_rebuild_and_reset(self):
+        """Rebuild from stored daily maxima, reset clears."""
+        tracker = TopDaysTracker(3)
+        tracker.rebuild({"2026-01-01": 1.0, "2026-01-02": 9.0, "2026-01-03": 5.0, "2026-01-04": 7.0})
+        assert tracker.top == {"2026-01-02": 9.0, "2026-01-04": 7.0, "2026-01-03": 5.0}
+        tracker.reset()
+        assert tracker.top == {}
+
+    def test_invalid_n(self):
+        """N must be positive."""
+        with pytest.raises(ValueError):
+            TopDaysTracker(0)
+
+    def test_fed_by_accumulator(self, accumulator):
+        """Closed hours feed the tracker, reset_month clears it."""
+        for day, kw in ((5, 3.0), (6, 8.0), (7, 5.0), (8, 1.0)):
+            start = datetime(2026, 1, day, 17, 0)
+            accumulator.add_sample(start, kw, method="left")
+            accumulator.add_sample(start + timedelta(hours=1), 0.0, method="left")
+        assert accumulator.top_days.top == pytest.approx({"2026-01-06": 8.0, "2026-01-07": 5.0, "2026-01-05": 3.0})
+        accumulator.reset_month()
+        assert accumulator.top_days.top == {}
+
+
+class TestBackfill:
+    """Replay hourly statistics after Home Assistant was down."""
+
+    def test_gap_filled_from_statistics(self, accumulator):
+        """Hourly means fill the gap instead of the current reading."""
+        accumulator.add_sample(datetime(2026, 1, 5, 9, 30), 2.0)
+        segments = [
+            (datetime(2026, 1, 5, 9, 0), datetime(2026, 1, 5, 10, 0), 2.0),
+            (datetime(2026, 1, 5, 10, 0), datetime(2026, 1, 5, 11, 0), 6.0),
+            (datetime(2026, 1, 5, 11, 0), datetime(2026, 1, 5, 12, 0), 3.0),
+        ]
+        booked = accumulator.backfill(segments, datetime(2026, 1, 5, 12, 20))
+
+        # Only 09:30-10:00 of the first hour was not already seen
+        assert booked == pytest.approx(1.0 + 6.0 + 3.0)
+        assert accumulator.daily_max_power["2026-01-05"] == pytest.approx(6.0)
+        assert accumulator.last_sample == datetime(2026, 1, 5, 12, 20)
+
+        # The next poll does not charge the gap at the current reading
+        accumulator.add_sample(datetime(2026, 1, 5, 12, 21), 10.0)
+        assert accumulator.current_interval_kwh == pytest.approx(10.0 / 60)
+
+    def test_gap_without_statistics_skipped(self, accumulator):
+        """With no statistics the gap is skipped, not guessed."""
+        accumulator.add_sample(datetime(2026, 1, 5, 9, 0), 2.0)
+        accumulator.add_sample(datetime(2026, 1, 5, 9, 30), 2.0)
+        assert accumulator.backfill([], datetime(2026, 1, 5, 14, 0)) == 0.0
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(1.0)
+        # The half hour before the downtime still closes as an hour
+        assert accumulator.daily_max_power["2026-01-05"] == pytest.approx(1.0)
+        assert accumulator.last_sample == datetime(2026, 1, 5, 14, 0)
+
+
+class TestMeterRegister:
+    """Cumulative kWh register to energy deltas."""
+
+    def test_first_reading(self):
+        """First reading only sets the baseline."""
+        meter = MeterRegister()
+        assert meter.delta(48213.5) == 0.0
+        assert meter.delta(48214.75) == pytest.approx(1.25)
+
+    def test_jitter_ignored(self):
+        """Small dips are not counted, and not counted twice when the register recovers."""
+        meter = MeterRegister(1000.0)
+        assert meter.delta(999.9) == 0.0
+        assert meter.delta(1000.5) == pytest.approx(0.5)
+
+    def test_counter_reset(self):
+        """A large drop is a reset, the new reading is energy since zero."""
+        meter = MeterRegister(5000.0)
+        assert meter.delta(0.3) == pytest.approx(0.3)
+        assert meter.delta(1.0) == pytest.approx(0.7)
+
+    def test_rollover(self):
+        """Register wrapping at its last digit is counted across the wrap."""
+        meter = MeterRegister(99999.6)
+        assert meter.delta(0.4) == pytest.approx(0.8)
+
+    def test_negative_ignored(self):
+        """Negative readings are ignored."""
+        meter = MeterRegister(10.0)
+        assert meter.delta(-1.0) == 0.0
+        assert meter.last_reading == 10.0
+
+
+class TestMeteredEnergy:
+    """Booking register deltas in the accumulator."""
+
+    def test_delta_spread_over_interval(self, accumulator):
+        """A delta is spread evenly since the previous reading."""
+        accumulator.add_energy(datetime(2026, 1, 5, 16, 30), 0.0)
+        accumulator.add_energy(datetime(2026, 1, 5, 17, 30), 4.0)
+        accumulator.add_energy(datetime(2026, 1, 5, 18, 0), 1.0)
+
+        # 16:30-17:00 got 2 kWh, 17:00-18:00 got 2 + 1 kWh
+        assert accumulator.daily_max_power["2026-01-05"] == pytest.approx(3.0)
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(5.0)
+
+    def test_exact_total(self, accumulator):
+        """Total booked energy equals the register difference."""
+        meter = MeterRegister()
+        start = datetime(2026, 1, 5, 0, 0)
+        reading = 100.0
+        for minute in range(0, 24 * 60, 7):
+            reading += 0.137
+            accumulator.add_energy(start + timedelta(minutes=minute), meter.delta(reading))
+        booked = accumulator.monthly_consumption["dag"] + accumulator.monthly_consumption["natt"]
+        assert booked == pytest.approx(reading - 100.0 - 0.137)
+
+
+class TestIntegrationMethods:
+    """Left, right and trapezoid integration with a max gap."""
+
+    @pytest.mark.parametrize(("method", "expected_kwh"), [("left", 1.0), ("right", 3.0), ("trapezoid", 2.0)])
+    def test_methods(self, method, expected_kwh):
+        """One hour between a 1 kW and a 3 kW reading."""
+        accumulator = ConsumptionAccumulator(is_day_rate, integration_method=method)
+        accumulator.add_sample(datetime(2026, 1, 5, 17, 0), 1.0)
+        accumulator.add_sample(datetime(2026, 1, 5, 18, 0), 3.0)
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(expected_kwh)
+
+    def test_invalid_method(self):
+        """Unknown methods are rejected."""
+        with pytest.raises(ValueError):
+            ConsumptionAccumulator(is_day_rate, integration_method="simpson")
+
+    def test_gap_capped_right(self):
+        """A long gap only books max_gap before the new reading, the rest is uncovered."""
+        accumulator = ConsumptionAccumulator(is_day_rate, max_gap_seconds=300)
+        accumulator.add_sample(datetime(2026, 1, 5, 17, 0), 2.0)
+        accumulator.add_sample(datetime(2026, 1, 5, 20, 0), 6.0)
+
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(6.0 * 5 / 60)
+        assert accumulator.uncovered_seconds_in_hour(datetime(2026, 1, 5, 17, 0)) == 3600
+        assert accumulator.uncovered_seconds_in_hour(datetime(2026, 1, 5, 19, 0)) == 3300
+        assert sum(accumulator.uncovered_seconds) == pytest.approx(3 * 3600 - 300)
+
+    def test_gap_capped_trapezoid(self):
+        """Trapezoid books half the max gap next to each reading."""
+        accumulator = ConsumptionAccumulator(is_day_rate, integration_method="trapezoid", max_gap_seconds=600)
+        accumulator.add_sample(datetime(2026, 1, 5, 17, 0), 6.0)
+        accumulator.add_sample(datetime(2026, 1, 5, 18, 0), 12.0)
+
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(6.0 * 5 / 60 + 12.0 * 5 / 60)
+        assert accumulator.uncovered_seconds_in_hour(datetime(2026, 1, 5, 17, 0)) == 3000
+
+    def test_short_gap_not_capped(self):
+        """Normal poll intervals are fully booked."""
+        accumulator = ConsumptionAccumulator(is_day_rate, max_gap_seconds=300)
+        accumulator.add_sample(datetime(2026, 1, 5, 17, 0), 2.0)
+        accumulator.add_sample(datetime(2026, 1, 5, 17, 1), 2.0)
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(2.0 / 60)
+        assert sum(accumulator.uncovered_seconds) == 0
+
+    def test_metered_energy_not_capped(self):
+        """Register deltas are exact and never capped."""
+        accumulator = ConsumptionAccumulator(is_day_rate, max_gap_seconds=300)
+        accumulator.add_energy(datetime(2026, 1, 5, 17, 0), 0.0)
+        accumulator.add_energy(datetime(2026, 1, 5, 19, 0), 4.0)
+        assert accumulator.monthly_consumption["dag"] == pytest.approx(4.0)
+        assert sum(accumulator.uncovered_seconds) == 0
+
+    def test_reset_clears_uncovered(self):
+        """Uncovered time is per month."""
+        accumulator = ConsumptionAccumulator(is_day_rate, max_gap_seconds=60)
+        accumulator.add_sample(datetime(2026, 1, 5, 17, 0), 2.0)
+        accumulator.add_sample(datetime(2026, 1, 5, 18, 0), 2.0)
+        accumulator.reset_month()
+        assert sum(accumulator.uncovered_seconds) == 0
+
+
+class TestCapacityHeadroom:
+    """Room left before the top-day average passes a threshold."""
+
+    def test_max_allowed_fills_free_slot(self):
+        """With fewer than N days, today's peak is added to the average."""
+        tracker = TopDaysTracker(3)
+        tracker.update("2026-01-05", 4.0)
+        # (4 + x) / 2 <= 5  ->  x <= 6
+        assert tracker.max_allowed("2026-01-06", 5.0) == pytest.approx(6.0)
+
+    def test_max_allowed_replaces_lowest(self):
+        """With N days tracked, a new day replaces the lowest one."""
+        tracker = TopDaysTracker(3)
+        for day, kw in [("2026-01-05", 4.0), ("2026-01-06", 3.0), ("2026-01-07", 2.0)]:
+            tracker.update(day, kw)
+        # (4 + 3 + x) / 3 <= 5  ->  x <= 8
+        assert tracker.max_allowed("2026-01-08", 5.0) == pytest.approx(8.0)
+
+    def test_max_allowed_same_day(self):
+        """A tracked day replaces its own entry."""
+        tracker = TopDaysTracker(3)
+        for day, kw in [("2026-01-05", 4.0), ("2026-01-06", 3.0), ("2026-01-07", 2.0)]:
+            tracker.update(day, kw)
+        # (4 + 2 + x) / 3 <= 5  ->  x <= 9
+        assert tracker.max_allowed("2026-01-06", 5.0) == pytest.approx(9.0)
+
+    def test_interval_headroom(self):
+        """Remaining kW for the rest of the hour, counting unbooked energy at the held reading."""
+        acc = ConsumptionAccumulator(is_day_rate)
+        acc.add_sample(datetime(2026, 1, 5, 18, 0), 2.0)
+        acc.add_sample(datetime(2026, 1, 5, 18, 30), 2.0)  # 1 kWh booked
+        # No other days: max interval average is the threshold itself (5 kW = 5 kWh this hour).
+        # 15 more minutes at 2 kW are pending (0.5 kWh), leaving 3.5 kWh for the last 15 minutes.
+        max_kw, headroom_kw = acc.interval_headroom(datetime(2026, 1, 5, 18, 45), 5.0)
+        assert max_kw == pytest.approx(5.0)
+        assert headroom_kw == pytest.approx(14.0)
+
+    def test_interval_headroom_exhausted(self):
+        """Headroom never goes below zero."""
+        acc = ConsumptionAccumulator(is_day_rate)
+        acc.add_sample(datetime(2026, 1, 5, 18, 0), 10.0)
+        acc.add_sample(datetime(2026, 1, 5, 18, 40), 10.0)
+        assert acc.interval_headroom(datetime(2026, 1, 5, 18, 40), 5.0)[1] == 0.0
+
+
+class TestOnEnergy:
+    """Energy handed to the on_energy hook as it is booked."""
+
+    def make(self) -> tuple[ConsumptionAccumulator, list[tuple[datetime, float]]]:
+        """Accumulator that records every booking."""
+        booked: list[tuple[datetime, float]] = []
+        accumulator = ConsumptionAccumulator(is_day_rate, on_energy=lambda start, kwh: booked.append((start, kwh)))
+        return accumulator, booked
+
+    def test_interval_of_the_energy(self):
+        """Each booking carries the start of the interval the energy was used in."""
+        accumulator, booked = self.make()
+        accumulator.add_sample(datetime(2026, 1, 14, 10, 0), 2.0)
+        accumulator.add_sample(datetime(2026, 1, 14, 11, 30), 2.0)
+
+        assert [start for start, _ in booked] == [datetime(2026, 1, 14, 10, 0), datetime(2026, 1, 14, 11, 0)]
+        assert sum(kwh for _, kwh in booked) == pytest.approx(3.0)
+
+    def test_matches_monthly_consumption(self):
+        """Everything booked to the month also reaches the hook."""
+        accumulator, booked = self.make()
+        accumulator.add_sample(datetime(2026, 1, 14, 5, 0), 1.5)
+        accumulator.add_sample(datetime(2026, 1, 14, 8, 0), 3.0)
+        accumulator.add_sample(datetime(2026, 1, 14, 9, 15), 0.5)
+
+        assert sum(kwh for _, kwh in booked) == pytest.approx(sum(accumulator.monthly_consumption.values()))
+
+    def test_segments_from_energy_sums(self, accumulator):
+        """Energy sensor sums become hourly average power, a missing hour is spread out."""
+        sums = [
+            (datetime(2026, 1, 5, 10, 0), 1000.0),
+            (datetime(2026, 1, 5, 11, 0), 1006.0),
+            (datetime(2026, 1, 5, 13, 0), 1012.0),
+            # Statistics reset: starts over from here
+            (datetime(2026, 1, 5, 14, 0), 2.0),
+            (datetime(2026, 1, 5, 15, 0), 3.5),
+        ]
+        segments = energy_sum_segments(sums)
+
+        assert segments == [
+            (datetime(2026, 1, 5, 10, 0), datetime(2026, 1, 5, 11, 0), pytest.approx(6.0)),
+            (datetime(2026, 1, 5, 11, 0), datetime(2026, 1, 5, 13, 0), pytest.approx(3.0)),
+            (datetime(2026, 1, 5, 14, 0), datetime(2026, 1, 5, 15, 0), pytest.approx(1.5)),
+        ]
+        accumulator.add_sample(datetime(2026, 1, 5, 10, 0), 2.0)
+        assert accumulator.backfill(segments, datetime(2026, 1, 5, 15, 10)) == pytest.approx(13.5)
+        assert accumulator.daily_max_power["2026-01-05"] == pytest.approx(6.0)
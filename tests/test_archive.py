@@ -0,0 +1,127 @@
+"""Test the hourly consumption archive.
+
+Tests:
+- Write and read back an hour
+- Hours with energy lacking a spot price are flagged
+- Ring buffer wraps after capacity hours
+- Month summary (dag/natt, cost, top days)
+- Both hours at 02 when summer time ends have their own slot
+- File-backed archive survives reopen (with its hour count)
+- Corrupt file is replaced
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from custom_components.stromkalkulator.archive import DEFAULT_CAPACITY, HourlyArchive
+
+
+class TestHourlyArchive:
+    """In-memory archive."""
+
+    def test_write_and_get(self):
+        """A written hour is returned with its values."""
+        archive = HourlyArchive()
+        hour = datetime(2026, 1, 15, 17, 0)
+        archive.write(hour, 3.5, 1.25, 5.0, True)
+
+        record = archive.get(hour)
+        assert record is not None
+        assert record.hour == hour
+        assert record.kwh == pytest.approx(3.5)
+        assert record.spot_price == pytest.approx(1.25)
+        assert record.cost == pytest.approx(5.0)
+        assert record.is_day
+        assert archive.get(hour + timedelta(hours=1)) is None
+
+    def test_unpriced_flag(self):
+        """An hour with energy lacking a spot price is marked as not priced."""
+        archive = HourlyArchive()
+        hour = datetime(2026, 1, 15, 17, 0)
+        archive.write(hour, 3.5, 1.25, 5.0, True, priced=False)
+
+        record = archive.get(hour)
+        assert not record.priced
+        assert record.is_day
+
+    def test_capacity_covers_13_months(self):
+        """Default capacity holds the same month last year."""
+        assert DEFAULT_CAPACITY >= 24 * 397
+
+    def test_ring_wraps(self):
+        """An hour is overwritten capacity hours later and no longer returned."""
+        archive = HourlyArchive(capacity=48)
+        old = datetime(2026, 1, 1, 0, 0)
+        new = old + timedelta(hours=48)
+        archive.write(old, 1.0, 0.5, 0.5, False)
+        archive.write(new, 2.0, 0.5, 1.0, False)
+
+        assert archive.get(old) is None
+        assert archive.get(new).kwh == pytest.approx(2.0)
+        assert archive.count() == 1
+
+    def test_month_summary(self):
+        """Month totals split on dag/natt and rank days by highest hour."""
+        archive = HourlyArchive()
+        archive.write(datetime(2026, 1, 5, 8), 4.0, 1.0, 4.0, True)
+        archive.write(datetime(2026, 1, 5, 23), 2.0, 0.5, 1.0, False)
+        archive.write(datetime(2026, 1, 6, 18), 6.0, 1.0, 6.0, True)
+        archive.write(datetime(2026, 1, 7, 3), 5.0, 0.5, 2.5, False)
+        archive.write(datetime(2026, 2, 1, 0), 9.0, 0.5, 4.5, False)
+
+        summary = archive.month_summary(2026, 1)
+        assert summary.hours == 4
+        assert summary.dag_kwh == pytest.approx(10.0)
+        assert summary.natt_kwh == pytest.approx(7.0)
+        assert summary.cost == pytest.approx(13.5)
+        assert summary.top_days == pytest.approx({"2026-01-06": 6.0, "2026-01-07": 5.0, "2026-01-05": 4.0})
+        assert summary.avg_top_kw == pytest.approx(5.0)
+
+    def test_december_summary(self):
+        """December ends at new year."""
+        archive = HourlyArchive()
+        archive.write(datetime(2025, 12, 31, 23), 1.0, 1.0, 1.0, False)
+        assert archive.month_summary(2025, 12).hours == 1
+
+    def test_repeated_hour_at_dst_end(self, oslo_time):
+        """The second 02:00 on the last Sunday of October does not overwrite the first."""
+        archive = HourlyArchive()
+        first = datetime(2025, 10, 26, 2)
+        second = first.replace(fold=1)
+        archive.write(first, 1.0, 0.5, 0.5, False)
+        archive.write(second, 2.0, 0.5, 1.0, False)
+
+        assert archive.get(first).kwh == pytest.approx(1.0)
+        assert archive.get(second).kwh == pytest.approx(2.0)
+        assert archive.get(second).hour.fold == 1
+        assert archive.count() == 2
+        assert archive.month_summary(2025, 10).natt_kwh == pytest.approx(3.0)
+
+
+class TestFileBackedArchive:
+    """Memory-mapped archive file."""
+
+    def test_reopen(self, tmp_path):
+        """Data written before close is there after reopen."""
+        path = str(tmp_path / "archive.bin")
+        hour = datetime(2026, 1, 15, 17, 0)
+        archive = HourlyArchive.open(path, capacity=100)
+        archive.write(hour, 3.5, 1.25, 5.0, False)
+        archive.close()
+
+        archive = HourlyArchive.open(path, capacity=100)
+        assert archive.get(hour).kwh == pytest.approx(3.5)
+        assert archive.count() == 1
+        archive.close()
+
+    def test_corrupt_file_replaced(self, tmp_path):
+        """A file with the wrong header or size starts a new archive."""
+        path = tmp_path / "archive.bin"
+        path.write_bytes(b"garbage")
+        archive = HourlyArchive.open(str(path), capacity=100)
+        assert archive.count() == 0
+        archive.close()
+        assert path.stat().st_size > 100 * 16
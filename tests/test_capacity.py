@@ -0,0 +1,90 @@
+"""Test the compiled capacity tier table.
+
+Tests:
+- Lookup matches the linear scan it replaces
+- Tier boundaries (exactly on a threshold belongs to the lower tier)
+- Dict format (Barents Nett) is normalised
+- Every TSO in TSO_LIST compiles
+- Ceiling and cost of the next tier
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.stromkalkulator.capacity import CapacityTiers
+from custom_components.stromkalkulator.tso import TSO_LIST
+
+
+def linear_lookup(avg_power: float, kapasitetstrinn: list[tuple[float, int]]) -> tuple[int, int]:
+    """The linear scan the table replaces: (price, tier number)."""
+    for i, (threshold, price) in enumerate(kapasitetstrinn, 1):
+        if avg_power <= threshold:
+            return price, i
+    return kapasitetstrinn[-1][1], len(kapasitetstrinn)
+
+
+class TestCapacityTiers:
+    """Lookup in a compiled table."""
+
+    def test_matches_linear_scan(self, bkk_kapasitetstrinn):
+        """Same price and tier as the linear scan across the whole range."""
+        tiers = CapacityTiers(bkk_kapasitetstrinn)
+        for tenth_kw in range(0, 1500):
+            avg_power = tenth_kw / 10
+            price, tier, _ = tiers.lookup(avg_power)
+            assert (price, tier) == linear_lookup(avg_power, bkk_kapasitetstrinn)
+
+    @pytest.mark.parametrize(
+        ("avg_power", "expected"),
+        [
+            (0.0, (155, 1, "0-2 kW")),
+            (2.0, (155, 1, "0-2 kW")),
+            (2.01, (250, 2, "2-5 kW")),
+            (100.0, (3500, 9, "75-100 kW")),
+            (150.0, (6900, 10, ">100 kW")),
+        ],
+    )
+    def test_boundaries(self, bkk_kapasitetstrinn, avg_power, expected):
+        """Exactly on a threshold is the lower tier, above the last is open-ended."""
+        assert CapacityTiers(bkk_kapasitetstrinn).lookup(avg_power) == expected
+
+    def test_dict_format(self):
+        """Barents Nett uses min/max/pris, the last tier has no upper limit."""
+        tiers = CapacityTiers(TSO_LIST["barents_nett"]["kapasitetstrinn"])
+        assert tiers.lookup(3.0) == (569, 2, "2-5 kW")
+        assert tiers.lookup(1500.0) == (931, 6, ">20 kW")
+        assert tiers.price(12.0) == 673
+
+    def test_unsorted_input(self):
+        """Tiers are sorted by threshold."""
+        tiers = CapacityTiers([(float("inf"), 900), (5, 300), (2, 100)])
+        assert tiers.prices == (100, 300, 900)
+
+    def test_empty(self):
+        """A TSO without tiers is rejected."""
+        with pytest.raises(ValueError):
+            CapacityTiers([])
+
+    @pytest.mark.parametrize("tso_id", list(TSO_LIST))
+    def test_all_tsos_compile(self, tso_id):
+        """Every TSO compiles to a sorted, open-ended table with increasing prices."""
+        tiers = CapacityTiers(TSO_LIST[tso_id]["kapasitetstrinn"])
+        assert len(tiers) == len(TSO_LIST[tso_id]["kapasitetstrinn"])
+        assert list(tiers.thresholds) == sorted(tiers.thresholds)
+        assert tiers.thresholds[-1] == float("inf")
+        assert list(tiers.prices) == sorted(tiers.prices)
+
+
+class TestCeiling:
+    """Threshold and cost of the next tier."""
+
+    def test_ceiling(self, bkk_kapasitetstrinn):
+        """Current upper threshold and the price step to the next tier."""
+        tiers = CapacityTiers(bkk_kapasitetstrinn)
+        assert tiers.ceiling(3.2) == (5.0, 415 - 250)
+        assert tiers.ceiling(5.0) == (5.0, 415 - 250)
+
+    def test_top_tier(self, bkk_kapasitetstrinn):
+        """No next tier above the last threshold."""
+        assert CapacityTiers(bkk_kapasitetstrinn).ceiling(150.0) is None
@@ -0,0 +1,133 @@
+"""Test the tariff comparison across every TSO.
+
+Tests:
+- One TSO priced from the tables matches energiledd x kWh + kapasitetsledd
+- Per-TSO dag/natt schedule (Tensio dag 06-21) and number of top days
+- Ranking is cheapest first, price area filter
+- Several months summed, kapasitetsledd per month
+- Prices without mva (NO4) converted to the customer's mva
+- Empty month gives only the lowest tier
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from custom_components.stromkalkulator.accumulator import MAX_DAYS_IN_MONTH
+from custom_components.stromkalkulator.comparison import MonthProfile, TariffComparison, as_rows, get_comparison
+from custom_components.stromkalkulator.tso import TSO_LIST
+
+JANUARY = date(2026, 1, 1)
+
+
+def make_profile(resolution_minutes: int = 60) -> list[float]:
+    """1 kWh every hour on weekday 14. januar, plus a 6 kWh spike at 21:00."""
+    slots_per_hour = 60 // resolution_minutes
+    profile = [0.0] * (MAX_DAYS_IN_MONTH * 24 * slots_per_hour)
+    first = 13 * 24 * slots_per_hour
+    for slot in range(24 * slots_per_hour):
+        profile[first + slot] = 1.0 / slots_per_hour
+    profile[first + 21 * slots_per_hour] += 5.0
+    return profile
+
+
+def cost_for(costs, tso_id):
+    """The row for one TSO."""
+    return next(cost for cost in costs if cost.tso_id == tso_id)
+
+
+class TestTariffComparison:
+    """Pricing a month with every TSO."""
+
+    def test_bkk(self):
+        """BKK: 16 dag hours + the spike, 8 natt hours, 6 kW peak."""
+        bkk = cost_for(get_comparison().rank([MonthProfile(JANUARY, make_profile(), 60)]), "bkk")
+
+        assert bkk.dag_kwh == pytest.approx(21.0)
+        assert bkk.natt_kwh == pytest.approx(8.0)
+        assert bkk.energiledd_kr == pytest.approx(21.0 * 0.4613 + 8.0 * 0.2329)
+        assert bkk.snitt_topp_kw == pytest.approx(6.0)
+        assert bkk.kapasitetsledd_kr == 415
+        assert bkk.kapasitetstrinn == "5-10 kW"
+        assert bkk.total_kr == pytest.approx(bkk.energiledd_kr + 415)
+
+    def test_tensio_schedule(self):
+        """Tensio ends the day at 21, so the spike is natt."""
+        tensio = cost_for(get_comparison().rank([MonthProfile(JANUARY, make_profile(), 60)]), "tensio_tn")
+        assert tensio.dag_kwh == pytest.approx(15.0)
+        assert tensio.natt_kwh == pytest.approx(14.0)
+
+    def test_quarter_hours(self):
+        """15-minute profile: peak is the highest quarter, energy is the same."""
+        bkk = cost_for(get_comparison().rank([MonthProfile(JANUARY, make_profile(15), 15)]), "bkk")
+        assert bkk.dag_kwh + bkk.natt_kwh == pytest.approx(29.0)
+        assert bkk.snitt_topp_kw == pytest.approx((5.0 + 0.25) * 4)
+
+    def test_top_days_per_tso(self):
+        """The number of top days comes from each TSO."""
+        tso_list = {
+            "three": TSO_LIST["bkk"],
+            "one": {**TSO_LIST["bkk"], "kapasitet_antall_dager": 1},
+        }
+        profile = [0.0] * (MAX_DAYS_IN_MONTH * 24)
+        for day, kwh in enumerate([9.0, 3.0, 3.0]):
+            profile[day * 24 + 12] = kwh
+        costs = TariffComparison(tso_list).rank([MonthProfile(JANUARY, profile, 60)])
+
+        assert cost_for(costs, "three").snitt_topp_kw == pytest.approx(5.0)
+        assert cost_for(costs, "one").snitt_topp_kw == pytest.approx(9.0)
+
+    def test_ranked_and_filtered(self):
+        """Cheapest first, and the price area filter keeps only that area."""
+        comparison = get_comparison()
+        costs = comparison.rank([MonthProfile(JANUARY, make_profile(), 60)])
+        assert len(costs) == len(comparison)
+        assert [cost.total_kr for cost in costs] == sorted(cost.total_kr for cost in costs)
+
+        no5 = comparison.rank([MonthProfile(JANUARY, make_profile(), 60)], prisomrade="NO5")
+        assert no5
+        assert {cost.prisomrade for cost in no5} == {"NO5"}
+
+    def test_months_summed(self):
+        """Energy and cost add up over the months, kapasitetsledd is charged each month."""
+        december = [0.0] * (MAX_DAYS_IN_MONTH * 24)
+        december[12] = 2.0
+        months = [MonthProfile(date(2025, 12, 1), december, 60), MonthProfile(JANUARY, make_profile(), 60)]
+        bkk = cost_for(get_comparison().rank(months), "bkk")
+
+        assert bkk.dag_kwh == pytest.approx(23.0)
+        assert bkk.kapasitetsledd_kr == 155 + 415
+        assert bkk.snitt_topp_kw == pytest.approx(6.0)
+        assert bkk.kapasitetstrinn == "5-10 kW"
+
+    def test_mva_normalized(self):
+        """A NO4 TSO's prices (without mva) get the customer's mva, others lose it if the customer pays none."""
+        tso_list = {"sor": TSO_LIST["bkk"], "nord": {**TSO_LIST["bkk"], "prisomrade": "NO4"}}
+        comparison = TariffComparison(tso_list)
+        months = [MonthProfile(JANUARY, make_profile(), 60)]
+
+        with_mva = comparison.rank(months, mva_sats=0.25)
+        assert cost_for(with_mva, "nord").total_kr == pytest.approx(cost_for(with_mva, "sor").total_kr * 1.25)
+        without_mva = comparison.rank(months, mva_sats=0.0)
+        assert cost_for(without_mva, "sor").total_kr == pytest.approx(cost_for(with_mva, "sor").total_kr / 1.25)
+        assert cost_for(without_mva, "nord").total_kr == pytest.approx(cost_for(with_mva, "sor").total_kr)
+
+    def test_schedules_shared(self):
+        """TSOs with the same schedule share one calendar."""
+        assert len(get_comparison().calendars) < len(get_comparison())
+
+    def test_empty_month(self):
+        """No consumption gives no energiledd and the lowest tier."""
+        costs = get_comparison().rank([MonthProfile(JANUARY, [0.0] * (MAX_DAYS_IN_MONTH * 24), 60)])
+        bkk = cost_for(costs, "bkk")
+        assert bkk.energiledd_kr == 0.0
+        assert bkk.kapasitetsledd_kr == 155
+
+    def test_as_rows(self):
+        """Rows are numbered from 1 and rounded."""
+        rows = as_rows(get_comparison().rank([MonthProfile(JANUARY, make_profile(), 60)]))
+        assert rows[0]["plass"] == 1
+        assert rows[-1]["plass"] == len(rows)
+        assert rows[0]["total_kr"] == round(rows[0]["total_kr"], 2)
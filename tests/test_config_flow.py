@@ -0,0 +1,60 @@
+"""Test the options flow.
+
+Tests:
+- Changed options are saved to the entry data
+- An optional sensor left empty is removed from the entry
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+from custom_components.stromkalkulator.config_flow import NettleieOptionsFlow
+from custom_components.stromkalkulator.const import (
+    CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR,
+    CONF_ENERGY_SENSOR,
+    CONF_POWER_SENSOR,
+    CONF_SPOT_PRICE_SENSOR,
+    CONF_TSO,
+)
+
+ENTRY_DATA: dict[str, Any] = {
+    CONF_TSO: "bkk",
+    CONF_POWER_SENSOR: "sensor.power",
+    CONF_ENERGY_SENSOR: "sensor.energy",
+    CONF_SPOT_PRICE_SENSOR: "sensor.spot",
+    CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR: "sensor.provider",
+}
+
+
+def submit(user_input: dict[str, Any]) -> dict[str, Any]:
+    """Submit the options form for an entry with ENTRY_DATA and return the saved entry data."""
+    flow = NettleieOptionsFlow()
+    flow.hass = MagicMock()
+    flow.config_entry = MagicMock(data=dict(ENTRY_DATA))
+    result = asyncio.run(flow.async_step_init(user_input))
+    assert result["type"] == "create_entry"
+    data: dict[str, Any] = flow.hass.config_entries.async_update_entry.call_args.kwargs["data"]
+    return data
+
+
+class TestOptionsFlow:
+    """Saving the options form."""
+
+    def test_changed_options_saved(self):
+        """Submitted values replace the entry's, the rest is kept."""
+        data = submit({**ENTRY_DATA, CONF_TSO: "elvia"})
+
+        assert data == {**ENTRY_DATA, CONF_TSO: "elvia"}
+
+    def test_cleared_sensor_removed(self):
+        """An optional sensor left empty is not kept from the old entry data."""
+        user_input = {key: value for key, value in ENTRY_DATA.items() if key != CONF_ENERGY_SENSOR}
+
+        data = submit(user_input)
+
+        assert CONF_ENERGY_SENSOR not in data
+        assert data[CONF_ELECTRICITY_PROVIDER_PRICE_SENSOR] == "sensor.provider"
+        assert data[CONF_POWER_SENSOR] == "sensor.power"
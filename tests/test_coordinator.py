@@ -0,0 +1,466 @@
+"""Test the coordinator with a mocked Home Assistant.
+
+Tests:
+- TSO, energiledd and settings taken from the entry
+- Store named after the entry's TSO
+- Missing TSO falls back to the default
+- Store writes coalesced within the save window, flushed at month rollover and unload
+- Power state events booked at the held reading between events
+- Recorder statistics replayed into the hours Home Assistant was down
+- Hourly archive gets the energy and cost booked in the ledger
+- Sensor fees and strømstøtte threshold at the rates in effect now
+- TSO comparison over archived months and this month
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.stromkalkulator import coordinator as coordinator_module
+from custom_components.stromkalkulator.const import (
+    CONF_ENERGILEDD_DAG,
+    CONF_ENERGY_SENSOR,
+    CONF_EVENT_INGESTION,
+    CONF_POWER_SENSOR,
+    CONF_SAVE_DELAY,
+    CONF_SETTLEMENT_MINUTES,
+    CONF_SPOT_PRICE_SENSOR,
+    CONF_TSO,
+    DEFAULT_TSO,
+    DOMAIN,
+)
+from custom_components.stromkalkulator.coordinator import NettleieCoordinator
+from custom_components.stromkalkulator.tso import get_tso
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """StromkalkulatorStore replaced by a mock that records how it was created."""
+    store = MagicMock()
+    monkeypatch.setattr(coordinator_module, "StromkalkulatorStore", store)
+    return store
+
+
+class Clock(datetime):
+    """datetime with a now() the test sets."""
+
+    current = datetime(2026, 1, 15, 12, 0)
+
+    @classmethod
+    def now(cls, tz: Any = None) -> datetime:
+        return cls.current
+
+
+class FakeStore:
+    """Store that records writes. A delayed save runs when the test ends the window."""
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        self.data = data
+        self.writes: list[dict[str, Any]] = []
+        self.delayed: list[tuple[Any, float]] = []
+
+    async def async_load(self) -> dict[str, Any] | None:
+        return self.data
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        self.writes.append(data)
+
+    def async_delay_save(self, data_func: Any, delay: float) -> None:
+        self.delayed.append((data_func, delay))
+
+    def end_window(self) -> None:
+        """The delay has passed: write once with the last data function (as Store does)."""
+        if self.delayed:
+            data_func, _ = self.delayed[-1]
+            self.delayed.clear()
+            self.writes.append(data_func())
+
+
+def sensor_state(value: float, **attributes: Any) -> SimpleNamespace:
+    """A sensor state as the coordinator reads it."""
+    return SimpleNamespace(state=str(value), attributes=attributes, last_updated=Clock.current)
+
+
+def run_now(func: Any, *args: Any) -> asyncio.Future[Any]:
+    """hass.async_add_executor_job that runs the job right away."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(func(*args))
+    return future
+
+
+@pytest.fixture
+def running(monkeypatch, tmp_path):
+    """Build a coordinator against a mocked hass with a settable clock and a FakeStore.
+
+    Returns a factory taking extra entry data. The hass has ``sensor_states`` (a dict
+    of entity id to state) and ``store`` (the FakeStore).
+    """
+    monkeypatch.setattr(coordinator_module, "datetime", Clock)
+    Clock.current = datetime(2026, 1, 15, 12, 0)
+    (tmp_path / ".storage").mkdir()
+
+    def factory(**data: Any) -> NettleieCoordinator:
+        store = FakeStore()
+        monkeypatch.setattr(coordinator_module, "StromkalkulatorStore", lambda hass, key: store)
+        states: dict[str, Any] = {"sensor.power": sensor_state(2000), "sensor.spot": sensor_state(1.0)}
+        hass = MagicMock()
+        hass.states.get = states.get
+        hass.sensor_states = states
+        hass.store = store
+        hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+        hass.config.components = set()
+        hass.async_add_executor_job = run_now
+        hass.async_create_task = lambda coro: asyncio.get_running_loop().create_task(coro)
+        entry = MagicMock()
+        entry.data = {
+            CONF_TSO: "bkk",
+            CONF_POWER_SENSOR: "sensor.power",
+            CONF_SPOT_PRICE_SENSOR: "sensor.spot",
+            CONF_SAVE_DELAY: 300,
+            **data,
+        }
+        return NettleieCoordinator(hass, entry, get_tso("bkk"))
+
+    return factory
+
+
+def make_coordinator(data: dict[str, Any]) -> NettleieCoordinator:
+    """Coordinator for an entry with the given data, TSO looked up like setup does."""
+    entry = MagicMock()
+    entry.data = data
+    return NettleieCoordinator(MagicMock(), entry, get_tso(data.get(CONF_TSO, DEFAULT_TSO), DEFAULT_TSO))
+
+
+class TestInit:
+    """The coordinator is set up from the entry."""
+
+    def test_from_entry(self, store):
+        """Settings come from the entry, the store is keyed by the TSO id."""
+        coordinator = make_coordinator(
+            {CONF_POWER_SENSOR: "sensor.power", CONF_TSO: "bkk", CONF_SETTLEMENT_MINUTES: 15}
+        )
+
+        assert coordinator.tso_id == "bkk"
+        assert coordinator.tso["name"] == "BKK Nett"
+        assert coordinator.power_sensor == "sensor.power"
+        assert coordinator.settlement_minutes == 15
+        assert coordinator.update_interval == timedelta(minutes=1)
+        store.assert_called_once_with(coordinator.hass, f"{DOMAIN}_bkk")
+
+    def test_energiledd_override(self, store):
+        """A configured energiledd replaces the TSO's current price, not its historikk."""
+        coordinator = make_coordinator({CONF_TSO: "bkk", CONF_ENERGILEDD_DAG: "0.5"})
+
+        assert coordinator.energiledd_dag == 0.5
+        assert coordinator.energiledd_natt == get_tso("bkk")["energiledd_natt"]
+        assert coordinator.energiledd_history.at(date(2026, 1, 1), True) == 0.5
+        assert coordinator.energiledd_history.at(date(2025, 12, 1), True) == 0.52876
+
+    def test_default_tso(self, store):
+        """An entry without a TSO uses the default."""
+        coordinator = make_coordinator({})
+
+        assert coordinator.tso_id == DEFAULT_TSO
+        store.assert_called_once_with(coordinator.hass, f"{DOMAIN}_{DEFAULT_TSO}")
+
+
+class TestSaveCoalescing:
+    """Changes are written once per save window."""
+
+    def test_ticks_in_window_give_one_write(self, running):
+        """Every tick changes the data, but only the first schedules a write."""
+        coordinator = running()
+        store = coordinator.hass.store
+
+        async def scenario() -> None:
+            for minute in range(10):
+                Clock.current = datetime(2026, 1, 15, 12, minute)
+                await coordinator._async_update_data()
+
+        asyncio.run(scenario())
+
+        assert [delay for _, delay in store.delayed] == [300]
+        assert store.writes == []
+        store.end_window()
+        assert len(store.writes) == 1
+        assert coordinator.save_requests == 9  # The first tick only starts counting
+        assert coordinator.store_writes == 1
+        assert coordinator.writes_avoided == 8
+
+        # The next change after the write opens a new window
+        Clock.current = datetime(2026, 1, 15, 12, 10)
+        asyncio.run(coordinator._async_update_data())
+        assert len(store.delayed) == 1
+
+    def test_month_rollover_flushes(self, running):
+        """The old month is written right away at rollover, not after the window."""
+        coordinator = running()
+        store = coordinator.hass.store
+
+        async def scenario() -> None:
+            Clock.current = datetime(2026, 1, 31, 23, 50)
+            await coordinator._async_update_data()
+            Clock.current = datetime(2026, 2, 1, 0, 1)
+            await coordinator._async_update_data()
+
+        asyncio.run(scenario())
+
+        assert len(store.writes) == 1
+        assert coordinator._previous_month_name == "januar 2026"
+
+    def test_unload_flushes(self, running):
+        """Unloading writes pending changes without waiting for the window."""
+        coordinator = running()
+        store = coordinator.hass.store
+
+        async def scenario() -> None:
+            for minute in range(3):
+                Clock.current = datetime(2026, 1, 15, 12, minute)
+                await coordinator._async_update_data()
+            await coordinator.async_flush_stored_data()
+
+        asyncio.run(scenario())
+
+        assert len(store.writes) == 1
+        assert coordinator.store_writes == 1
+        assert coordinator.writes_avoided == 1
+
+
+def power_event(watts: float) -> SimpleNamespace:
+    """A state change event for the power sensor."""
+    return SimpleNamespace(data={"new_state": sensor_state(watts)})
+
+
+class TestEventIngestion:
+    """Power state changes are booked as they arrive."""
+
+    def test_events_booked_at_held_reading(self, running):
+        """Each reading counts until the next event, the minute poll only moves time on."""
+        coordinator = running(**{CONF_EVENT_INGESTION: True})
+        states = coordinator.hass.sensor_states
+        events = {10: 3000, 40: 1000}
+
+        async def scenario() -> None:
+            for minute in range(61):
+                Clock.current = datetime(2026, 1, 15, 12, 0) + timedelta(minutes=minute)
+                await coordinator._async_update_data()
+                if minute in events:
+                    # The sensor changes half a minute after the poll
+                    Clock.current += timedelta(seconds=30)
+                    states["sensor.power"] = sensor_state(events[minute])
+                    coordinator._async_handle_power_event(power_event(events[minute]))
+
+        asyncio.run(scenario())
+
+        # 10.5 min at 2 kW, 30 min at 3 kW, 19.5 min at 1 kW
+        expected = 2 * 10.5 / 60 + 3 * 30 / 60 + 1 * 19.5 / 60
+        assert coordinator._accumulator.hour_kwh(datetime(2026, 1, 15, 12)) == pytest.approx(expected)
+        assert coordinator._accumulator.daily_max_power["2026-01-15"] == pytest.approx(expected)
+        assert coordinator._accumulator.monthly_consumption["dag"] == pytest.approx(expected)
+
+    def test_stale_event_ignored(self, running):
+        """An event older than the last sample does not rebook the hour."""
+        coordinator = running(**{CONF_EVENT_INGESTION: True})
+
+        async def scenario() -> None:
+            Clock.current = datetime(2026, 1, 15, 12, 30)
+            await coordinator._async_update_data()
+            Clock.current = datetime(2026, 1, 15, 12, 20)
+            coordinator._async_handle_power_event(power_event(9000))
+
+        asyncio.run(scenario())
+
+        assert coordinator._accumulator.hour_kwh(datetime(2026, 1, 15, 12)) == 0.0
+        assert coordinator._accumulator.last_power_kw == 2.0
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    """Recorder modules with statistics_during_period returning the test's rows.
+
+    Returns ``rows`` (statistic id to rows, filled in by the test) and ``calls``.
+    """
+    rows: dict[str, list[dict[str, float]]] = {}
+    calls: list[tuple[Any, ...]] = []
+
+    def statistics_during_period(hass, start, end, statistic_ids, period, units, types):
+        calls.append((start, end, statistic_ids, types))
+        return {statistic_id: rows[statistic_id] for statistic_id in statistic_ids if statistic_id in rows}
+
+    instance = SimpleNamespace(async_add_executor_job=run_now)
+    monkeypatch.setitem(sys.modules, "homeassistant.components.recorder", MagicMock(get_instance=lambda hass: instance))
+    monkeypatch.setitem(
+        sys.modules,
+        "homeassistant.components.recorder.statistics",
+        MagicMock(statistics_during_period=statistics_during_period),
+    )
+    return SimpleNamespace(rows=rows, calls=calls)
+
+
+def hour_row(hour: datetime, **values: float) -> dict[str, float]:
+    """A recorder statistics row for one hour (timestamps as the recorder returns them)."""
+    return {"start": hour.timestamp(), "end": (hour + timedelta(hours=1)).timestamp(), **values}
+
+
+def stored_at(running: Any, when: datetime) -> dict[str, Any]:
+    """Stored data from a coordinator that last sampled at ``when``."""
+    coordinator = running()
+    Clock.current = when
+
+    async def scenario() -> None:
+        await coordinator._async_update_data()
+        await coordinator.async_flush_stored_data()
+
+    asyncio.run(scenario())
+    return coordinator.hass.store.writes[-1]
+
+
+class TestBackfill:
+    """The downtime since the last stored sample is filled from recorder statistics."""
+
+    def test_power_statistics(self, running, recorder):
+        """Hourly mean power is booked into the hours that were missed."""
+        stored = stored_at(running, datetime(2026, 1, 15, 10, 0))
+        coordinator = running()
+        coordinator.hass.store.data = stored
+        coordinator.hass.config.components = {"recorder"}
+        recorder.rows["sensor.power"] = [
+            hour_row(datetime(2026, 1, 15, hour), mean=mean) for hour, mean in ((10, 3.0), (11, 4.0), (12, 1.5))
+        ]
+
+        Clock.current = datetime(2026, 1, 15, 13, 0)
+        asyncio.run(coordinator._async_update_data())
+
+        accumulator = coordinator._accumulator
+        assert [accumulator.hour_kwh(datetime(2026, 1, 15, hour)) for hour in (10, 11, 12)] == pytest.approx(
+            [3.0, 4.0, 1.5]
+        )
+        assert accumulator.daily_max_power["2026-01-15"] == pytest.approx(4.0)
+        assert recorder.calls[0][2] == {"sensor.power"}
+        assert recorder.calls[0][3] == {"mean"}
+        # The spot sensor has no price curve: only the hour that just ended gets its current price
+        assert coordinator.ledger.unpriced_kwh == pytest.approx(7.0)
+        assert coordinator.ledger.spot_kr == pytest.approx(1.5)
+        assert not coordinator.archive.get(datetime(2026, 1, 15, 10)).priced
+
+    def test_priced_from_curve(self, running, recorder):
+        """Backfilled hours get the spot price the curve had for them, not the current price."""
+        stored = stored_at(running, datetime(2026, 1, 15, 10, 0))
+        coordinator = running()
+        coordinator.hass.store.data = stored
+        coordinator.hass.config.components = {"recorder"}
+        prices = {10: 2.0, 11: 0.5, 12: 1.0, 13: 3.0}
+        coordinator.hass.sensor_states["sensor.spot"] = sensor_state(
+            3.0,
+            raw_today=[
+                {"start": datetime(2026, 1, 15, hour), "end": datetime(2026, 1, 15, hour + 1), "value": price}
+                for hour, price in prices.items()
+            ],
+        )
+        recorder.rows["sensor.power"] = [
+            hour_row(datetime(2026, 1, 15, hour), mean=mean) for hour, mean in ((10, 3.0), (11, 4.0), (12, 1.5))
+        ]
+
+        Clock.current = datetime(2026, 1, 15, 13, 0)
+        asyncio.run(coordinator._async_update_data())
+
+        assert coordinator.ledger.unpriced_kwh == 0.0
+        assert coordinator.ledger.spot_kr == pytest.approx(3.0 * 2.0 + 4.0 * 0.5 + 1.5 * 1.0)
+        record = coordinator.archive.get(datetime(2026, 1, 15, 11))
+        assert record.priced
+        assert record.spot_price == pytest.approx(0.5)
+
+    def test_energy_statistics(self, running, recorder):
+        """Without a power sensor, the energy sensor's hourly sums are used."""
+        stored = stored_at(running, datetime(2026, 1, 15, 10, 0))
+        coordinator = running(**{CONF_POWER_SENSOR: "", CONF_ENERGY_SENSOR: "sensor.energy"})
+        coordinator.hass.store.data = stored
+        coordinator.hass.config.components = {"recorder"}
+        recorder.rows["sensor.energy"] = [
+            hour_row(datetime(2026, 1, 15, hour), sum=total)
+            for hour, total in ((9, 100.0), (10, 102.5), (11, 105.0), (12, 106.0))
+        ]
+
+        Clock.current = datetime(2026, 1, 15, 13, 0)
+        asyncio.run(coordinator._async_update_data())
+
+        accumulator = coordinator._accumulator
+        assert [accumulator.hour_kwh(datetime(2026, 1, 15, hour)) for hour in (10, 11, 12)] == pytest.approx(
+            [2.5, 2.5, 1.0]
+        )
+        assert recorder.calls[0][3] == {"sum"}
+
+    def test_no_recorder(self, running, recorder):
+        """Without the recorder the gap is left uncovered, not charged at the current reading."""
+        stored = stored_at(running, datetime(2026, 1, 15, 10, 0))
+        coordinator = running()
+        coordinator.hass.store.data = stored
+
+        Clock.current = datetime(2026, 1, 15, 13, 0)
+        asyncio.run(coordinator._async_update_data())
+
+        assert coordinator._accumulator.hour_kwh(datetime(2026, 1, 15, 11)) == 0.0
+        assert recorder.calls == []
+
+
+class TestArchive:
+    """Booked energy is archived per hour with the cost the ledger booked."""
+
+    def test_hour_archived_with_booked_cost(self, running):
+        """The hour's record has its kWh, spot price and the ledger's cost for it."""
+        coordinator = running()
+
+        async def scenario() -> None:
+            for minute in range(61):
+                Clock.current = datetime(2026, 1, 15, 12, 0) + timedelta(minutes=minute)
+                await coordinator._async_update_data()
+
+        asyncio.run(scenario())
+
+        record = coordinator.archive.get(datetime(2026, 1, 15, 12))
+        assert record.kwh == pytest.approx(2.0)
+        assert record.spot_price == pytest.approx(1.0)
+        assert record.is_day
+        # Everything booked so far is in this hour (no kapasitetsledd per kWh)
+        assert record.cost == pytest.approx(coordinator.ledger.energy_cost_kr, rel=1e-6)
+        assert coordinator.archive.get(datetime(2026, 1, 15, 13)) is None
+
+
+class TestSnapshotRates:
+    """The sensors show the rates in effect at the time, not this year's constants."""
+
+    def test_rates_from_history(self, running):
+        """In 2025 the fee attributes and the strømstøtte threshold use the 2025 rates."""
+        coordinator = running()
+        Clock.current = datetime(2025, 6, 16, 12, 0)
+        asyncio.run(coordinator._async_update_data())
+
+        snapshot = coordinator.snapshot
+        assert snapshot.attributes("forbruksavgift")["eks_mva"] == 0.1253
+        assert snapshot.value("forbruksavgift") == round(0.1253 * 1.25, 4)
+        assert snapshot.attributes("stromstotte")["terskel"] == 0.9375
+        assert snapshot.attributes("stromstotte_aktiv")["over_terskel"]
+
+
+class TestCompareTso:
+    """Comparing TSOs over the archived months and this month."""
+
+    def test_archived_months_included(self, running):
+        """Archived months before this one are priced too, oldest first."""
+        coordinator = running()
+        asyncio.run(coordinator._async_update_data())
+        coordinator.archive.write(datetime(2025, 12, 1, 12), 1.0, 1.0, 1.0, True)
+
+        months, costs = asyncio.run(coordinator.async_compare_tso())
+
+        assert months == [date(2025, 12, 1), date(2026, 1, 1)]
+        bkk = next(cost for cost in costs if cost.tso_id == "bkk")
+        assert bkk.dag_kwh == pytest.approx(1.0)
+        assert bkk.kapasitetsledd_kr == 2 * 155
@@ -5,16 +5,40 @@ Disse testene verifiserer at våre beregninger matcher faktiske fakturaer fra BK
 Fakturaene ligger i Fakturaer/ mappen for referanse.
 
 VIKTIG: Disse testene gir høy troverdighet til at integrasjonen beregner korrekt!
+
+Satsene for fakturamåneden hentes fra tariffhistorikken (tariff_history.py og
+historikk for BKK i tso.json), ikke fra dagens priser.
 """
 
+from datetime import date
+
 import pytest
 
-# BKK priser 2025 (fra fakturaene)
-BKK_ENERGILEDD_DAG_ORE = 35.963  # øre/kWh eks. avgifter
-BKK_ENERGILEDD_NATT_ORE = 23.738  # øre/kWh eks. avgifter
+from custom_components.stromkalkulator.const import AVGIFTSSONE_STANDARD, MVA_SATS
+from custom_components.stromkalkulator.tariff_history import (
+    ENOVA_AVGIFT_HISTORY,
+    energiledd_history,
+    forbruksavgift_at,
+)
+from custom_components.stromkalkulator.tso import get_tso
+
 BKK_KAPASITET_5_10_KW = 415  # kr/mnd
-FORBRUKSAVGIFT_2025_ORE = 15.662  # øre/kWh (vintersats Sør-Norge 2025)
-ENOVAAVGIFT_2025_ORE = 1.25  # øre/kWh
+
+
+def satser(maaned: date) -> dict[str, float]:
+    """BKK-satser i øre/kWh inkl. mva for en fakturamåned, slik de står på fakturaen."""
+    bkk = get_tso("bkk")
+    history = energiledd_history(bkk, bkk["energiledd_dag"], bkk["energiledd_natt"])
+    forbruksavgift = forbruksavgift_at(AVGIFTSSONE_STANDARD, maaned) * (1 + MVA_SATS) * 100
+    enovaavgift = ENOVA_AVGIFT_HISTORY.at(maaned) * (1 + MVA_SATS) * 100
+    # Energiledd i tso.json er inkl. avgifter, fakturaen viser avgiftene på egne linjer
+    avgifter = forbruksavgift + enovaavgift
+    return {
+        "energiledd_dag": history.at(maaned, True) * 100 - avgifter,
+        "energiledd_natt": history.at(maaned, False) * 100 - avgifter,
+        "forbruksavgift": forbruksavgift,
+        "enovaavgift": enovaavgift,
+    }
 
 
 # Fakturaer som fixtures
@@ -27,6 +51,7 @@ def faktura_desember_2025():
     Å betale: 1006.20 kr
     """
     return {
+        "maaned": date(2025, 12, 1),
         "forbruk_dag_kwh": 667.422,
         "forbruk_natt_kwh": 887.299,
         "forbruk_total_kwh": 1554.721,
@@ -50,6 +75,7 @@ def faktura_november_2025():
     Denne måneden hadde høy strømstøtte (404.80 kr) pga høye priser.
     """
     return {
+        "maaned": date(2025, 11, 1),
         "forbruk_dag_kwh": 709.157,
         "forbruk_natt_kwh": 765.349,
         "forbruk_total_kwh": 1474.506,
@@ -72,6 +98,7 @@ def faktura_oktober_2025():
     Denne måneden hadde lav strømstøtte (7.16 kr) pga lave priser.
     """
     return {
+        "maaned": date(2025, 10, 1),
         "forbruk_dag_kwh": 707.09,
         "forbruk_natt_kwh": 536.117,
         "forbruk_total_kwh": 1243.207,
@@ -90,12 +117,13 @@ def faktura_oktober_2025():
 # Helper for å beregne total nettleie
 def beregn_total_nettleie(faktura: dict) -> float:
     """Beregn total nettleie basert på fakturadata."""
-    energiledd_dag = faktura["forbruk_dag_kwh"] * BKK_ENERGILEDD_DAG_ORE / 100
-    energiledd_natt = faktura["forbruk_natt_kwh"] * BKK_ENERGILEDD_NATT_ORE / 100
+    sats = satser(faktura["maaned"])
+    energiledd_dag = faktura["forbruk_dag_kwh"] * sats["energiledd_dag"] / 100
+    energiledd_natt = faktura["forbruk_natt_kwh"] * sats["energiledd_natt"] / 100
     stromstotte = faktura["stromstotte_kwh"] * faktura["stromstotte_ore_snitt"] / 100
     kapasitet = faktura["forventet_kapasitet_kr"]
-    forbruksavgift = faktura["forbruk_total_kwh"] * FORBRUKSAVGIFT_2025_ORE / 100
-    enovaavgift = faktura["forbruk_total_kwh"] * ENOVAAVGIFT_2025_ORE / 100
+    forbruksavgift = faktura["forbruk_total_kwh"] * sats["forbruksavgift"] / 100
+    enovaavgift = faktura["forbruk_total_kwh"] * sats["enovaavgift"] / 100
 
     return energiledd_dag + energiledd_natt - stromstotte + kapasitet + forbruksavgift + enovaavgift
 
@@ -105,25 +133,29 @@ def beregn_total_nettleie(faktura: dict) -> float:
 
 def test_energiledd_dag_desember(faktura_desember_2025):
     """Verifiser at energiledd dag beregnes korrekt for desember."""
-    beregnet = faktura_desember_2025["forbruk_dag_kwh"] * BKK_ENERGILEDD_DAG_ORE / 100
+    sats = satser(faktura_desember_2025["maaned"])
+    beregnet = faktura_desember_2025["forbruk_dag_kwh"] * sats["energiledd_dag"] / 100
     assert beregnet == pytest.approx(faktura_desember_2025["forventet_energiledd_dag_kr"], abs=0.10)
 
 
 def test_energiledd_natt_desember(faktura_desember_2025):
     """Verifiser at energiledd natt beregnes korrekt for desember."""
-    beregnet = faktura_desember_2025["forbruk_natt_kwh"] * BKK_ENERGILEDD_NATT_ORE / 100
+    sats = satser(faktura_desember_2025["maaned"])
+    beregnet = faktura_desember_2025["forbruk_natt_kwh"] * sats["energiledd_natt"] / 100
     assert beregnet == pytest.approx(faktura_desember_2025["forventet_energiledd_natt_kr"], abs=0.10)
 
 
 def test_forbruksavgift_desember(faktura_desember_2025):
     """Verifiser at forbruksavgift beregnes korrekt for desember."""
-    beregnet = faktura_desember_2025["forbruk_total_kwh"] * FORBRUKSAVGIFT_2025_ORE / 100
+    sats = satser(faktura_desember_2025["maaned"])
+    beregnet = faktura_desember_2025["forbruk_total_kwh"] * sats["forbruksavgift"] / 100
     assert beregnet == pytest.approx(faktura_desember_2025["forventet_forbruksavgift_kr"], abs=0.10)
 
 
 def test_enovaavgift_desember(faktura_desember_2025):
     """Verifiser at Enova-avgift beregnes korrekt for desember."""
-    beregnet = faktura_desember_2025["forbruk_total_kwh"] * ENOVAAVGIFT_2025_ORE / 100
+    sats = satser(faktura_desember_2025["maaned"])
+    beregnet = faktura_desember_2025["forbruk_total_kwh"] * sats["enovaavgift"] / 100
     assert beregnet == pytest.approx(faktura_desember_2025["forventet_enovaavgift_kr"], abs=0.10)
 
 
@@ -150,13 +182,15 @@ def test_total_nettleie_desember(faktura_desember_2025):
 
 def test_energiledd_dag_november(faktura_november_2025):
     """Verifiser energiledd dag for november."""
-    beregnet = faktura_november_2025["forbruk_dag_kwh"] * BKK_ENERGILEDD_DAG_ORE / 100
+    sats = satser(faktura_november_2025["maaned"])
+    beregnet = faktura_november_2025["forbruk_dag_kwh"] * sats["energiledd_dag"] / 100
     assert beregnet == pytest.approx(faktura_november_2025["forventet_energiledd_dag_kr"], abs=0.10)
 
 
 def test_energiledd_natt_november(faktura_november_2025):
     """Verifiser energiledd natt for november."""
-    beregnet = faktura_november_2025["forbruk_natt_kwh"] * BKK_ENERGILEDD_NATT_ORE / 100
+    sats = satser(faktura_november_2025["maaned"])
+    beregnet = faktura_november_2025["forbruk_natt_kwh"] * sats["energiledd_natt"] / 100
     assert beregnet == pytest.approx(faktura_november_2025["forventet_energiledd_natt_kr"], abs=0.10)
 
 
@@ -0,0 +1,61 @@
+"""Test the Norwegian holiday generator.
+
+Tests:
+- Easter dates against known years
+- Computed moving holidays match HELLIGDAGER_BEVEGELIGE
+- Fixed holidays are included
+- Years after the hard-coded list still get holidays
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from custom_components.stromkalkulator.const import HELLIGDAGER_BEVEGELIGE, HELLIGDAGER_FASTE
+from custom_components.stromkalkulator.holidays import easter_sunday, moving_holidays, norwegian_holidays
+
+
+class TestEaster:
+    """Gregorian computus."""
+
+    @pytest.mark.parametrize(
+        ("year", "expected"),
+        [
+            (2024, date(2024, 3, 31)),
+            (2025, date(2025, 4, 20)),
+            (2026, date(2026, 4, 5)),
+            (2027, date(2027, 3, 28)),
+            (2028, date(2028, 4, 16)),
+            (2038, date(2038, 4, 25)),  # Senest mulige
+            (2285, date(2285, 3, 22)),  # Tidligst mulige
+        ],
+    )
+    def test_easter_sunday(self, year, expected):
+        """1. påskedag for known years."""
+        assert easter_sunday(year) == expected
+
+
+class TestHolidays:
+    """Computed holiday sets."""
+
+    def test_matches_constant_list(self):
+        """Computed moving holidays are exactly the hard-coded 2026-2027 dates."""
+        expected = {date.fromisoformat(day) for day in HELLIGDAGER_BEVEGELIGE}
+        computed = moving_holidays(2026) | moving_holidays(2027)
+        assert computed == expected
+
+    def test_fixed_holidays_included(self):
+        """Faste helligdager are part of the year's holidays."""
+        holidays = norwegian_holidays(2026)
+        for mm_dd in HELLIGDAGER_FASTE:
+            assert date.fromisoformat(f"2026-{mm_dd}") in holidays
+
+    def test_after_hard_coded_years(self):
+        """2028 gets påske and pinse without a list update."""
+        holidays = norwegian_holidays(2028)
+        assert date(2028, 4, 14) in holidays  # Langfredag
+        assert date(2028, 5, 25) in holidays  # Kristi himmelfartsdag
+        assert date(2028, 6, 5) in holidays  # 2. pinsedag
+        assert len(holidays) == 12
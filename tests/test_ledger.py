@@ -0,0 +1,117 @@
+"""Test the monthly cost ledger.
+
+Tests:
+- Energiledd booked to dag or natt by the interval's rate
+- Each interval priced at its own rates
+- Strømstøtte cap splits the crossing interval
+- Energy without a spot price gets nettleie and avgifter only
+- Summary totals (nettleie, avgifter, total)
+- Copy, reset and load for month roll and storage
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.stromkalkulator.ledger import CostLedger, IntervalRates
+
+DAG = IntervalRates(True, 0.40, 0.08, 0.01, 1.20, 0.30)
+NATT = IntervalRates(False, 0.25, 0.08, 0.01, 0.60, 0.0)
+
+
+class TestBook:
+    """Booking energy at interval rates."""
+
+    def test_dag_natt(self):
+        """Energiledd goes to dag or natt, fees and spot to both."""
+        ledger = CostLedger()
+        ledger.book(2.0, DAG)
+        ledger.book(3.0, NATT)
+
+        assert ledger.energiledd_dag_kr == pytest.approx(0.80)
+        assert ledger.energiledd_natt_kr == pytest.approx(0.75)
+        assert ledger.forbruksavgift_kr == pytest.approx(5.0 * 0.08)
+        assert ledger.enova_kr == pytest.approx(5.0 * 0.01)
+        assert ledger.spot_kr == pytest.approx(2.0 * 1.20 + 3.0 * 0.60)
+        assert ledger.stromstotte_kr == pytest.approx(2.0 * 0.30)
+
+    def test_rates_of_each_interval(self):
+        """A price change mid-month only applies to energy after it."""
+        ledger = CostLedger()
+        ledger.book(1.0, DAG)
+        ledger.book(1.0, DAG._replace(energiledd=0.50))
+        assert ledger.energiledd_dag_kr == pytest.approx(0.90)
+
+    def test_stromstotte_cap(self):
+        """Only kWh under the monthly cap get strømstøtte, the crossing interval is split."""
+        ledger = CostLedger(stromstotte_max_kwh=3.0)
+        ledger.book(2.0, DAG)
+        ledger.book(2.0, DAG)
+
+        assert ledger.stromstotte_kwh == pytest.approx(3.0)
+        assert ledger.stromstotte_kr == pytest.approx(3.0 * 0.30)
+        assert ledger.energiledd_dag_kr == pytest.approx(4.0 * 0.40)
+
+    def test_unknown_spot_price(self):
+        """Spot cost and strømstøtte are left out and the energy is counted as unpriced."""
+        ledger = CostLedger(stromstotte_max_kwh=3.0)
+        ledger.book(2.0, DAG._replace(spot_price=None, stromstotte=None))
+        ledger.book(2.0, DAG)
+
+        assert ledger.energiledd_dag_kr == pytest.approx(4.0 * 0.40)
+        assert ledger.spot_kr == pytest.approx(2.0 * 1.20)
+        assert ledger.unpriced_kwh == pytest.approx(2.0)
+        # The unpriced energy still uses up the cap
+        assert ledger.stromstotte_kr == pytest.approx(1.0 * 0.30)
+        assert ledger.summary(0)["spotpris_ukjent_kwh"] == pytest.approx(2.0)
+
+    def test_energy_cost(self):
+        """Energy cost is everything booked per kWh, after strømstøtte."""
+        ledger = CostLedger()
+        ledger.book(2.0, DAG)
+        assert ledger.energy_cost_kr == pytest.approx(2.0 * (0.40 + 0.08 + 0.01 + 1.20 - 0.30))
+
+
+class TestSummary:
+    """Totals for the sensors."""
+
+    def test_totals(self):
+        """Nettleie includes kapasitetsledd, total subtracts strømstøtte."""
+        ledger = CostLedger()
+        ledger.book(2.0, DAG)
+        ledger.book(3.0, NATT)
+        summary = ledger.summary(kapasitetsledd=415)
+
+        assert summary["kapasitetsledd_kr"] == 415
+        assert summary["nettleie_kr"] == pytest.approx(0.80 + 0.75 + 415)
+        assert summary["avgifter_kr"] == pytest.approx(5.0 * 0.09)
+        assert summary["total_kr"] == pytest.approx(0.80 + 0.75 + 415 + 0.45 - 0.60)
+        assert summary["spotpris_kr"] == pytest.approx(4.2)
+
+    def test_empty(self):
+        """An empty month costs only kapasitetsledd."""
+        assert CostLedger().summary(155)["total_kr"] == 155
+
+
+class TestStorage:
+    """Copy, reset and load."""
+
+    def test_copy_is_independent(self):
+        """The previous month copy does not follow the reset."""
+        ledger = CostLedger()
+        ledger.book(2.0, DAG)
+        previous = ledger.copy()
+        ledger.reset()
+
+        assert ledger.totals() == dict.fromkeys(CostLedger.FIELDS, 0.0)
+        assert previous.energiledd_dag_kr == pytest.approx(0.80)
+
+    def test_load(self):
+        """Stored totals load back, missing fields are zero."""
+        ledger = CostLedger()
+        ledger.book(2.0, DAG)
+        loaded = CostLedger()
+        loaded.load({key: value for key, value in ledger.totals().items() if key != "spot_kr"})
+
+        assert loaded.energiledd_dag_kr == ledger.energiledd_dag_kr
+        assert loaded.spot_kr == 0.0
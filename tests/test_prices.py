@@ -0,0 +1,136 @@
+"""Test the day-ahead price curve.
+
+Tests:
+- Batch calculation matches the single-price formulas
+- Strømstøtte only above the threshold, none with Norgespris
+- Dag/natt mask picks energiledd per interval
+- Spot attribute parsing (Nord Pool raw, Nord Pool lists, ENTSO-E)
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.stromkalkulator.const import STROMSTOTTE_LEVEL, STROMSTOTTE_RATE
+from custom_components.stromkalkulator.prices import (
+    PriceParams,
+    build_curve,
+    calculate_prices,
+    parse_spot_attributes,
+)
+
+
+def make_params(har_norgespris: bool = False) -> PriceParams:
+    """BKK-like parameters for January."""
+    return PriceParams(
+        energiledd_dag=0.4613,
+        energiledd_natt=0.2329,
+        fastledd_per_kwh=0.5,
+        offentlige_avgifter=0.1,
+        norgespris=0.50,
+        har_norgespris=har_norgespris,
+        stromstotte_level=STROMSTOTTE_LEVEL,
+        stromstotte_rate=STROMSTOTTE_RATE,
+    )
+
+
+class TestCalculatePrices:
+    """Batch price calculation."""
+
+    def test_columns(self):
+        """Every column follows the same formula as the current price."""
+        spot = [0.5, 1.2, 2.0]
+        curve = calculate_prices(spot, [False, True, True], make_params())
+
+        for i, spot_price in enumerate(spot):
+            stotte = max(spot_price - STROMSTOTTE_LEVEL, 0) * STROMSTOTTE_RATE
+            energiledd = 0.4613 if i else 0.2329
+            assert curve.stromstotte[i] == pytest.approx(stotte)
+            assert curve.spotpris_etter_stotte[i] == pytest.approx(spot_price - stotte)
+            assert curve.energiledd[i] == energiledd
+            assert curve.total_price[i] == pytest.approx(spot_price - stotte + energiledd + 0.5)
+            assert curve.total_price_uten_stotte[i] == pytest.approx(spot_price + energiledd + 0.5)
+            assert curve.total_price_inkl_avgifter[i] == pytest.approx(curve.total_price[i] + 0.1)
+            assert curve.kroner_spart_per_kwh[i] == pytest.approx(curve.total_price[i] - (0.50 + energiledd + 0.5))
+
+    def test_no_stotte_below_threshold(self):
+        """Prices at or under the threshold get no strømstøtte."""
+        curve = calculate_prices([0.0, STROMSTOTTE_LEVEL, -0.1], [True] * 3, make_params())
+        assert curve.stromstotte == [0.0, 0.0, 0.0]
+
+    def test_norgespris(self):
+        """With Norgespris the total is the fixed price, without strømstøtte or savings."""
+        curve = calculate_prices([0.5, 3.0], [True, False], make_params(har_norgespris=True))
+        assert curve.stromstotte == [0.0, 0.0]
+        assert curve.kroner_spart_per_kwh == [0.0, 0.0]
+        assert curve.total_price == pytest.approx([0.50 + 0.4613 + 0.5, 0.50 + 0.2329 + 0.5])
+        assert curve.total_price_uten_stotte == curve.total_price
+
+    def test_empty(self):
+        """No spot prices gives empty columns."""
+        assert calculate_prices([], [], make_params()).total_price == []
+
+    def test_build_curve(self):
+        """Start and end come from the spot points."""
+        start = datetime(2026, 1, 15, 0, 0)
+        points = [(start + timedelta(hours=h), start + timedelta(hours=h + 1), 1.0) for h in range(24)]
+        curve = build_curve(points, [6 <= h < 22 for h in range(24)], make_params())
+
+        assert len(curve.total_price) == 24
+        assert curve.start[0] == start
+        assert curve.end[-1] == start + timedelta(days=1)
+        rows = curve.as_rows()
+        assert rows[0]["start"] == "2026-01-15T00:00:00"
+        assert rows[6]["energiledd"] == 0.4613
+
+
+class TestParseSpotAttributes:
+    """Nord Pool and ENTSO-E attribute formats."""
+
+    def test_nordpool_raw(self):
+        """raw_today/raw_tomorrow with aware timestamps become naive local time."""
+        start = datetime(2026, 1, 15, 0, 0, tzinfo=UTC)
+        raw = [
+            {"start": start + timedelta(minutes=15 * i), "end": start + timedelta(minutes=15 * (i + 1)), "value": i}
+            for i in range(96)
+        ]
+        today, tomorrow = parse_spot_attributes({"raw_today": raw, "raw_tomorrow": []})
+
+        assert len(today) == 96
+        assert tomorrow == []
+        first_start, first_end, value = today[0]
+        assert first_start.tzinfo is None
+        assert first_start == start.astimezone().replace(tzinfo=None)
+        assert first_end - first_start == timedelta(minutes=15)
+        assert value == 0.0
+
+    def test_nordpool_lists(self):
+        """Plain today/tomorrow lists are placed from local midnight."""
+        today, tomorrow = parse_spot_attributes({"today": [1.0] * 24, "tomorrow": [2.0] * 96})
+
+        midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        assert today[0][0] == midnight
+        assert today[-1][1] == midnight + timedelta(days=1)
+        assert tomorrow[0][0] == midnight + timedelta(days=1)
+        assert tomorrow[1][0] - tomorrow[0][0] == timedelta(minutes=15)
+
+    def test_nordpool_lists_incomplete(self):
+        """Lists with missing prices or an odd length are ignored."""
+        today, tomorrow = parse_spot_attributes({"today": [1.0] * 23 + [None], "tomorrow": [1.0] * 10})
+        assert today == []
+        assert tomorrow == []
+
+    def test_entsoe(self):
+        """ENTSO-E rows without end get it from the next row, sorted by time."""
+        rows = [{"time": f"2026-01-15T{h:02d}:00:00", "price": h / 10} for h in reversed(range(24))]
+        today, _ = parse_spot_attributes({"prices_today": rows})
+
+        assert today[0] == (datetime(2026, 1, 15, 0), datetime(2026, 1, 15, 1), 0.0)
+        assert today[-1][1] == datetime(2026, 1, 16, 0)
+
+    def test_missing(self):
+        """A sensor without price attributes gives no curve."""
+        assert parse_spot_attributes({}) == ([], [])
+        assert parse_spot_attributes({"raw_today": [{"start": "bad", "value": 1}]}) == ([], [])
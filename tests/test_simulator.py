@@ -0,0 +1,130 @@
+"""Test the Norgespris vs spot price simulator.
+
+Tests:
+- Strømstøtte per hour, only above the threshold
+- Threshold in effect for each hour (2025 vs 2026)
+- 5000 kWh caps for strømstøtte and Norgespris
+- One result per month, months without data skipped
+- Streaming: a generator over several years is consumed lazily
+- Imported series sorted and converted to naive local time
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from custom_components.stromkalkulator.archive import HourlyArchive
+from custom_components.stromkalkulator.const import STROMSTOTTE_LEVEL, STROMSTOTTE_RATE
+from custom_components.stromkalkulator.simulator import as_rows, imported_hours, simulate
+
+NORGESPRIS = 0.50
+
+
+def hours(start: datetime, count: int, kwh: float, spot_price: float):
+    """Constant consumption and price from start."""
+    return [(start + timedelta(hours=h), kwh, spot_price) for h in range(count)]
+
+
+class TestSimulate:
+    """Replay under both regimes."""
+
+    def test_below_threshold(self):
+        """No strømstøtte under the threshold, difference is spot minus Norgespris."""
+        [month] = simulate(hours(datetime(2026, 1, 1), 24, 2.0, 0.80), NORGESPRIS)
+
+        assert month.month == date(2026, 1, 1)
+        assert month.hours == 24
+        assert month.kwh == pytest.approx(48.0)
+        assert month.stromstotte_kr == 0.0
+        assert month.spot_kr == pytest.approx(48.0 * 0.80)
+        assert month.norgespris_kr == pytest.approx(48.0 * NORGESPRIS)
+        assert month.differanse_kr == pytest.approx(48.0 * (0.80 - NORGESPRIS))
+
+    def test_stromstotte_per_hour(self):
+        """Strømstøtte follows each hour's price, not the month average."""
+        data = hours(datetime(2026, 1, 1), 1, 1.0, 2.0) + hours(datetime(2026, 1, 1, 1), 1, 1.0, 0.0)
+        [month] = simulate(data, NORGESPRIS)
+
+        stotte = (2.0 - STROMSTOTTE_LEVEL) * STROMSTOTTE_RATE
+        assert month.stromstotte_kr == pytest.approx(stotte)
+        assert month.spot_kr == pytest.approx(2.0 - stotte)
+
+    def test_threshold_of_the_year(self):
+        """Hours in 2025 get strømstøtte over the 2025 threshold (93,75 øre), not today's."""
+        data = hours(datetime(2025, 12, 31, 23), 1, 1.0, 0.95) + hours(datetime(2026, 1, 1), 1, 1.0, 0.95)
+        december, january = simulate(data, NORGESPRIS)
+
+        assert december.stromstotte_kr == pytest.approx((0.95 - 0.9375) * STROMSTOTTE_RATE)
+        assert january.stromstotte_kr == 0.0
+
+    def test_caps(self):
+        """Only the first 5000 kWh get strømstøtte or Norgespris, the rest pays spot."""
+        # 10 kWh per hour for 600 hours = 6000 kWh
+        [month] = simulate(hours(datetime(2026, 1, 1), 600, 10.0, 2.0), NORGESPRIS)
+
+        stotte_per_kwh = (2.0 - STROMSTOTTE_LEVEL) * STROMSTOTTE_RATE
+        assert month.stromstotte_kwh == pytest.approx(5000.0)
+        assert month.stromstotte_kr == pytest.approx(5000.0 * stotte_per_kwh)
+        assert month.norgespris_kwh == pytest.approx(5000.0)
+        assert month.norgespris_kr == pytest.approx(5000.0 * NORGESPRIS + 1000.0 * 2.0)
+
+    def test_cap_splits_hour(self):
+        """The hour that crosses the cap is split."""
+        [month] = simulate(hours(datetime(2026, 1, 1), 2, 3000.0, 1.0), NORGESPRIS)
+        assert month.norgespris_kr == pytest.approx(5000.0 * NORGESPRIS + 1000.0 * 1.0)
+
+    def test_months(self):
+        """Caps reset per month, empty months are skipped."""
+        data = (
+            hours(datetime(2026, 1, 31, 22), 2, 3000.0, 1.0)
+            + hours(datetime(2026, 2, 1), 1, 3000.0, 1.0)
+            + hours(datetime(2026, 4, 1), 1, 1.0, 1.0)
+        )
+        months = list(simulate(data, NORGESPRIS))
+
+        assert [month.month for month in months] == [date(2026, 1, 1), date(2026, 2, 1), date(2026, 4, 1)]
+        assert [month.hours for month in months] == [2, 1, 1]
+        assert months[0].norgespris_kwh == pytest.approx(5000.0)
+        assert months[1].norgespris_kwh == pytest.approx(3000.0)
+
+    def test_streaming(self):
+        """Results come out as months complete, without reading ahead."""
+        consumed = []
+
+        def source():
+            hour = datetime(2024, 1, 1)
+            while hour.year < 2027:
+                consumed.append(hour)
+                yield hour, 1.0, 1.0
+                hour += timedelta(hours=1)
+
+        results = simulate(source(), NORGESPRIS)
+        first = next(results)
+        assert first.month == date(2024, 1, 1)
+        assert consumed[-1] == datetime(2024, 2, 1)
+        assert len(list(results)) == 35
+
+    def test_from_archive(self):
+        """Archive records can be fed in directly."""
+        archive = HourlyArchive()
+        for h in range(48):
+            archive.write(datetime(2026, 1, 1) + timedelta(hours=h), 1.0, 1.5, 0.0, False)
+        records = archive.records(datetime(2026, 1, 1), datetime(2026, 2, 1))
+        [month] = simulate(((r.hour, r.kwh, r.spot_price) for r in records), NORGESPRIS)
+        assert month.hours == 48
+        assert as_rows([month])[0]["month"] == "2026-01-01"
+
+    def test_imported_series(self):
+        """An imported series is put in time order, aware timestamps become naive local time."""
+        aware = datetime(2024, 1, 1, 12, tzinfo=UTC)
+        rows = [
+            {"time": datetime(2024, 1, 2), "kwh": 2, "spotpris": 0.5},
+            {"time": aware, "kwh": 1.0, "spotpris": "1.5"},
+        ]
+        hours = imported_hours(rows)
+
+        assert hours == [(aware.astimezone().replace(tzinfo=None), 1.0, 1.5), (datetime(2024, 1, 2), 2.0, 0.5)]
+        [month] = simulate(hours, NORGESPRIS)
+        assert month.kwh == pytest.approx(3.0)
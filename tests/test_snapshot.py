@@ -0,0 +1,282 @@
+"""Test the precomputed sensor snapshot.
+
+Tests:
+- Values and attributes computed from coordinator data
+- Fees for the avgiftssone and month passed in, at the rates in the data
+- Missing top days give no state
+- Every sensor type in sensor.py has a state (except effektrom)
+- Snapshot is read-only, empty snapshot gives None
+- Only sensors whose state or attributes changed are reported
+- Each sensor's unrecorded attributes exist and are static, recorded attribute bytes per refresh
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.stromkalkulator.const import (
+    AVGIFTSSONE_STANDARD,
+    AVGIFTSSONE_TILTAKSSONE,
+    ENOVA_AVGIFT,
+    FORBRUKSAVGIFT_ALMINNELIG,
+    STROMSTOTTE_LEVEL,
+)
+from custom_components.stromkalkulator.ledger import CostLedger, IntervalRates
+from custom_components.stromkalkulator.sensor import async_setup_entry
+from custom_components.stromkalkulator.snapshot import EMPTY_SNAPSHOT, build_snapshot
+
+SENSOR_PY = Path(__file__).parent.parent / "custom_components" / "stromkalkulator" / "sensor.py"
+
+
+def make_data(**overrides: Any) -> dict[str, Any]:
+    """Coordinator data for a day tariff hour in January."""
+    data: dict[str, Any] = {
+        "energiledd": 0.4613,
+        "energiledd_dag": 0.4613,
+        "energiledd_natt": 0.2329,
+        "kapasitetsledd": 415,
+        "kapasitetstrinn_nummer": 3,
+        "kapasitetstrinn_intervall": "5-10 kW",
+        "kapasitetsledd_per_kwh": 0.5764,
+        "spot_price": 1.2,
+        "stromstotte": 0.2138,
+        "spotpris_etter_stotte": 0.9862,
+        "norgespris": 0.5,
+        "norgespris_stromstotte": 0,
+        "total_pris_norgespris": 1.5377,
+        "kroner_spart_per_kwh": 0.4862,
+        "total_price": 2.0239,
+        "total_price_uten_stotte": 2.2377,
+        "total_price_inkl_avgifter": 2.0239,
+        "forbruksavgift_inkl_mva": 0.0891,
+        "enova_inkl_mva": 0.0125,
+        "offentlige_avgifter": 0.1016,
+        "forbruksavgift_eks_mva": FORBRUKSAVGIFT_ALMINNELIG,
+        "enova_avgift_eks_mva": ENOVA_AVGIFT,
+        "stromstotte_terskel": STROMSTOTTE_LEVEL,
+        "price_curve": {"today": None, "tomorrow": None},
+        "electricity_company_price": None,
+        "electricity_company_total": None,
+        "current_power_kw": 3.2,
+        "settlement_minutes": 60,
+        "current_interval_kwh": 1.6,
+        "current_interval_projection_kw": 3.1,
+        "uncovered_seconds_hour": 0,
+        "uncovered_minutes_month": 0.0,
+        "avg_top_3_kw": 6.333,
+        "top_3_days": {"2026-01-14": 7.0, "2026-01-05": 6.5, "2026-01-09": 5.5},
+        "is_day_rate": True,
+        "tso": "BKK",
+        "har_norgespris": False,
+        "avgiftssone": AVGIFTSSONE_STANDARD,
+        "monthly_consumption_dag_kwh": 210.5,
+        "monthly_consumption_natt_kwh": 120.25,
+        "monthly_consumption_total_kwh": 330.75,
+        "monthly_costs": CostLedger().summary(415),
+        "previous_month_consumption_dag_kwh": 400.0,
+        "previous_month_consumption_natt_kwh": 300.0,
+        "previous_month_consumption_total_kwh": 700.0,
+        "previous_month_top_3": {"2025-12-01": 6.0, "2025-12-24": 7.1},
+        "previous_month_avg_top_3_kw": 6.55,
+        "previous_month_name": "desember 2025",
+        "previous_month_costs": CostLedger().summary(415),
+    }
+    data.update(overrides)
+    return data
+
+
+def make_snapshot(avgiftssone: str = AVGIFTSSONE_STANDARD, month: int = 1, **overrides: Any):
+    """Snapshot for make_data()."""
+    return build_snapshot(
+        make_data(**overrides),
+        avgiftssone=avgiftssone,
+        month=month,
+        tariff_periods=("Man-fre 06:00-22:00 (ikke helligdager)", "22:00-06:00, helger og helligdager"),
+    )
+
+
+class TestBuildSnapshot:
+    """States computed from coordinator data."""
+
+    def test_values(self):
+        """States come straight from the data, rounded where the sensors round."""
+        snapshot = make_snapshot()
+        assert snapshot.value("energiledd") == 0.4613
+        assert snapshot.value("tariff") == "dag"
+        assert snapshot.value("gjennomsnitt_forbruk") == 6.33
+        assert snapshot.value("total_pris_inkl_avgifter") == 2.0239
+        assert snapshot.value("stromstotte_aktiv") == "Ja"
+        assert snapshot.value("maanedlig_nettleie") == 415
+
+    def test_attributes(self):
+        """Attributes are precomputed, including the top days."""
+        snapshot = make_snapshot()
+        assert snapshot.attributes("kapasitetstrinn")["maks_1_dato"] == "2026-01-14"
+        assert snapshot.attributes("maks_forbruk_2") == {"dato": "2026-01-05"}
+        assert snapshot.attributes("tariff")["natt_periode"] == "22:00-06:00, helger og helligdager"
+        assert snapshot.attributes("forrige_maaned_toppforbruk")["topp_1_kw"] == 7.1
+        assert snapshot.attributes("trinn_nummer") is None
+
+    def test_missing_top_days(self):
+        """Ranks without a day have no state."""
+        snapshot = make_snapshot(top_3_days={"2026-01-14": 7.0})
+        assert snapshot.value("maks_forbruk_1") == 7.0
+        assert snapshot.value("maks_forbruk_3") is None
+
+    def test_fees_for_zone_and_month(self):
+        """Fees use the rates in the data, mva for the avgiftssone and the month passed in."""
+        standard = make_snapshot()
+        assert standard.value("forbruksavgift") == round(FORBRUKSAVGIFT_ALMINNELIG * 1.25, 4)
+        assert standard.value("enovaavgift") == round(ENOVA_AVGIFT * 1.25, 4)
+        assert standard.attributes("enovaavgift")["note"].endswith("(1,0 øre/kWh)")
+        assert standard.attributes("offentlige_avgifter")["sesong"] == "vinter"
+        assert make_snapshot(month=7).attributes("offentlige_avgifter")["sesong"] == "sommer"
+
+        tiltakssone = make_snapshot(AVGIFTSSONE_TILTAKSSONE, forbruksavgift_eks_mva=0.0)
+        assert tiltakssone.value("forbruksavgift") == 0.0
+        assert tiltakssone.attributes("enovaavgift")["mva_sats"] == "0%"
+
+    def test_earlier_rates(self):
+        """Fees and the strømstøtte threshold follow the rates the coordinator looked up."""
+        snapshot = make_snapshot(forbruksavgift_eks_mva=0.1253, stromstotte_terskel=0.9375)
+        assert snapshot.value("forbruksavgift") == round(0.1253 * 1.25, 4)
+        assert snapshot.value("offentlige_avgifter") == round((0.1253 + ENOVA_AVGIFT) * 1.25, 2)
+        assert snapshot.attributes("energiledd_natt")["eks_avgifter_mva"] == round(
+            (0.2329 - 0.1253 - ENOVA_AVGIFT) / 1.25, 4
+        )
+        assert snapshot.attributes("stromstotte")["terskel"] == 0.9375
+        assert snapshot.attributes("stromstotte_aktiv")["note"].startswith("Timer hvor spotpris > 93.75 øre/kWh")
+
+    def test_norgespris_aktiv(self):
+        """Norgespris active follows the config."""
+        assert make_snapshot().value("norgespris_aktiv") == "Nei"
+        assert make_snapshot(har_norgespris=True).value("norgespris_aktiv") == "Ja"
+
+    def test_every_sensor_type(self):
+        """Every sensor type created in sensor.py has a state."""
+        source = SENSOR_PY.read_text(encoding="utf-8")
+        sensor_types = set(re.findall(r'super\(\).__init__\(coordinator, entry, "(\w+)"', source))
+        sensor_types |= {f"maks_forbruk_{rank}" for rank in (1, 2, 3)}
+        sensor_types.discard("effektrom")
+
+        snapshot = make_snapshot()
+        assert len(sensor_types) == 36
+        assert {sensor_type for sensor_type in sensor_types if sensor_type not in snapshot} == set()
+
+
+class TestSensorSnapshot:
+    """The snapshot object."""
+
+    def test_read_only(self):
+        """A snapshot cannot be changed after it is built."""
+        snapshot = make_snapshot()
+        with pytest.raises(AttributeError):
+            snapshot._values = {}
+        with pytest.raises(AttributeError):
+            snapshot.extra = 1
+
+    def test_empty(self):
+        """Before the first refresh every state is None."""
+        assert EMPTY_SNAPSHOT.value("energiledd") is None
+        assert EMPTY_SNAPSHOT.attributes("energiledd") is None
+
+    def test_changed(self):
+        """Only sensors with a new state or new attributes are reported as changed."""
+        first = make_snapshot()
+        assert make_snapshot().changed(first) == frozenset()
+
+        # Ny effekt endrer bare attributtene til kapasitetstrinn
+        assert make_snapshot(current_power_kw=4.0).changed(first) == {"kapasitetstrinn"}
+        # Ny spotpris endrer prissensorene, ikke avgifter eller forrige måned
+        changed = make_snapshot(spot_price=1.5, stromstotte=0.48).changed(first)
+        assert {"stromstotte", "stromstotte_aktiv", "total_price"} <= changed
+        assert not changed & {"forbruksavgift", "enovaavgift", "energiledd_dag", "forrige_maaned_nettleie"}
+
+    def test_changed_from_empty(self):
+        """The first snapshot reports every sensor, a lost top day is reported too."""
+        first = make_snapshot()
+        assert first.changed(EMPTY_SNAPSHOT) >= {"energiledd", "maks_forbruk_3", "forrige_maaned_toppforbruk"}
+        assert "maks_forbruk_3" in make_snapshot(top_3_days={"2026-01-14": 7.0}).changed(first)
+
+
+def make_curve(day: datetime) -> SimpleNamespace:
+    """A day of quarter-hour prices."""
+    start = [day + timedelta(minutes=15 * i) for i in range(96)]
+    return SimpleNamespace(
+        start=start,
+        end=[interval + timedelta(minutes=15) for interval in start],
+        total_price_inkl_avgifter=[1.5 + i / 100 for i in range(96)],
+    )
+
+
+def unrecorded_attributes() -> dict[str, frozenset[str]]:
+    """Each sensor type's _unrecorded_attributes, from the entities async_setup_entry adds."""
+    entities: list[Any] = []
+    entry = SimpleNamespace(entry_id="test", runtime_data=SimpleNamespace(tso={"name": "BKK"}))
+    asyncio.run(async_setup_entry(None, entry, entities.extend))
+    return {entity._sensor_type: entity._unrecorded_attributes for entity in entities}
+
+
+def recorded_bytes(snapshot, unrecorded: dict[str, frozenset[str]] | None = None) -> int:
+    """Serialized attribute bytes the recorder would store for every sensor in one refresh."""
+    total = 0
+    for sensor_type in sorted(snapshot._attributes):
+        exclude = unrecorded.get(sensor_type, frozenset()) if unrecorded else frozenset()
+        attributes = {k: v for k, v in snapshot.attributes(sensor_type).items() if k not in exclude}
+        total += len(json.dumps(attributes, ensure_ascii=False).encode())
+    return total
+
+
+class TestRecorderAttributes:
+    """Static attributes are kept out of the recorder."""
+
+    def test_unrecorded_are_static(self):
+        """Each sensor's unrecorded attributes are its own and do not change when consumption and prices do."""
+        ledger = CostLedger()
+        ledger.book(12.0, IntervalRates(False, 0.2329, 0.0891, 0.0125, 0.4, 0.0))
+        first = make_snapshot()
+        later = make_snapshot(
+            spot_price=0.4,
+            stromstotte=0.0,
+            spotpris_etter_stotte=0.4,
+            total_price=1.2,
+            total_price_inkl_avgifter=1.2,
+            kroner_spart_per_kwh=-0.1,
+            is_day_rate=False,
+            energiledd=0.2329,
+            current_power_kw=9.5,
+            current_interval_kwh=2.2,
+            current_interval_projection_kw=8.8,
+            avg_top_3_kw=8.0,
+            top_3_days={"2026-01-20": 9.5, "2026-01-14": 7.0, "2026-01-05": 6.5},
+            monthly_consumption_dag_kwh=220.0,
+            monthly_costs=ledger.summary(600),
+        )
+
+        for sensor_type, unrecorded in unrecorded_attributes().items():
+            before, after = first.attributes(sensor_type) or {}, later.attributes(sensor_type) or {}
+            assert unrecorded <= before.keys(), sensor_type
+            for name in unrecorded:
+                assert before[name] == after[name], f"{sensor_type}.{name}"
+        # Det som følger forbruket registreres fortsatt
+        assert later.attributes("kapasitetstrinn")["current_power_kw"] == 9.5
+
+    def test_recorded_bytes_per_refresh(self):
+        """With both price curves, the recorder stores a fraction of the attribute bytes."""
+        day = datetime(2026, 1, 14)
+        curves = {"today": make_curve(day), "tomorrow": make_curve(day + timedelta(days=1))}
+        snapshot = make_snapshot(price_curve=curves)
+
+        everything = recorded_bytes(snapshot)
+        recorded = recorded_bytes(snapshot, unrecorded_attributes())
+        assert everything > 15_000
+        assert recorded < 4_000
+        assert recorded < everything / 5
@@ -0,0 +1,153 @@
+"""Test the persistent storage schema.
+
+Tests:
+- Round trip encode/decode (60 and 15 minute intervals)
+- Data without cost totals (written by earlier versions)
+- Previous month top days stored as negative day offsets
+- Migration from the v1 dict format
+- v2 payload is smaller than v1
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+
+import pytest
+
+from custom_components.stromkalkulator.accumulator import MAX_DAYS_IN_MONTH
+from custom_components.stromkalkulator.storage import StoredState, decode, encode, migrate_v1_to_v2
+
+
+def make_state(settlement_minutes: int = 60) -> StoredState:
+    """State for January 2026 with some data."""
+    slots = MAX_DAYS_IN_MONTH * 1440 // settlement_minutes
+    interval_kwh = [0.0] * slots
+    interval_kwh[0] = 1.25
+    interval_kwh[slots // 2] = 3.5
+    return {
+        "month_start": date(2026, 1, 1),
+        "settlement_minutes": settlement_minutes,
+        "interval_kwh": interval_kwh,
+        "daily_max_power": {"2026-01-01": 1.25, "2026-01-16": 3.5, "2026-01-31": 2.0},
+        "monthly_consumption": {"dag": 120.5, "natt": 80.25},
+        "current_interval": datetime(2026, 1, 16, 17, 45 if settlement_minutes == 15 else 0),
+        "last_sample": datetime(2026, 1, 16, 17, 52, 13),
+        "meter_reading": 48213.52,
+        "uncovered_seconds": [0.0] * (MAX_DAYS_IN_MONTH * 24 - 1) + [900.0],
+        "costs": {"energiledd_dag_kr": 55.58, "spot_kr": 201.125, "stromstotte_kr": 84.3125, "stromstotte_kwh": 1250.5},
+        "previous_month_consumption": {"dag": 400.0, "natt": 300.0},
+        "previous_month_top_3": {"2025-12-24": 7.1, "2025-12-01": 6.0, "2025-12-31": 5.5},
+        "previous_month_name": "desember 2025",
+        "previous_month_costs": {"energiledd_dag_kr": 184.52, "stromstotte_kr": 412.5},
+    }
+
+
+class TestRoundTrip:
+    """Encode then decode gives the same state."""
+
+    @pytest.mark.parametrize("settlement_minutes", [60, 15])
+    def test_round_trip(self, settlement_minutes):
+        """All fields survive a round trip."""
+        state = make_state(settlement_minutes)
+        decoded = decode(json.loads(json.dumps(encode(state))))
+
+        assert decoded["month_start"] == state["month_start"]
+        assert decoded["settlement_minutes"] == settlement_minutes
+        assert decoded["interval_kwh"] == pytest.approx(state["interval_kwh"])
+        assert decoded["daily_max_power"] == state["daily_max_power"]
+        assert decoded["monthly_consumption"] == state["monthly_consumption"]
+        assert decoded["current_interval"] == state["current_interval"]
+        assert decoded["last_sample"] == state["last_sample"]
+        assert decoded["meter_reading"] == state["meter_reading"]
+        assert decoded["uncovered_seconds"] == pytest.approx(state["uncovered_seconds"])
+        assert decoded["previous_month_consumption"] == state["previous_month_consumption"]
+        assert decoded["previous_month_top_3"] == state["previous_month_top_3"]
+        assert decoded["previous_month_name"] == "desember 2025"
+        assert decoded["costs"] == state["costs"]
+        assert decoded["previous_month_costs"] == state["previous_month_costs"]
+
+    def test_without_costs(self):
+        """v2 data written before cost totals were stored decodes to None (rebuilt on load)."""
+        encoded = encode(make_state())
+        del encoded["costs"]
+        del encoded["previous_month"]["costs"]
+        decoded = decode(encoded)
+        assert decoded["costs"] is None
+        assert decoded["previous_month_costs"] is None
+
+    def test_previous_month_negative_offsets(self):
+        """Previous month days are stored relative to the current month start."""
+        encoded = encode(make_state())
+        assert [offset for offset, _ in encoded["previous_month"]["top_days"]] == [-8, -31, -1]
+
+    def test_no_open_interval(self):
+        """Missing open interval is stored as None."""
+        state = make_state()
+        state["current_interval"] = None
+        state["last_sample"] = None
+        assert decode(encode(state))["current_interval"] is None
+        assert decode(encode(state))["last_sample"] is None
+
+
+class TestMigrationV1:
+    """Migration from the v1 dict format."""
+
+    def v1_data(self) -> dict:
+        """v1 payload with string date keys."""
+        return {
+            "daily_max_power": {"2026-01-05": 4.2, "2026-01-06": 5.1},
+            "monthly_consumption": {"dag": 10.0, "natt": 5.0},
+            "current_month": 1,
+            "previous_month_consumption": {"dag": 400.0, "natt": 300.0},
+            "previous_month_top_3": {"2025-12-24": 7.1},
+            "previous_month_name": "desember 2025",
+        }
+
+    def test_migrate(self):
+        """v1 fields map to the same decoded state."""
+        decoded = decode(migrate_v1_to_v2(self.v1_data(), date(2026, 1, 20)))
+
+        assert decoded["month_start"] == date(2026, 1, 1)
+        assert decoded["daily_max_power"] == {"2026-01-05": 4.2, "2026-01-06": 5.1}
+        assert decoded["monthly_consumption"] == {"dag": 10.0, "natt": 5.0}
+        assert decoded["previous_month_top_3"] == {"2025-12-24": 7.1}
+        assert decoded["previous_month_name"] == "desember 2025"
+        assert decoded["current_interval"] is None
+        assert len(decoded["interval_kwh"]) == MAX_DAYS_IN_MONTH * 24
+
+    def test_year_from_dates(self):
+        """Year comes from stored dates, not from today."""
+        decoded = decode(migrate_v1_to_v2(self.v1_data(), date(2027, 3, 1)))
+        assert decoded["month_start"] == date(2026, 1, 1)
+
+    def test_year_without_dates(self):
+        """Without dates the month is assumed to be the most recent one."""
+        data = {"current_month": 12, "daily_max_power": {}}
+        decoded = decode(migrate_v1_to_v2(data, date(2026, 1, 2)))
+        assert decoded["month_start"] == date(2025, 12, 1)
+
+    def test_intervals_and_open_interval(self):
+        """Interval energy and open interval from the unreleased v1 fields are kept."""
+        data = self.v1_data()
+        data["settlement_minutes"] = 15
+        data["interval_kwh"] = [0.5] * 10
+        data["current_interval"] = "2026-01-06T17:15:00"
+        decoded = decode(migrate_v1_to_v2(data, date(2026, 1, 20)))
+
+        assert decoded["settlement_minutes"] == 15
+        assert decoded["interval_kwh"][:10] == pytest.approx([0.5] * 10)
+        assert len(decoded["interval_kwh"]) == MAX_DAYS_IN_MONTH * 96
+        assert decoded["current_interval"] == datetime(2026, 1, 6, 17, 15)
+
+    def test_v2_smaller_than_v1(self):
+        """Packed intervals and day offsets shrink the payload."""
+        state = make_state(15)
+        v1 = {
+            "daily_max_power": state["daily_max_power"],
+            "monthly_consumption": state["monthly_consumption"],
+            "interval_kwh": [round(kwh, 6) for kwh in [0.123456] * len(state["interval_kwh"])],
+            "current_month": 1,
+        }
+        v2 = migrate_v1_to_v2(v1, date(2026, 1, 20))
+        assert len(json.dumps(v2)) < len(json.dumps(v1)) * 0.7
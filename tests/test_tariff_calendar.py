@@ -0,0 +1,138 @@
+"""Test the precompiled dag/natt tariff calendar.
+
+Tests:
+- Same answer as the strftime/list lookup for every hour of a year
+- Weekends and holidays are natt all day (also after the hard-coded years)
+- Per-TSO schedules (Tensio dag 06-21, weekend and seasonal periods)
+- Every TSO schedule compiles
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from custom_components.stromkalkulator.const import HELLIGDAGER_BEVEGELIGE, HELLIGDAGER_FASTE
+from custom_components.stromkalkulator.tariff_calendar import TariffCalendar, compile_tidsplan
+from custom_components.stromkalkulator.tso import TSO_LIST
+
+
+def reference_is_day_rate(dt: datetime) -> bool:
+    """The lookup the calendar replaces."""
+    is_fixed_holiday = dt.strftime("%m-%d") in HELLIGDAGER_FASTE
+    is_moving_holiday = dt.strftime("%Y-%m-%d") in HELLIGDAGER_BEVEGELIGE
+    is_weekend = dt.weekday() >= 5
+    is_night = dt.hour < 6 or dt.hour >= 22
+    return not (is_fixed_holiday or is_moving_holiday or is_weekend or is_night)
+
+
+class TestTariffCalendar:
+    """Dag/natt lookup with the default schedule."""
+
+    @pytest.mark.parametrize("year", [2026, 2027])
+    def test_matches_reference_every_hour(self, year):
+        """Every hour of the years in the hard-coded list gives the same result."""
+        calendar = TariffCalendar()
+        hour = datetime(year, 1, 1)
+        while hour.year == year:
+            assert calendar.is_day(hour) == reference_is_day_rate(hour), hour
+            hour += timedelta(hours=1)
+
+    def test_leap_year(self):
+        """Hours after 29. februar land on the right day."""
+        calendar = TariffCalendar()
+        assert calendar.is_day(datetime(2028, 2, 29, 12))
+        assert calendar.is_day(datetime(2028, 12, 29, 12))
+        assert not calendar.is_day(datetime(2028, 12, 30, 12))
+
+    def test_weekday(self):
+        """Weekday 06-22 is dag, minutes inside the hour follow the hour."""
+        calendar = TariffCalendar()
+        assert not calendar.is_day(datetime(2026, 1, 14, 5, 59))
+        assert calendar.is_day(datetime(2026, 1, 14, 6, 0))
+        assert calendar.is_day(datetime(2026, 1, 14, 21, 45))
+        assert not calendar.is_day(datetime(2026, 1, 14, 22, 0))
+
+    def test_weekend_and_holidays(self):
+        """Saturday, 17. mai and Langfredag are natt all day."""
+        calendar = TariffCalendar()
+        assert not calendar.is_day(datetime(2026, 1, 17, 12))
+        assert not calendar.is_day(datetime(2026, 5, 17, 12))
+        assert not calendar.is_day(datetime(2026, 4, 3, 12))
+        assert not calendar.is_day(datetime(2028, 4, 13, 12))  # Skjærtorsdag
+
+    def test_day_mask(self):
+        """The mask for a day agrees with is_day for each hour."""
+        calendar = TariffCalendar()
+        for day in (date(2026, 1, 14), date(2026, 5, 17)):
+            mask = calendar.day_mask(day)
+            assert len(mask) == 24
+            expected = [calendar.is_day(datetime(day.year, day.month, day.day, hour)) for hour in range(24)]
+            assert [bool(value) for value in mask] == expected
+
+    def test_describe_default(self):
+        """Default schedule is described like before."""
+        assert TariffCalendar().describe() == (
+            "Hverdager 06:00-22:00 (ikke helligdager)",
+            "22:00-06:00, helger og helligdager",
+        )
+
+
+class TestTidsplan:
+    """Per-TSO schedules."""
+
+    def test_tensio(self):
+        """Tensio ends the day at 21."""
+        calendar = TariffCalendar(TSO_LIST["tensio_tn"]["tidsplan"])
+        assert calendar.is_day(datetime(2026, 1, 14, 20, 59))
+        assert not calendar.is_day(datetime(2026, 1, 14, 21, 0))
+
+    def test_weekend_period_and_holidays(self):
+        """A second period can give dag on Saturdays, and a period can include holidays."""
+        calendar = TariffCalendar(
+            [
+                {"timer": (6, 22)},
+                {"timer": (8, 16), "ukedager": [5], "helligdager": True},
+            ]
+        )
+        assert calendar.is_day(datetime(2026, 1, 17, 8))  # Lørdag
+        assert not calendar.is_day(datetime(2026, 1, 17, 16))
+        assert not calendar.is_day(datetime(2026, 1, 18, 12))  # Søndag
+        assert not calendar.is_day(datetime(2026, 5, 1, 12))  # Fredag, helligdag
+        assert calendar.is_day(datetime(2026, 12, 26, 12))  # Lørdag, helligdag
+
+    def test_seasonal(self):
+        """Winter-only day tariff is natt all summer."""
+        calendar = TariffCalendar([{"timer": (6, 22), "maaneder": [11, 12, 1, 2, 3]}])
+        assert calendar.is_day(datetime(2026, 1, 14, 12))
+        assert not calendar.is_day(datetime(2026, 6, 10, 12))
+        assert calendar.describe() == (
+            "Hverdager 06:00-22:00 i jan, feb, mar, nov, des (ikke helligdager)",
+            "Resten av tiden",
+        )
+
+    def test_empty_schedule(self):
+        """No periods means natt all the time."""
+        calendar = TariffCalendar([])
+        assert not calendar.is_day(datetime(2026, 1, 14, 12))
+        assert calendar.describe() == ("Ingen", "Hele døgnet")
+
+    @pytest.mark.parametrize(
+        "periode",
+        [
+            {"timer": (22, 6)},
+            {"timer": (6, 25)},
+            {"timer": (6, 22), "ukedager": [7]},
+            {"timer": (6, 22), "maaneder": [0]},
+        ],
+    )
+    def test_invalid(self, periode):
+        """Invalid windows, weekdays and months are rejected."""
+        with pytest.raises(ValueError):
+            compile_tidsplan([periode])
+
+    @pytest.mark.parametrize("tso_id", [tso_id for tso_id, tso in TSO_LIST.items() if "tidsplan" in tso])
+    def test_all_tso_schedules_compile(self, tso_id):
+        """Every schedule in the TSO table is valid."""
+        assert compile_tidsplan(TSO_LIST[tso_id]["tidsplan"])
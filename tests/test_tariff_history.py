@@ -0,0 +1,115 @@
+"""Test effective-dated rates.
+
+Tests:
+- Value in effect before, inside, between and after periods
+- Adjacent periods, timestamps, empty and overlapping periods
+- Strømstøtte threshold, forbruksavgift and Enova per year
+- Energiledd from a TSO's historikk, configured prices as current
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+
+from custom_components.stromkalkulator.const import (
+    AVGIFTSSONE_NORD_NORGE,
+    AVGIFTSSONE_STANDARD,
+    AVGIFTSSONE_TILTAKSSONE,
+    ENOVA_AVGIFT,
+    FORBRUKSAVGIFT_ALMINNELIG,
+    STROMSTOTTE_LEVEL,
+)
+from custom_components.stromkalkulator.tariff_history import (
+    ENOVA_AVGIFT_HISTORY,
+    STROMSTOTTE_LEVEL_HISTORY,
+    RateHistory,
+    energiledd_history,
+    forbruksavgift_at,
+)
+from custom_components.stromkalkulator.tso import get_tso
+
+
+class TestRateHistory:
+    """Lookup by date."""
+
+    def test_periods(self):
+        """A period overrides the current value from fra up to, not including, til."""
+        history = RateHistory(
+            1.0,
+            [(date(2025, 4, 1), date(2025, 7, 1), 0.5), (date(2025, 9, 1), date(2026, 1, 1), 0.7)],
+        )
+
+        assert history.at(date(2025, 3, 31)) == 1.0
+        assert history.at(date(2025, 4, 1)) == 0.5
+        assert history.at(date(2025, 6, 30)) == 0.5
+        assert history.at(date(2025, 7, 1)) == 1.0
+        assert history.at(date(2025, 12, 31)) == 0.7
+        assert history.at(date(2026, 1, 1)) == 1.0
+
+    def test_adjacent_and_timestamps(self):
+        """Back-to-back periods in any order, a timestamp uses its date."""
+        history = RateHistory(
+            1.0,
+            [(date(2025, 4, 1), date(2026, 1, 1), 0.2), (date(2025, 1, 1), date(2025, 4, 1), 0.3)],
+        )
+
+        assert history.at(datetime(2025, 3, 31, 23, 45)) == 0.3
+        assert history.at(datetime(2025, 4, 1, 0, 0)) == 0.2
+        assert history.at(datetime(2026, 1, 1, 0, 0)) == 1.0
+
+    def test_no_periods(self):
+        """Without periods the current value applies everywhere."""
+        assert RateHistory(0.01).at(date(2020, 1, 1)) == 0.01
+
+    @pytest.mark.parametrize(
+        "periods",
+        [
+            [(date(2025, 1, 1), date(2025, 1, 1), 0.5)],
+            [(date(2025, 1, 1), date(2025, 6, 1), 0.5), (date(2025, 5, 1), date(2026, 1, 1), 0.6)],
+        ],
+    )
+    def test_invalid(self, periods):
+        """Empty and overlapping periods are rejected."""
+        with pytest.raises(ValueError, match="periode"):
+            RateHistory(1.0, periods)
+
+
+class TestPublicRates:
+    """Strømstøtte and avgifter per year."""
+
+    def test_stromstotte_level(self):
+        """The threshold follows the year (inkl. mva)."""
+        assert STROMSTOTTE_LEVEL_HISTORY.at(date(2024, 6, 1)) == 0.9125
+        assert STROMSTOTTE_LEVEL_HISTORY.at(date(2025, 12, 31)) == 0.9375
+        assert STROMSTOTTE_LEVEL_HISTORY.at(date(2026, 1, 1)) == STROMSTOTTE_LEVEL
+
+    def test_forbruksavgift(self):
+        """Seasonal rates in 2025, flat from 2026, zero in tiltakssonen."""
+        assert forbruksavgift_at(AVGIFTSSONE_STANDARD, date(2025, 2, 1)) == 0.1566
+        assert forbruksavgift_at(AVGIFTSSONE_NORD_NORGE, date(2025, 10, 1)) == 0.1253
+        assert forbruksavgift_at(AVGIFTSSONE_STANDARD, date(2026, 2, 1)) == FORBRUKSAVGIFT_ALMINNELIG
+        assert forbruksavgift_at(AVGIFTSSONE_TILTAKSSONE, date(2025, 10, 1)) == 0.0
+
+    def test_enova(self):
+        """Enova-avgift is unchanged."""
+        assert ENOVA_AVGIFT_HISTORY.at(date(2025, 10, 1)) == ENOVA_AVGIFT
+
+
+class TestEnergileddHistory:
+    """A TSO's earlier energiledd."""
+
+    def test_bkk(self):
+        """BKK's 2025 prices before 2026, the configured prices after."""
+        history = energiledd_history(get_tso("bkk"), 0.47, 0.24)
+
+        assert history.at(date(2025, 12, 1), True) == 0.52876
+        assert history.at(date(2025, 12, 1), False) == 0.40651
+        assert history.at(date(2026, 1, 1), True) == 0.47
+        assert history.at(date(2026, 1, 1), False) == 0.24
+
+    def test_without_historikk(self):
+        """A TSO without historikk has today's prices for every date."""
+        history = energiledd_history(get_tso("elvia"), 0.364, 0.264)
+        assert history.at(date(2024, 1, 1), True) == 0.364
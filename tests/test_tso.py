@@ -0,0 +1,159 @@
+"""Test the TSO catalogue in tso.json.
+
+Tests:
+- Every entry matches the TSOEntry contract
+- JSON form converted to tuples, float("inf") and dates
+- Invalid entries rejected with the TSO and field named
+- One TSO or the names are read without validating the rest
+- One TSO is read without parsing the rest, and is the caller's own copy
+- Unknown id falls back to the default
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from typing import Any
+
+import pytest
+
+from custom_components.stromkalkulator import tso
+from custom_components.stromkalkulator.tso import (
+    TSO_FILE,
+    TSOEntry,
+    get_tso,
+    load_tso_list,
+    tso_names,
+    validate_tso,
+)
+
+# Gyldig historikk-periode slik den skrives i tso.json
+PERIODE = {"fra": "2025-01-01", "til": "2026-01-01", "energiledd_dag": 0.5, "energiledd_natt": 0.4}
+
+
+def raw_entry(**overrides: Any) -> dict[str, Any]:
+    """A valid catalogue entry as it is written in tso.json."""
+    entry: dict[str, Any] = {
+        "name": "Eksempel Nett",
+        "prisomrade": "NO1",
+        "supported": True,
+        "energiledd_dag": 0.4613,
+        "energiledd_natt": 0.2329,
+        "url": "https://www.eksempelnett.no",
+        "kapasitetstrinn": [[2, 150], [5, 250], [None, 400]],
+    }
+    entry.update(overrides)
+    return entry
+
+
+@pytest.fixture
+def clear_caches():
+    """Empty the loader caches before and after the test."""
+    for loader in (tso_names, load_tso_list):
+        loader.cache_clear()
+    yield
+    for loader in (tso_names, load_tso_list):
+        loader.cache_clear()
+
+
+class TestCatalogue:
+    """The packaged catalogue."""
+
+    def test_fields_cover_contract(self):
+        """The field types checked are exactly the TSOEntry keys."""
+        assert tso._FIELD_TYPES.keys() == TSOEntry.__required_keys__ | TSOEntry.__optional_keys__
+
+    def test_every_entry_valid(self):
+        """Every entry in tso.json passes validation."""
+        catalogue = json.loads(TSO_FILE.read_text(encoding="utf-8"))
+        assert len(catalogue) > 60
+        for tso_id, raw in catalogue.items():
+            validate_tso(tso_id, raw)
+
+    def test_python_form(self):
+        """Tiers and tidsplan hours are tuples, the top tier has no limit."""
+        bkk = get_tso("bkk")
+        assert bkk["kapasitetstrinn"][0] == (2, 155)
+        assert bkk["kapasitetstrinn"][-1] == (float("inf"), 6900)
+        assert get_tso("tensio_tn")["tidsplan"] == [{"timer": (6, 21)}]
+        assert get_tso("barents_nett")["kapasitetstrinn"][0] == {"min": 0, "max": 2, "pris": 517}
+        assert bkk["historikk"][-1]["til"] == date(2026, 1, 1)
+
+    def test_tso_list(self):
+        """TSO_LIST is still available, loaded on first use."""
+        assert tso.TSO_LIST["bkk"] == get_tso("bkk")
+        assert list(tso.TSO_LIST) == list(load_tso_list())
+
+
+class TestValidate:
+    """Invalid entries are rejected."""
+
+    @pytest.mark.parametrize(
+        ("overrides", "message"),
+        [
+            ({"name": None}, "name har feil type"),
+            ({"supported": "ja"}, "supported har feil type"),
+            ({"energiledd_dag": True}, "energiledd_dag har feil type"),
+            ({"prisomrade": "NO6"}, "ukjent prisområde NO6"),
+            ({"kapasitetstrinn": [[2]]}, "ugyldig kapasitetstrinn"),
+            ({"kapasitetstrinn": [[2, 150.5]]}, "ugyldig kapasitetstrinn"),
+            ({"kapasitetstrinn": [{"min": 0, "pris": 100}]}, "ugyldig kapasitetstrinn"),
+            ({"tidsplan": [{"timer": [6]}]}, "ugyldig tidsplan"),
+            ({"tidsplan": [{"timer": [6, 22], "dager": [0]}]}, "ukjente felt i tidsplan"),
+            ({"energiledd": 0.4}, "ukjente felt ['energiledd']"),
+            ({"historikk": [{"fra": "2025-01-01", "til": "2026-01-01"}]}, "ugyldig historikk"),
+            ({"historikk": [{**PERIODE, "fra": "1. jan 2025"}]}, "ugyldig dato i historikk"),
+            ({"historikk": [{**PERIODE, "til": "2024-01-01"}]}, "ugyldig historikk"),
+        ],
+    )
+    def test_invalid(self, overrides, message):
+        """The error names the TSO and what is wrong."""
+        with pytest.raises(ValueError, match=r"^eksempel: ") as error:
+            validate_tso("eksempel", raw_entry(**overrides))
+        assert message in str(error.value)
+
+    def test_missing(self):
+        """Required fields must be present."""
+        raw = raw_entry()
+        del raw["url"]
+        with pytest.raises(ValueError, match=r"mangler \['url'\]"):
+            validate_tso("eksempel", raw)
+
+
+class TestLazyLoading:
+    """Only what is asked for is validated."""
+
+    def test_one_tso(self, clear_caches, monkeypatch):
+        """Setup validates the selected TSO only, an unknown id gets the default."""
+        validated: list[str] = []
+        validate = tso.validate_tso
+        monkeypatch.setattr(tso, "validate_tso", lambda tso_id, raw: validated.append(tso_id) or validate(tso_id, raw))
+
+        assert get_tso("elvia")["name"] == "Elvia"
+        assert get_tso("nedlagt_nett", "bkk")["name"] == "BKK Nett"
+        assert validated == ["elvia", "bkk"]
+        with pytest.raises(KeyError):
+            get_tso("nedlagt_nett")
+
+    def test_one_entry_parsed(self, monkeypatch):
+        """One TSO is read without parsing the catalogue, and finds every id in it."""
+        monkeypatch.setattr(tso, "_read_catalogue", lambda: pytest.fail("parsed the catalogue"))
+        catalogue = json.loads(TSO_FILE.read_text(encoding="utf-8"))
+        for tso_id, raw in catalogue.items():
+            assert tso._read_entry(tso_id) == raw
+            assert get_tso(tso_id) == validate_tso(tso_id, raw)
+
+    def test_own_entry(self):
+        """Every caller gets its own entry, changing one does not change the next."""
+        bkk = get_tso("bkk")
+        bkk["kapasitetstrinn"].clear()
+        bkk["name"] = "Endret"
+        assert get_tso("bkk")["name"] == "BKK Nett"
+        assert get_tso("bkk")["kapasitetstrinn"][0] == (2, 155)
+
+    def test_names(self, clear_caches, monkeypatch):
+        """The config flow dropdown gets the names without validating any entry."""
+        monkeypatch.setattr(tso, "validate_tso", lambda tso_id, raw: pytest.fail(f"validated {tso_id}"))
+        names = tso_names()
+        assert names["bkk"] == "BKK Nett"
+        assert "custom" in names
@@ -4,6 +4,8 @@
 # Home Assistant requires these entry points
 async_setup_entry
 async_unload_entry
+async_setup
+CONFIG_SCHEMA
 async_setup_entry
 
 # Home Assistant requires these methods in sensors
@@ -28,5 +30,8 @@ _attr_suggested_display_precision
 _attr_entity_category
 _device_group
 
+# Store migration signature required by Home Assistant
+old_minor_version
+
 # Used in Home Assistant
 PLATFORMS